@@ -16,9 +16,16 @@ class Settings(Enum):
     CUSTOM_FLAG_LAST_ID = auto() #running ID generator
 
     DENSITY_ARV_WINDOW_MS = "density_arv_window_ms"
+    DENSITY_AMPLITUDE_METRIC = "density_amplitude_metric"
     DENSITY_SCALE_MAX_MV = "density_scale_max_mv"
     DENSITY_PLAYBACK_FPS = "density_playback_fps"
     DENSITY_DEFAULT_SPEED = "density_default_speed"
     CUSTOM_ELECTRODE_LAYOUTS = "custom_electrode_layouts"
 
+    DECODED_CACHE_ENABLED = "decoded_cache_enabled"
+    DECODED_CACHE_MAX_MB = "decoded_cache_max_mb"
+    WORKING_PRECISION = "working_precision"
+    SELECTION_FORMAT = "selection_format"
+    RECORDING_BROWSER_FOLDER = "recording_browser_folder"
+
 
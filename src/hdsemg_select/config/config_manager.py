@@ -1,14 +1,24 @@
+import atexit
 import json
 import os
 import enum
+import threading
 from threading import Lock
 from hdsemg_select._log.log_config import logger
 from hdsemg_select.config.config_enums import Settings
 from hdsemg_select.ui.labels.base_labels import BaseChannelLabel
 
 CONFIG_FILE = "config/config.json"
+FLUSH_DELAY_S = 0.5  # changes within this time are written together
 
 class ConfigManager:
+    """Application settings, read from memory and written to CONFIG_FILE behind the caller's back.
+
+    set() only updates the in-memory settings and schedules a write; a burst
+    of changes (e.g. all tabs of the settings dialog) ends up as one atomic
+    write once no further change arrives for FLUSH_DELAY_S. flush() writes
+    pending changes immediately and runs at interpreter exit.
+    """
     _instance = None
     _lock = Lock()
 
@@ -18,7 +28,13 @@ class ConfigManager:
             if cls._instance is None:
                 cls._instance = super(ConfigManager, cls).__new__(cls)
                 cls._instance.settings = {}
+                cls._instance._state_lock = threading.RLock()
+                cls._instance._write_lock = Lock()  # keeps writes in snapshot order
+                cls._instance._flush_timer = None
+                cls._instance._dirty = False
+                cls._instance._labels = None  # sorted available channel labels
                 cls._instance.load_config()
+                atexit.register(cls._instance.flush)
         return cls._instance
 
     def load_config(self):
@@ -33,20 +49,53 @@ class ConfigManager:
         else:
             logger.error("Config file does not exist yet.")
             self.settings = {}
+        self._labels = None
 
     def save_config(self):
-        """Save configuration to JSON file."""
-        os.makedirs(os.path.dirname(CONFIG_FILE), exist_ok=True)
+        """Save configuration to JSON file now."""
+        with self._state_lock:
+            self._dirty = True
+        self.flush()
+
+    def flush(self):
+        """Write pending changes to the config file (atomically) and cancel the scheduled write."""
+        with self._write_lock:
+            with self._state_lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                if not self._dirty:
+                    return
+                content = json.dumps(self.settings, indent=4)
+                self._dirty = False
 
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(self.settings, f, indent=4)
+            try:
+                directory = os.path.dirname(CONFIG_FILE)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                tmp = f"{CONFIG_FILE}.{os.getpid()}.tmp"
+                with open(tmp, "w") as f:
+                    f.write(content)
+                os.replace(tmp, CONFIG_FILE)
+            except OSError as e:
+                logger.error(f"Failed to write config file: {e}")
+                with self._state_lock:
+                    self._dirty = True
 
     def set(self, key, value):
-        """Set a configuration value and save it."""
+        """Set a configuration value; it is written to the config file shortly after."""
         if isinstance(key, enum.Enum):
             key = key.name  # Store enum as a string
-        self.settings[key] = value
-        self.save_config()
+        with self._state_lock:
+            self.settings[key] = value
+            if key == Settings.CUSTOM_FLAGS.name:
+                self._labels = None
+            self._dirty = True
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(FLUSH_DELAY_S, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
 
     def get(self, key, default=None):
         """Get a configuration value."""
@@ -54,11 +103,16 @@ class ConfigManager:
         return self.settings.get(key, default)
 
     def get_available_channel_labels(self):
-        """Get available channel labels from the configuration."""
-        base_labels = BaseChannelLabel.all_labels()
-        custom_flags = self.get(Settings.CUSTOM_FLAGS, [])
-        all_flags = base_labels + custom_flags
-        return sorted(all_flags, key=lambda x: x["name"])
+        """Get available channel labels from the configuration, sorted by name.
+
+        The sorted list is kept until the custom flags change; callers get a copy.
+        """
+        labels = self._labels
+        if labels is None:
+            base_labels = BaseChannelLabel.all_labels()
+            custom_flags = self.get(Settings.CUSTOM_FLAGS, [])
+            labels = self._labels = sorted(base_labels + custom_flags, key=lambda x: x["name"])
+        return list(labels)
 
 # Singleton instance
 config = ConfigManager()
@@ -0,0 +1,272 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from typing import Optional
+
+import numpy as np
+from hdsemg_shared.fileio.file_io import EMGFile
+
+from hdsemg_select._log.log_config import logger
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".hdsemg_cache", "decoded")
+DEFAULT_MAX_MB = 2048
+_FORMAT_VERSION = 1
+_META = "meta.json"
+_DATA = "data.npy"
+_TIME = "time.npy"
+_SCALED = "scaled.npy"
+_COLUMNS_PER_CHUNK = 16
+
+
+def description_text(entry) -> str:
+    """Text of one description entry, however the loader nested it."""
+    while isinstance(entry, np.ndarray):
+        if entry.size != 1:
+            return str(entry)
+        entry = entry.item()
+    if isinstance(entry, bytes):
+        try:
+            return entry.decode("utf-8")
+        except UnicodeDecodeError:
+            return entry.decode("latin1")
+    return str(entry)
+
+
+def description_array(texts: list) -> np.ndarray:
+    """Description array for *texts*, in the (n_channels, 1) layout of 1-element string arrays the loaders produce."""
+    description = np.empty((len(texts), 1), dtype=object)
+    for i, text in enumerate(texts):
+        description[i, 0] = np.array([text], dtype=f"<U{max(1, len(text))}")
+    return description
+
+
+class DecodedFileCache:
+    """Local cache of decoded recordings, memory-mapped on re-open.
+
+    Each entry is a directory holding the data matrix and time vector as
+    ``.npy`` files plus a ``meta.json`` with descriptions, sampling rate and
+    unit. Entries are keyed on the source file's absolute path, size and
+    modification time, so an edited file is decoded again. The data is
+    opened copy-on-write, so callers may modify it without touching the
+    cache. Once the entries exceed *max_bytes*, least recently opened ones
+    are removed.
+
+    An entry can also hold the scaled data and its amplitude statistics
+    (see :meth:`store_scaled`). Both matrices are column-major, so a
+    channel is one contiguous run of the file and only the channels that
+    are actually read are paged in.
+    """
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(file_path: str) -> str:
+        stat = os.stat(file_path)
+        source = f"{os.path.abspath(file_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+        return hashlib.sha1(source.encode("utf-8")).hexdigest()
+
+    def _entry_dir(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def load(self, file_path: str) -> Optional[EMGFile]:
+        """The cached recording of *file_path*, or None if it is not cached (or unreadable)."""
+        try:
+            entry = self._entry_dir(self.key(file_path))
+            meta_path = os.path.join(entry, _META)
+            if not os.path.isfile(meta_path):
+                return None
+            with open(meta_path, "r") as f:
+                meta = json.load(f)
+            if meta.get("version") != _FORMAT_VERSION:
+                return None
+            data = np.load(os.path.join(entry, _DATA), mmap_mode="c")
+            time_data = np.load(os.path.join(entry, _TIME))
+            emg = EMGFile(data, time_data, description_array(meta["description"]),
+                          meta["sampling_frequency"], meta["file_name"], meta["file_size"],
+                          meta["file_type"], meta.get("unit"))
+            meta["last_used"] = time.time()
+            self._write_meta(entry, meta)
+            logger.info(f"Opened {file_path} from the decoded-data cache")
+            return emg
+        except Exception as e:
+            logger.warning(f"Ignoring decoded-data cache entry for {file_path}: {e}")
+            return None
+
+    def metadata(self, file_path: str) -> Optional[tuple]:
+        """(meta dict, data shape) of the cache entry of *file_path*, or None; reads no channel data.
+
+        Unlike :meth:`load`, this does not count as a use of the entry.
+        """
+        try:
+            entry = self._entry_dir(self.key(file_path))
+            meta_path = os.path.join(entry, _META)
+            if not os.path.isfile(meta_path):
+                return None
+            with open(meta_path, "r") as f:
+                meta = json.load(f)
+            if meta.get("version") != _FORMAT_VERSION:
+                return None
+            shape = np.load(os.path.join(entry, _DATA), mmap_mode="r").shape
+            return meta, shape
+        except Exception as e:
+            logger.debug(f"No decoded-data cache metadata for {file_path}: {e}")
+            return None
+
+    def load_scaled(self, file_path: str, dtype=None) -> Optional[tuple]:
+        """(scaled data, upper quartile, max amplitude) cached for *file_path*, or None.
+
+        With *dtype* given, scaled data of another precision counts as a miss.
+        """
+        try:
+            entry = self._entry_dir(self.key(file_path))
+            meta_path = os.path.join(entry, _META)
+            if not os.path.isfile(meta_path):
+                return None
+            with open(meta_path, "r") as f:
+                meta = json.load(f)
+            if "upper_quartile" not in meta:
+                return None
+            scaled = np.load(os.path.join(entry, _SCALED), mmap_mode="c")
+            if dtype is not None and scaled.dtype != np.dtype(dtype):
+                return None
+            return scaled, meta["upper_quartile"], meta["max_amplitude"]
+        except Exception as e:
+            logger.warning(f"Ignoring cached scaled data for {file_path}: {e}")
+            return None
+
+    def store_scaled(self, file_path: str, data: np.ndarray, upper_quartile: float,
+                     dtype=np.float64) -> Optional[np.ndarray]:
+        """Write *data* / *upper_quartile* as *dtype* next to the cached data and return it memory-mapped.
+
+        The matrix is written a few channels at a time, so no scaled copy of
+        the whole recording is held in memory. Returns None if *file_path*
+        has no cache entry or the write fails.
+        """
+        try:
+            entry = self._entry_dir(self.key(file_path))
+            if not os.path.isfile(os.path.join(entry, _META)):
+                return None
+            tmp = os.path.join(entry, _SCALED + ".tmp")
+            factor = upper_quartile if upper_quartile != 0 else 1.0  # as scale_data
+            out = np.lib.format.open_memmap(tmp, mode="w+", dtype=dtype, shape=data.shape, fortran_order=True)
+            for start in range(0, data.shape[1], _COLUMNS_PER_CHUNK):
+                stop = start + _COLUMNS_PER_CHUNK
+                out[:, start:stop] = data[:, start:stop] / factor
+            out.flush()
+            del out
+            os.replace(tmp, os.path.join(entry, _SCALED))
+            return np.load(os.path.join(entry, _SCALED), mmap_mode="c")
+        except Exception as e:
+            logger.warning(f"Could not cache scaled data for {file_path}: {e}")
+            return None
+
+    def store_summary(self, file_path: str, upper_quartile: float, max_amplitude: Optional[float]) -> None:
+        """Record the amplitude statistics belonging to the scaled data of *file_path*.
+
+        Only entries with a summary are returned by :meth:`load_scaled`.
+        """
+        try:
+            entry = self._entry_dir(self.key(file_path))
+            if not os.path.isfile(os.path.join(entry, _SCALED)):
+                return
+            with open(os.path.join(entry, _META), "r") as f:
+                meta = json.load(f)
+            meta["upper_quartile"] = float(upper_quartile)
+            meta["max_amplitude"] = None if max_amplitude is None else float(max_amplitude)
+            self._write_meta(entry, meta)
+            with self._lock:
+                self._evict(keep=os.path.basename(entry))
+        except Exception as e:
+            logger.warning(f"Could not cache amplitude statistics for {file_path}: {e}")
+
+    def store(self, file_path: str, emg: EMGFile) -> bool:
+        """Write *emg* as the cache entry of *file_path*; failures are logged, not raised."""
+        data = np.asarray(emg.data)
+        if 2 * data.nbytes > self.max_bytes:  # raw and scaled data
+            logger.debug(f"{file_path} is larger than the decoded-data cache, not caching it")
+            return False
+        try:
+            key = self.key(file_path)
+            os.makedirs(self.directory, exist_ok=True)
+            tmp = os.path.join(self.directory, f".{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+            os.makedirs(tmp, exist_ok=True)
+            np.save(os.path.join(tmp, _DATA), np.asfortranarray(data))
+            np.save(os.path.join(tmp, _TIME), np.asarray(emg.time))
+            meta = {
+                "version": _FORMAT_VERSION,
+                "source": os.path.abspath(file_path),
+                "description": [description_text(d) for d in emg.description],
+                "sampling_frequency": float(emg.sampling_frequency),
+                "file_name": str(emg.file_name),
+                "file_size": int(emg.file_size) if emg.file_size is not None else None,
+                "file_type": emg.file_type,
+                "unit": emg.unit,
+                "last_used": time.time(),
+            }
+            self._write_meta(tmp, meta)
+            with self._lock:
+                entry = self._entry_dir(key)
+                if os.path.isdir(entry):
+                    shutil.rmtree(tmp, ignore_errors=True)  # stored concurrently
+                else:
+                    os.replace(tmp, entry)
+                self._evict(keep=key)
+            return True
+        except Exception as e:
+            logger.warning(f"Could not write decoded-data cache entry for {file_path}: {e}")
+            return False
+
+    def entries(self) -> list:
+        """(key, size in bytes, last used) of all entries, oldest first."""
+        result = []
+        if not os.path.isdir(self.directory):
+            return result
+        for key in os.listdir(self.directory):
+            entry = self._entry_dir(key)
+            meta_path = os.path.join(entry, _META)
+            if key.startswith(".") or not os.path.isfile(meta_path):
+                continue
+            try:
+                with open(meta_path, "r") as f:
+                    last_used = json.load(f).get("last_used", 0)
+            except (OSError, ValueError):
+                last_used = 0
+            size = sum(os.path.getsize(os.path.join(entry, name)) for name in os.listdir(entry))
+            result.append((key, size, last_used))
+        return sorted(result, key=lambda item: item[2])
+
+    @property
+    def nbytes(self) -> int:
+        return sum(size for _, size, _ in self.entries())
+
+    def clear(self) -> None:
+        with self._lock:
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _evict(self, keep: str = None) -> None:
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for key, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            shutil.rmtree(self._entry_dir(key), ignore_errors=True)
+            total -= size
+            logger.debug(f"Evicted decoded-data cache entry {key}")
+
+    @staticmethod
+    def _write_meta(entry: str, meta: dict) -> None:
+        tmp = os.path.join(entry, _META + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp, os.path.join(entry, _META))
+
+
+decoded_cache = DecodedFileCache()
@@ -0,0 +1,87 @@
+import numpy as np
+from PyQt5.QtCore import QObject, QThread, pyqtSignal
+
+from hdsemg_select._log.log_config import logger
+from hdsemg_select.logic.differential.bank import DifferentialKey, differential_bank
+
+
+class _DifferentialWorker(QObject):
+    finished = pyqtSignal(object)   # DifferentialKey
+    error = pyqtSignal(object, str)
+
+    def __init__(self, key: DifferentialKey, data: np.ndarray, fs: float):
+        super().__init__()
+        self._key = key
+        self._data = data
+        self._fs = fs
+
+    def run(self):
+        try:
+            differential_bank.get_or_compute(self._key, self._data, self._fs)
+            self.finished.emit(self._key)
+        except Exception as exc:
+            self.error.emit(self._key, str(exc))
+
+
+class DifferentialLoader(QObject):
+    """Fills the shared differential bank off the GUI thread.
+
+    Views call request() on a cache miss and re-render when ready is emitted
+    for the key they are currently waiting on.
+    """
+
+    ready = pyqtSignal(object)        # DifferentialKey
+    failed = pyqtSignal(object, str)  # DifferentialKey, message
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._threads: dict = {}   # DifferentialKey -> (QThread, worker)
+
+    def is_pending(self, key: DifferentialKey) -> bool:
+        return key in self._threads
+
+    def request(self, key: DifferentialKey, data: np.ndarray, fs: float) -> None:
+        if key in self._threads:
+            return
+        worker = _DifferentialWorker(key, data, fs)
+        thread = QThread(self)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.finished.connect(self._on_finished)
+        worker.error.connect(self._on_error)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+
+        self._threads[key] = (thread, worker)
+        thread.start()
+
+    def shutdown(self) -> None:
+        """Wait for running workers; called when the owning view closes."""
+        for thread, _ in list(self._threads.values()):
+            try:
+                if thread.isRunning():
+                    thread.quit()
+                    thread.wait()
+            except RuntimeError:
+                pass  # C++ object already deleted — thread finished naturally
+        self._threads.clear()
+
+    def _release(self, key: DifferentialKey) -> bool:
+        """Join the worker thread of *key*; False if the loader was shut down meanwhile."""
+        entry = self._threads.pop(key, None)
+        if entry is None:
+            return False
+        thread, _ = entry
+        thread.quit()
+        thread.wait()  # run() has returned once the worker reports, so this is immediate
+        return True
+
+    def _on_finished(self, key: DifferentialKey):
+        if self._release(key):
+            self.ready.emit(key)
+
+    def _on_error(self, key: DifferentialKey, message: str):
+        if not self._release(key):
+            return
+        logger.warning("Differential computation failed for %s: %s", key.grid_key, message)
+        self.failed.emit(key, message)
@@ -0,0 +1,213 @@
+import logging
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import numpy as np
+from PyQt5.QtCore import QObject, QThread, pyqtSignal
+from hdsemg_shared.fileio.file_io import EMGFile
+
+from hdsemg_select._log.log_config import logger
+from hdsemg_select.config.config_enums import Settings
+from hdsemg_select.config.config_manager import config
+from hdsemg_select.controller.decoded_cache import decoded_cache, DEFAULT_MAX_MB
+from hdsemg_select.logic.decimation.pyramid import pyramid_cache
+from hdsemg_select.logic.precision import working_dtype
+from hdsemg_select.select_logic.data_processing import compute_upper_quartile, scale_data
+
+
+class LoadCancelled(Exception):
+    """Raised between loading stages when the user cancelled the load."""
+
+
+@dataclass
+class LoadedFile:
+    """Everything the loader computes before the state is populated on the GUI thread."""
+    file_path: str
+    emg_file: EMGFile
+    upper_quartile: float
+    scaled_data: np.ndarray
+    max_amplitude: Optional[float]
+
+
+def load_emg_file(file_path: str,
+                  progress: Optional[Callable[[int, str], None]] = None,
+                  is_cancelled: Optional[Callable[[], bool]] = None) -> LoadedFile:
+    """Load and scale a file in stages: read → statistics → scale → grid detection → channel summaries.
+
+    *progress* is called with (percent, stage description) before each stage
+    and *is_cancelled* is polled in between; a cancelled load raises
+    LoadCancelled. Reading the file itself cannot be interrupted. Does not
+    touch global_state, so it is safe to run off the GUI thread.
+
+    With the decoded-data cache enabled, the raw and scaled data are
+    memory-mapped from the cache and the amplitude statistics come from
+    its entry, so re-opening a file reads no channel data at all; channels
+    are paged in as they are displayed.
+    """
+    def stage(percent: int, text: str):
+        if is_cancelled is not None and is_cancelled():
+            raise LoadCancelled(file_path)
+        if progress is not None:
+            progress(percent, text)
+
+    stage(0, "Reading file…")
+    emg = _read_file(file_path)
+    cached = isinstance(emg.data, np.memmap)
+    summary = decoded_cache.load_scaled(file_path, working_dtype()) if cached else None
+
+    stage(45, "Computing amplitude statistics…")
+    if summary is not None:
+        scaled, upper_quartile, max_amplitude = summary
+    else:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Original Data Min: {np.min(emg.data)}")
+            logger.debug(f"Original Data Max: {np.max(emg.data)}")
+        upper_quartile = compute_upper_quartile(emg.data)
+
+    stage(65, "Scaling data…")
+    if summary is None:
+        scaled = decoded_cache.store_scaled(file_path, emg.data, upper_quartile, working_dtype()) if cached else None
+        if scaled is None:
+            scaled = scale_data(emg.data, upper_quartile)
+
+    stage(80, "Detecting grids…")
+    emg_indices = [idx for grid in emg.grids for idx in grid.emg_indices if idx is not None]
+
+    stage(85, "Summarising channels…")
+    if summary is None:
+        # The min/max pyramids give the amplitude maximum (as State.set_scaled_data would, without
+        # its fancy-indexed copy) and are reused by the thumbnails and y-limits of the first page
+        max_amplitude = None
+        if emg_indices:
+            max_amplitude = max(float(np.max(np.abs(pyramid_cache.get(scaled[:, idx]).extent())))
+                                for idx in emg_indices)
+        if cached:
+            decoded_cache.store_summary(file_path, upper_quartile, max_amplitude)
+
+    stage(100, "Done")
+    return LoadedFile(file_path, emg, upper_quartile, scaled, max_amplitude)
+
+
+def _read_file(file_path: str) -> EMGFile:
+    """EMGFile.load, served from the decoded-data cache when enabled."""
+    if not config.get(Settings.DECODED_CACHE_ENABLED, True):
+        return EMGFile.load(file_path)
+    decoded_cache.max_bytes = int(config.get(Settings.DECODED_CACHE_MAX_MB, DEFAULT_MAX_MB)) * 1024 * 1024
+    emg = decoded_cache.load(file_path)
+    if emg is None:
+        emg = EMGFile.load(file_path)
+        if decoded_cache.store(file_path, emg):
+            # Continue on the mapped copy so the decoded matrix can be released
+            emg = decoded_cache.load(file_path) or emg
+    return emg
+
+
+class _FileLoadWorker(QObject):
+    progress = pyqtSignal(int, str)
+    finished = pyqtSignal(object)   # LoadedFile
+    cancelled = pyqtSignal()
+    error = pyqtSignal(str)
+
+    def __init__(self, file_path: str):
+        super().__init__()
+        self._file_path = file_path
+        self._cancel_requested = False
+
+    def cancel(self):
+        # Plain attribute write; read by the worker between stages
+        self._cancel_requested = True
+
+    def run(self):
+        try:
+            loaded = load_emg_file(self._file_path, self.progress.emit, lambda: self._cancel_requested)
+        except LoadCancelled:
+            self.cancelled.emit()
+            return
+        except Exception as exc:
+            logger.error(f"Error loading or processing file: {exc}", exc_info=True)
+            self.error.emit(str(exc))
+            return
+        if self._cancel_requested:
+            self.cancelled.emit()
+        else:
+            self.finished.emit(loaded)
+
+
+class FileLoader(QObject):
+    """Runs load_emg_file in a worker thread, one file at a time.
+
+    Emits progress while loading and exactly one of loaded, cancelled or
+    failed per load().
+    """
+
+    progress = pyqtSignal(int, str)
+    loaded = pyqtSignal(object)     # LoadedFile
+    cancelled = pyqtSignal()
+    failed = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._thread = None
+        self._worker = None
+
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    def load(self, file_path: str) -> None:
+        self.cancel()
+        worker = _FileLoadWorker(file_path)
+        thread = QThread(self)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.progress.connect(self._on_progress)
+        worker.finished.connect(self._on_finished)
+        worker.error.connect(self._on_error)
+        for done in (worker.finished, worker.cancelled, worker.error):
+            done.connect(thread.quit)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+
+        self._thread = thread
+        self._worker = worker
+        thread.start()
+
+    def cancel(self) -> None:
+        """Ask the running load to stop at the next stage boundary; its result is discarded."""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._release()
+            self.cancelled.emit()
+
+    def shutdown(self) -> None:
+        """Cancel and wait for the worker; called when the owning window closes."""
+        thread = self._thread
+        self.cancel()
+        if thread is not None:
+            try:
+                if thread.isRunning():
+                    thread.quit()
+                    thread.wait()
+            except RuntimeError:
+                pass  # C++ object already deleted — thread finished naturally
+
+    def _release(self):
+        self._thread = None
+        self._worker = None
+
+    def _is_current(self) -> bool:
+        # Signals of a cancelled worker may already be queued; they are dropped here
+        return self._worker is not None and self.sender() is self._worker
+
+    def _on_progress(self, percent: int, text: str):
+        if self._is_current():
+            self.progress.emit(percent, text)
+
+    def _on_finished(self, loaded: LoadedFile):
+        if self._is_current():
+            self._release()
+            self.loaded.emit(loaded)
+
+    def _on_error(self, message: str):
+        if self._is_current():
+            self._release()
+            self.failed.emit(message)
@@ -1,14 +1,18 @@
-import json
 import os
 from typing import List
 
 import numpy as np
 from PyQt5.QtWidgets import QFileDialog, QMessageBox
-from pathlib import Path
 from hdsemg_shared.fileio.file_io import EMGFile, Grid
-from hdsemg_shared.fileio.matlab_file_io import MatFileIO
 
-from hdsemg_select.select_logic.data_processing import compute_upper_quartile, scale_data
+from hdsemg_select.controller.file_loader import LoadedFile, load_emg_file
+from hdsemg_select.config.config_enums import Settings
+from hdsemg_select.config.config_manager import config
+from hdsemg_select.controller.file_saver import SaveJob, run_save_job, write_json
+from hdsemg_select.controller.selection_io import (
+    DEFAULT_FORMAT, FORMAT_JSON, SavedSelection, apply_selection, build_columnar_selection, description_texts,
+    layout_association, resolve_format, selection_extension
+)
 from hdsemg_select.state.state import global_state
 from hdsemg_select._log.log_config import logger
 from hdsemg_select.ui.dialog.manual_grid_input import manual_grid_input
@@ -34,11 +38,8 @@ class FileManager:
         global_state.set_raw_rms_data(rms_data)
         logger.info(f"Loaded RMS data with grids: {list(rms_data.keys())}")
 
-    def process_file(self, file_path, parent_window):
-        """
-        Loads, processes the file, updates global state, and handles initial grid info.
-        Returns True on success, False on failure.
-        """
+    def check_file(self, file_path, parent_window) -> bool:
+        """Returns True if *file_path* names an existing file, otherwise tells the user."""
         if not file_path:
             return False
 
@@ -49,17 +50,63 @@ class FileManager:
                 f"The specified file does not exist:\n{file_path}"
             )
             return False
+        return True
+
+    def process_file(self, file_path, parent_window):
+        """
+        Loads, processes the file, updates global state, and handles initial grid info.
+        Blocks until done; the main window uses FileLoader to run the loading in the background.
+        Returns True on success, False on failure.
+        """
+        if not self.check_file(file_path, parent_window):
+            return False
 
         try:
+            logger.info(f"Loading file {file_path}")
+            loaded = load_emg_file(file_path)
+        except Exception as e:
+            logger.error(f"Error loading or processing file: {e}", exc_info=True)
+            self.show_load_error(parent_window, str(e))
             global_state.reset()
-            global_state.set_file_path(file_path)
-            logger.info(f"Loading file {global_state.get_file_path()}")
+            return False
+        return self.apply_loaded_file(loaded, parent_window)
+
+    def restore_session(self, selection: SavedSelection, parent_window, restore_crop: bool = True) -> bool:
+        """
+        Restores a saved selection (status, labels, layout mapping, crop) onto the freshly loaded file.
+        Returns True on success; on a mismatch the file stays open with its default selection.
+        """
+        try:
+            apply_selection(selection, global_state, config.get_available_channel_labels(), restore_crop)
+            logger.info(f"Restored selection of {selection.file_name} "
+                        f"({sum(selection.channel_status)}/{selection.channel_count} channels selected)")
+            return True
+        except ValueError as e:
+            logger.warning(f"Could not restore selection: {e}")
+            QMessageBox.warning(
+                parent_window, "Session Not Restored",
+                f"The saved selection does not match the opened file:\n{e}"
+            )
+            return False
+
+    def show_load_error(self, parent_window, message: str):
+        QMessageBox.critical(
+            parent_window, "Loading Error",
+            f"An error occurred while loading the file:\n{message}"
+        )
 
-            # Load data and other info
-            emg = EMGFile.load(file_path)
+    def apply_loaded_file(self, loaded: LoadedFile, parent_window):
+        """
+        Stores a loaded file in the global state and handles initial grid info.
+        Runs on the GUI thread since missing grid info is asked from the user.
+        Returns True on success, False on failure.
+        """
+        try:
+            global_state.reset()
+            global_state.set_file_path(loaded.file_path)
 
             # Store loaded data in state
-            global_state.set_emg_file(emg)
+            global_state.set_emg_file(loaded.emg_file)
 
             if not global_state.get_emg_file().grids:
                 QMessageBox.warning(
@@ -83,34 +130,27 @@ class FileManager:
                     global_state.reset()
                     return False  # Indicate failure
 
-            logger.debug(f"Original Data Min: {np.min(global_state.get_emg_file().data)}")
-            logger.debug(f"Original Data Max: {np.max(global_state.get_emg_file().data)}")
-
-            # Perform amplitude scaling, store scaled data in state
-            self.upper_quartile = compute_upper_quartile(global_state.get_emg_file().data)
-            global_state.set_scaled_data(scale_data(global_state.get_emg_file().data, self.upper_quartile))
-
-            logger.debug(f"Scaled Data Min: {np.min(global_state.get_scaled_data())}")
-            logger.debug(f"Scaled Data Max: {np.max(global_state.get_scaled_data())}")
+            # Amplitude scaling was done by the loader, store scaled data in state
+            self.upper_quartile = loaded.upper_quartile
+            global_state.set_scaled_data(loaded.scaled_data, loaded.max_amplitude)
 
             # Extract grid info and proceed, store in state
             global_state.set_channel_status(_build_channel_status(global_state.get_emg_file().channel_count, global_state.get_emg_file().grids))
 
             # Load companion RMS file if available
-            self._load_rms_data(file_path)
+            self._load_rms_data(loaded.file_path)
 
             return True  # Indicate success
 
         except Exception as e:
             logger.error(f"Error loading or processing file: {e}", exc_info=True)
-            QMessageBox.critical(
-                parent_window, "Loading Error",
-                f"An error occurred while loading the file:\n{e}"
-            )
+            self.show_load_error(parent_window, str(e))
             global_state.reset()  # Reset state on any loading error
             return False  # Indicate failure
 
-def save_selection(parent, output_file, emg_file: EMGFile, channel_status, channel_labels):
+
+def save_selection(parent, output_file, emg_file: EMGFile, channel_status, channel_labels,
+                   selected_only: bool = False, saver=None):
     """
     Saves the channel selection, data, and labels to both a .mat and a .json file.
 
@@ -119,14 +159,22 @@ def save_selection(parent, output_file, emg_file: EMGFile, channel_status, chann
     :param channel_status: List/array of booleans for selection status.
     :param emg_file: The EMGFile object containing data, time, description, and sampling frequency.
     :param channel_labels: Dictionary of channel indices to labels.
-    :return: True if save was successful, False if cancelled or failed.
+    :param selected_only: Write only the selected channels to the .mat file. The .json still lists all channels
+        and records the exported ones as "exported_channels", so a session can be resumed from either file.
+        The selection file is written in the format chosen in the settings (.json by default, or .npz/.msgpack).
+    :param saver: Optional FileSaver. If given, the files are written in the background and the
+        saver reports the result; otherwise they are written here and a message box is shown.
+    :return: True if save was successful (or queued), False if cancelled or failed.
     """
 
+    selection_format = resolve_format(config.get(Settings.SELECTION_FORMAT, DEFAULT_FORMAT))
+    selection_ext = selection_extension(selection_format)
+
     if output_file:
         # If output_file is provided, derive both paths from it
         base_path_without_ext, _ = os.path.splitext(output_file)
         mat_file_path = f"{base_path_without_ext}.mat"
-        json_file_path = f"{base_path_without_ext}.json"
+        json_file_path = f"{base_path_without_ext}{selection_ext}"
         base_path = base_path_without_ext # Store base name for message
 
         # Ensure parent directory exists when using command-line output path
@@ -165,65 +213,71 @@ def save_selection(parent, output_file, emg_file: EMGFile, channel_status, chann
         # Derive both .mat and .json paths from the user's chosen path
         base_path_without_ext, _ = os.path.splitext(file_dialog_path)
         mat_file_path = f"{base_path_without_ext}.mat"
-        json_file_path = f"{base_path_without_ext}.json"
+        json_file_path = f"{base_path_without_ext}{selection_ext}"
         base_path = base_path_without_ext # Store base name for message
 
 
-    save_success = True
-    messages = []
-
-    # Save .mat file (keeping all channels, JSON will indicate which are good/bad)
-    try:
-        # Ensure we only save if data is available for the .mat file
-        if emg_file.data is not None and emg_file.time is not None and emg_file.description is not None:
-            # Apply crop range permanently if set
-            crop = global_state.get_crop_range()
-            if crop is not None:
-                s, e = crop
-                n_samples = emg_file.data.shape[0]
-                if s < 0 or e >= n_samples or s > e:
-                    logger.error(
-                        "Invalid crop range %s for data with %d samples; skipping crop",
-                        crop, n_samples
-                    )
-                else:
-                    emg_file.data = emg_file.data[s:e + 1]
-                    emg_file.time = emg_file.time[s:e + 1]
-                    logger.info("Applied crop range %s to emg_file before saving", crop)
-                    global_state.set_crop_range(None)  # Crop is now baked in
-            emg_file.save(save_path=mat_file_path)
-            messages.append(f"Saved .mat to {Path(mat_file_path).name}")
-        else:
-             messages.append(".mat file skipped (data not available)")
-             logger.warning(f"Warning: .mat save skipped, missing data (data={emg_file.data is not None}, time={emg_file.time is not None}, description={emg_file.description is not None})")
-
-    except Exception as e:
-        save_success = False
-        messages.append(f"Error saving .mat: {e}")
-        logger.error(f"Error saving .mat file {mat_file_path}: {e}")
+    job = SaveJob(mat_file_path, json_file_path, selection_format=selection_format)
 
+    # .mat file (all channels unless selected_only, JSON will indicate which are good/bad)
+    if emg_file.data is not None and emg_file.time is not None and emg_file.description is not None:
+        # The crop range is applied while writing; the loaded data stays untouched
+        crop = global_state.get_crop_range()
+        if crop is not None:
+            s, e = crop
+            n_samples = emg_file.data.shape[0]
+            if s < 0 or e >= n_samples or s > e:
+                logger.error(
+                    "Invalid crop range %s for data with %d samples; skipping crop",
+                    crop, n_samples
+                )
+            else:
+                job.rows = (s, e)
+                logger.info("Applying crop range %s to the saved .mat", crop)
+        job.data, job.time, job.description = emg_file.data, emg_file.time, emg_file.description
+        job.sampling_frequency, job.unit = emg_file.sampling_frequency, emg_file.unit
+        if selected_only:
+            job.channels = [i for i, selected in enumerate(channel_status) if selected]
+    else:
+        job.mat_path = None
+        job.messages.append(".mat file skipped (data not available)")
+        logger.warning(f"Warning: .mat save skipped, missing data (data={emg_file.data is not None}, time={emg_file.time is not None}, description={emg_file.description is not None})")
 
-    # Save .json file
+    # .json file, built now so that later edits to the selection do not leak into this save
+    source_file = os.path.abspath(global_state.get_file_path()) if global_state.get_file_path() else None
     try:
-        # Ensure we have basic info to save JSON
         if channel_status is not None and emg_file.description is not None and emg_file.grids is not None and channel_labels is not None:
-            json_save_success = save_selection_to_json(json_file_path, emg_file.file_name, emg_file.grids, channel_status, emg_file.description, channel_labels)
-            if json_save_success:
-                 messages.append(f"Saved .json to {Path(json_file_path).name}")
+            if selection_format == FORMAT_JSON:
+                job.selection = build_selection_json(emg_file.file_name, emg_file.grids, channel_status,
+                                                     emg_file.description, channel_labels,
+                                                     source_file=source_file, crop_range=job.rows,
+                                                     exported_channels=job.channels)
             else:
-                 save_success = False # save_selection_to_json already logger.ed error
-                 messages.append(f"Error saving .json")
+                job.selection = build_columnar_selection(emg_file.file_name, emg_file.grids, channel_status,
+                                                         emg_file.description, channel_labels,
+                                                         layout_association(global_state),
+                                                         source_file=source_file, crop_range=job.rows,
+                                                         exported_channels=job.channels)
         else:
-            messages.append(".json file skipped (info not available)")
+            job.json_path = None
+            job.messages.append(".json file skipped (info not available)")
             logger.warning(f"Warning: .json save skipped, missing info (status={channel_status is not None}, desc={emg_file.description is not None}, grid={emg_file.grids is not None}, labels={channel_labels is not None})")
-
     except Exception as e:
-        save_success = False
-        messages.append(f"Error saving .json: {e}")
+        job.json_path, job.failed = None, True
+        job.messages.append(f"Error saving .json: {e}")
         logger.error(f"Error saving .json file {json_file_path}: {e}")
 
+    if saver is not None:
+        saver.save(job)
+        return True
+
+    save_success, messages = run_save_job(job)
+    show_save_result(parent, save_success, messages)
+    return save_success
+
 
-    # Show combined success/failure message
+def show_save_result(parent, save_success: bool, messages: list) -> None:
+    """Show the combined success/failure message of a save."""
     if save_success:
         QMessageBox.information(
             parent,
@@ -231,7 +285,6 @@ def save_selection(parent, output_file, emg_file: EMGFile, channel_status, chann
             "\n".join(messages), # Join all save messages
             QMessageBox.Ok
         )
-        return True
     else:
          QMessageBox.warning(
             parent,
@@ -239,7 +292,6 @@ def save_selection(parent, output_file, emg_file: EMGFile, channel_status, chann
             "Some files may not have been saved correctly:\n" + "\n".join(messages),
             QMessageBox.Ok
          )
-         return False
 
 def save_selection_to_json(file_path: str,
                            file_name: str,
@@ -250,10 +302,35 @@ def save_selection_to_json(file_path: str,
     """
     Saves the selection information (including channel labels) to a JSON file.
 
+    The file is written atomically; see build_selection_json for the parameters.
+
+    Returns
+    -------
+    bool
+        True on success, False on failure.
+    """
+    result = build_selection_json(file_name, grids, channel_status, description, channel_labels)
+    try:
+        write_json(file_path, result)
+        return True
+    except OSError as exc:
+        logger.error("Cannot write JSON %s: %s", file_path, exc)
+        return False
+
+
+def build_selection_json(file_name: str,
+                         grids: List[Grid],
+                         channel_status: list,
+                         description: np.ndarray,
+                         channel_labels: dict,
+                         source_file: str = None,
+                         crop_range: tuple = None,
+                         exported_channels: list = None) -> dict:
+    """
+    Builds the selection information (including channel labels) written to the JSON file.
+
     Parameters
     ----------
-    file_path : str
-        Path where the JSON file should be saved.
     file_name : str
         Name of the original file.
     grids : list
@@ -265,17 +342,36 @@ def save_selection_to_json(file_path: str,
     channel_labels : dict[int, list[dict]]
         Mapping channel index → list of label-dicts
         (each dict contains at least a 'name' key).
+    source_file : str, optional
+        Absolute path of the reviewed recording, used to resume the session.
+    crop_range : tuple, optional
+        (start, end) sample indices of the crop applied to the saved .mat.
+    exported_channels : list[int], optional
+        Channel indices written to the saved .mat when it holds only the
+        selected channels; None if it holds all of them.
 
     Returns
     -------
-    bool
-        True on success, False on failure.
+    dict
+        The JSON content.
     """
 
     label_names = {
         idx: [lbl["name"] for lbl in lbl_list]
         for idx, lbl_list in (channel_labels or {}).items()
     }
+    texts = description_texts(description, len(channel_status))
+
+    # One entry per channel; the grids below refer to the same objects
+    all_channels_summary = []
+    for i, sel in enumerate(channel_status):
+        all_channels_summary.append({
+            "channel_index":  i,
+            "channel_number": i + 1,
+            "selected":       bool(sel),
+            "description":    texts[i],
+            "labels":         label_names.get(i, [])
+        })
 
     grids_out = []
 
@@ -291,40 +387,19 @@ def save_selection_to_json(file_path: str,
             # ---------- Channels ----------
             ch_objects = []
             if isinstance(indices, (list, np.ndarray)):
-                for ch_idx in indices:
-                    if ch_idx is None:
-                        continue  # placeholder in some grids
-
-                    is_selected = bool(channel_status[ch_idx])
-
-                    # description might be numpy bytes / string
-                    if (isinstance(description, np.ndarray)
-                            and ch_idx < description.shape[0]):
-                        ch_descr = description[ch_idx, 0].item()
-                    else:
-                        ch_descr = f"Channel {ch_idx + 1}"
-
-                    ch_objects.append({
-                        "channel_index":   int(ch_idx),
-                        "channel_number":  int(ch_idx + 1),
-                        "selected":        is_selected,
-                        "description":     str(ch_descr),
-                        "labels":          label_names.get(ch_idx, [])
-                    })
+                ch_objects = [all_channels_summary[ch_idx] for ch_idx in indices
+                              if ch_idx is not None]  # None: placeholder in some grids
 
             # ---------- Reference Signals ----------
             ref_objects = []
-            for ref in ref_list:
-                ref_idx  = ref
-                ref_name = description[ref_idx,0].item()
-
+            for ref_idx in ref_list:
                 if ref_idx is None or ref_idx >= len(channel_status):
                     continue  # inconsistent index, skip
 
                 ref_objects.append({
                     "ref_index":   int(ref_idx),
                     "ref_number":  int(ref_idx + 1),
-                    "name":        str(ref_name),
+                    "name":        texts[ref_idx],
                     "selected":    bool(channel_status[ref_idx]),
                     "labels":      label_names.get(ref_idx, [])
                 })
@@ -340,44 +415,16 @@ def save_selection_to_json(file_path: str,
     else:
         logger.warning("grid_info is not a List of Grids but %s", type(grids))
 
-    all_channels_summary = []
-    for i, sel in enumerate(channel_status):
-        if isinstance(description, np.ndarray) and i < description.shape[0]:
-            ch_descr = description[i, 0].item()
-        else:
-            ch_descr = f"Channel {i + 1}"
-
-        all_channels_summary.append({
-            "channel_index":  i,
-            "channel_number": i + 1,
-            "selected":       bool(sel),
-            "description":    str(ch_descr),
-            "labels":         label_names.get(i, [])
-        })
-
-    layout_association = {
-        fiber.name.lower(): layout.name.lower()
-        for fiber, layout in global_state.get_layout().items()
-    }
-
-    result_layout_association = {
-        "layout_mapping": layout_association,
-        "set_by_user": str(global_state.is_fiber_to_layout_user_set())
-    }
     result = {
         "filename":               file_name or "unknown",
-        "layout":                 result_layout_association,
+        "source_file":            source_file,
+        "crop_range":             list(crop_range) if crop_range is not None else None,
+        "exported_channels":      [int(i) for i in exported_channels] if exported_channels is not None else None,
+        "layout":                 layout_association(global_state),
         "total_channels_summary": all_channels_summary,
         "grids":                  grids_out
     }
-
-    try:
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(result, f, indent=4)
-        return True
-    except OSError as exc:
-        logger.error("Cannot write JSON %s: %s", file_path, exc)
-        return False
+    return result
 
 def clean_data_and_description_signal(channel_status, data, description):
     if data.ndim != 2:
@@ -0,0 +1,202 @@
+import os
+import stat
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+from PyQt5.QtCore import QEventLoop, QObject, QThread, pyqtSignal
+
+from hdsemg_select._log.log_config import logger
+from hdsemg_select.controller.mat_writer import write_mat
+from hdsemg_select.controller.selection_io import DEFAULT_FORMAT, write_selection
+
+
+def _read_umask() -> int:
+    # os.umask can only be read by setting it; done once at import, before any worker thread runs
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+_UMASK = _read_umask()
+
+
+def _file_mode(path: str) -> int:
+    """Permissions for a file written to *path*: those of the file it replaces, else 0o666 minus umask."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except OSError:
+        return 0o666 & ~_UMASK
+
+
+def atomic_write(path: str, write: Callable[[str], None]) -> None:
+    """Call *write* with a temporary path next to *path*, then move the result into place.
+
+    The target is replaced in one step, so it never holds a partially
+    written file; on failure the temporary file is removed and *path* is
+    left as it was. The result gets the permissions of the replaced file,
+    or those of a newly created file (mkstemp alone would leave it 0600).
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp)
+        os.chmod(tmp, _file_mode(path))
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def write_json(path: str, content: dict) -> None:
+    atomic_write(path, lambda tmp: write_selection(tmp, content))
+
+
+@dataclass
+class SaveJob:
+    """Everything needed to write one selection, captured on the GUI thread.
+
+    The arrays are the loaded recording's own (never modified in place), so
+    the job stays valid after another file has been opened.
+    """
+    mat_path: Optional[str]
+    json_path: Optional[str]  # selection file, .json unless selection_format says otherwise
+    data: Optional[np.ndarray] = None
+    time: Optional[np.ndarray] = None
+    description: Optional[np.ndarray] = None
+    sampling_frequency: Optional[float] = None
+    unit: Optional[str] = None
+    rows: Optional[tuple] = None
+    channels: Optional[Sequence[int]] = None
+    selection: Optional[dict] = None  # content of the selection file
+    selection_format: str = DEFAULT_FORMAT
+    messages: List[str] = field(default_factory=list)  # notes about skipped parts
+    failed: bool = False  # a part could not be prepared
+
+    @property
+    def name(self) -> str:
+        return Path(self.mat_path or self.json_path or "selection").stem
+
+
+def run_save_job(job: SaveJob, progress: Optional[Callable[[int], None]] = None) -> tuple:
+    """Write the .mat and .json of *job*; returns (success, messages)."""
+    success = not job.failed
+    messages = list(job.messages)
+
+    if job.mat_path is not None:
+        try:
+            mat_progress = None if progress is None else (lambda percent: progress(percent * 95 // 100))
+            atomic_write(job.mat_path, lambda tmp: write_mat(
+                tmp, job.data, job.time, job.description, job.sampling_frequency, job.unit,
+                rows=job.rows, channels=job.channels, progress=mat_progress))
+            messages.append(f"Saved .mat to {Path(job.mat_path).name}")
+        except Exception as e:
+            success = False
+            messages.append(f"Error saving .mat: {e}")
+            logger.error(f"Error saving .mat file {job.mat_path}: {e}")
+
+    if job.json_path is not None:
+        try:
+            atomic_write(job.json_path, lambda tmp: write_selection(tmp, job.selection, job.selection_format))
+            messages.append(f"Saved {Path(job.json_path).suffix} to {Path(job.json_path).name}")
+        except Exception as e:
+            success = False
+            messages.append(f"Error saving {Path(job.json_path).suffix}: {e}")
+            logger.error(f"Error saving selection file {job.json_path}: {e}")
+
+    if progress is not None:
+        progress(100)
+    return success, messages
+
+
+class _SaveWorker(QObject):
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(bool, list)
+
+    def __init__(self, job: SaveJob):
+        super().__init__()
+        self._job = job
+
+    def run(self):
+        try:
+            success, messages = run_save_job(self._job, self.progress.emit)
+        except Exception as exc:  # run_save_job reports per file; this is a last resort
+            logger.error(f"Error saving selection: {exc}", exc_info=True)
+            success, messages = False, [str(exc)]
+        self.finished.emit(success, messages)
+
+
+class FileSaver(QObject):
+    """Writes SaveJobs in a worker thread, one after another in submission order.
+
+    Emits progress while a job is written and saved once it is done; idle
+    fires when the queue has drained. Call wait() before the application
+    quits so that no queued selection is lost.
+    """
+
+    progress = pyqtSignal(object, int)          # SaveJob, percent
+    saved = pyqtSignal(object, bool, list)      # SaveJob, success, messages
+    idle = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._queue: List[SaveJob] = []
+        self._job = None
+        self._thread = None
+        self._worker = None
+
+    def pending(self) -> int:
+        """Number of jobs queued or being written."""
+        return len(self._queue) + (self._job is not None)
+
+    def save(self, job: SaveJob) -> None:
+        self._queue.append(job)
+        if self._job is None:
+            self._start_next()
+
+    def wait(self) -> None:
+        """Block (while processing events) until every queued job is written."""
+        if not self.pending():
+            return
+        loop = QEventLoop()
+        self.idle.connect(loop.quit)
+        try:
+            loop.exec_()
+        finally:
+            self.idle.disconnect(loop.quit)
+
+    def _start_next(self):
+        if not self._queue:
+            self.idle.emit()
+            return
+        job = self._queue.pop(0)
+        worker = _SaveWorker(job)
+        thread = QThread(self)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.progress.connect(self._on_progress)
+        worker.finished.connect(self._on_finished)
+        worker.finished.connect(thread.quit)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+
+        self._job, self._thread, self._worker = job, thread, worker
+        thread.start()
+
+    def _on_progress(self, percent: int):
+        if self._job is not None:
+            self.progress.emit(self._job, percent)
+
+    def _on_finished(self, success: bool, messages: list):
+        job, thread = self._job, self._thread
+        self._job, self._thread, self._worker = None, None, None
+        thread.quit()
+        thread.wait()  # run() has returned, so this is immediate; the thread must not outlive the saver
+        self.saved.emit(job, success, messages)
+        self._start_next()
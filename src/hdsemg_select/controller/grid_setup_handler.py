@@ -4,7 +4,8 @@ from PyQt5.QtWidgets import QMessageBox
 from hdsemg_select._log.log_config import logger
 from hdsemg_select.state.enum.layout_mode_enums import FiberMode, LayoutMode
 from hdsemg_select.state.state import global_state
-from hdsemg_select.ui.electrode_layout import get_display_grid
+from hdsemg_select.controller.decoded_cache import description_text
+from hdsemg_select.ui.electrode_layout import electrode_model_code, get_display_grid
 
 
 class GridSetupHandler:
@@ -99,21 +100,14 @@ class GridSetupHandler:
         'Novecento+ (147 - 210) HD08MM0513 ch1 [MUSCLE:...]' — we pull out
         the first token matching the OTBiolab model-code pattern (e.g. HD08MM0513).
         """
-        import re
         try:
             desc = global_state.get_emg_file().description
             if desc is None or len(indices) == 0:
                 return ""
-            first_ch = indices[0]
-            if desc.ndim == 2:
-                raw = str(desc[first_ch, 0].item()).strip()
-            else:
-                raw = str(desc[first_ch]).strip()
-            # Try to pull out the electrode model code: 2 letters + digits + MM + digits
-            match = re.search(r'\b([A-Z]{2}\d+MM\d{4})\b', raw)
-            if match:
-                return match.group(1)
-            return raw  # fallback: return the whole string as before
+            code = electrode_model_code(desc, indices)
+            if code:
+                return code
+            return description_text(desc[indices[0]]).strip()  # fallback: the whole string as before
         except Exception as e:
             logger.debug(f"Could not extract electrode name: {e}")
             return ""
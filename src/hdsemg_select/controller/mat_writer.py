@@ -0,0 +1,156 @@
+import struct
+import time as _time
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+
+from hdsemg_select._log.log_config import logger
+from hdsemg_select.controller.decoded_cache import description_text
+
+# MAT v5 data types and array classes (MATLAB "MAT-File Format", level 5)
+_MI_UINT32 = 6
+_MI_INT32 = 5
+_MI_INT8 = 1
+_MI_SINGLE = 7
+_MI_DOUBLE = 9
+_MI_MATRIX = 14
+_MI_UTF8 = 16
+_MX_CELL = 1
+_MX_CHAR = 4
+_MX_DOUBLE = 6
+_MX_SINGLE = 7
+
+_NUMERIC = {
+    np.dtype(np.float64): (_MI_DOUBLE, _MX_DOUBLE),
+    np.dtype(np.float32): (_MI_SINGLE, _MX_SINGLE),
+}
+_MAX_ELEMENT_BYTES = 2 ** 32 - 1
+
+
+def _padded(nbytes: int) -> int:
+    return (nbytes + 7) // 8 * 8
+
+
+def _element_size(nbytes: int) -> int:
+    """Bytes of a tagged data element with *nbytes* of payload."""
+    return 8 + _padded(nbytes)
+
+
+def _matrix_size(name: str, ndims: int, payload: int) -> int:
+    """Bytes inside a miMATRIX element (flags, dimensions, name, real part)."""
+    return 16 + _element_size(4 * ndims) + _element_size(len(name.encode("ascii"))) + payload
+
+
+class _MatStream:
+    """Low-level writer of MAT v5 elements to a binary file object."""
+
+    def __init__(self, fh):
+        self._fh = fh
+
+    def header(self):
+        text = f"MATLAB 5.0 MAT-file, Platform: hdsemg-select, Created on: {_time.asctime()}"
+        self._fh.write(text.encode("ascii")[:116].ljust(116, b" "))
+        self._fh.write(b"\x00" * 8)                 # no subsystem data
+        self._fh.write(struct.pack("<H", 0x0100))   # version
+        self._fh.write(b"IM")                       # written little-endian
+
+    def element(self, mi_type: int, payload: bytes):
+        self._fh.write(struct.pack("<II", mi_type, len(payload)))
+        self._fh.write(payload)
+        self.pad(len(payload))
+
+    def pad(self, nbytes: int):
+        self._fh.write(b"\x00" * (_padded(nbytes) - nbytes))
+
+    def matrix_start(self, name: str, mx_class: int, dims: tuple, payload: int):
+        size = _matrix_size(name, len(dims), payload)
+        if size > _MAX_ELEMENT_BYTES:
+            raise ValueError(f"Variable '{name}' is too large for a MAT v5 file ({size} bytes)")
+        self._fh.write(struct.pack("<II", _MI_MATRIX, size))
+        self.element(_MI_UINT32, struct.pack("<II", mx_class, 0))
+        self.element(_MI_INT32, struct.pack(f"<{len(dims)}i", *dims))
+        self.element(_MI_INT8, name.encode("ascii"))
+
+    def write(self, data: bytes):
+        self._fh.write(data)
+
+
+def _char_payload(text: str) -> tuple:
+    raw = text.encode("utf-8")
+    dims = (1, len(text)) if text else (0, 0)
+    return raw, dims
+
+
+def _char_size(name: str, text: str) -> int:
+    raw, dims = _char_payload(text)
+    return 8 + _matrix_size(name, len(dims), _element_size(len(raw)))
+
+
+def _write_char(stream: _MatStream, name: str, text: str):
+    raw, dims = _char_payload(text)
+    stream.matrix_start(name, _MX_CHAR, dims, _element_size(len(raw)))
+    stream.element(_MI_UTF8, raw)
+
+
+def _write_double(stream: _MatStream, name: str, values: np.ndarray):
+    values = np.asarray(values, dtype="<f8").ravel()
+    stream.matrix_start(name, _MX_DOUBLE, (1, values.size), _element_size(values.nbytes))
+    stream.element(_MI_DOUBLE, values.tobytes())
+
+
+def write_mat(path: str, data: np.ndarray, time: np.ndarray, description, sampling_frequency,
+              unit: Optional[str] = None, rows: Optional[tuple] = None,
+              channels: Optional[Sequence[int]] = None,
+              progress: Optional[Callable[[int], None]] = None) -> str:
+    """Write a recording as an uncompressed MAT v5 file, one channel at a time.
+
+    Produces the same variables as MatFileIO.save (Data, Time, Description,
+    SamplingFrequency and, if known, Unit), so the file loads like any other
+    export. *rows* is an inclusive (start, end) sample range and *channels*
+    the data columns to keep, in order; both default to everything. Only
+    one channel of the output is held in memory at a time, so neither the
+    crop nor the channel subset is ever copied as a whole. *progress* is
+    called with the percentage of channels written.
+
+    Raises ValueError if a variable exceeds the 4 GiB element limit of the
+    format.
+    """
+    start, end = (0, data.shape[0] - 1) if rows is None else rows
+    samples = slice(start, end + 1)
+    n_samples = end - start + 1
+    columns = list(range(data.shape[1])) if channels is None else [int(c) for c in channels]
+
+    mi_type, mx_class = _NUMERIC.get(np.dtype(data.dtype), _NUMERIC[np.dtype(np.float64)])
+    out_dtype = np.dtype(np.float32 if mx_class == _MX_SINGLE else np.float64).newbyteorder("<")
+    column_bytes = n_samples * out_dtype.itemsize
+    data_bytes = column_bytes * len(columns)
+    if data_bytes > _MAX_ELEMENT_BYTES:
+        raise ValueError(f"Data is too large for a MAT v5 file ({data_bytes} bytes)")
+
+    texts = [description_text(description[c]) for c in columns]
+    cells = sum(_char_size("", text) for text in texts)
+
+    with open(path, "wb") as fh:
+        stream = _MatStream(fh)
+        stream.header()
+
+        stream.matrix_start("Data", mx_class, (n_samples, len(columns)), _element_size(data_bytes))
+        stream.write(struct.pack("<II", mi_type, data_bytes))
+        for i, ch in enumerate(columns):
+            stream.write(np.ascontiguousarray(data[samples, ch], dtype=out_dtype).tobytes())
+            if progress is not None:
+                progress(int(100 * (i + 1) / len(columns)))
+        stream.pad(data_bytes)
+
+        _write_double(stream, "Time", np.ravel(time)[samples])
+
+        stream.matrix_start("Description", _MX_CELL, (len(texts), 1), cells)
+        for text in texts:
+            _write_char(stream, "", text)
+
+        _write_double(stream, "SamplingFrequency", np.asarray([sampling_frequency], dtype=float))
+        if unit is not None:
+            _write_char(stream, "Unit", unit)
+
+    logger.info(f"MAT file written: {path} ({n_samples} samples x {len(columns)} channels)")
+    return path
@@ -14,6 +14,7 @@ from hdsemg_select.version import __version__
 class MenuManager:
     def __init__(self):
         self.save_action = None
+        self.save_selected_only_action = None
         self.change_grid_action = None
         self.amplitude_menu = None
         self.zero_line_menu = None
@@ -44,6 +45,18 @@ class MenuManager:
         open_action.triggered.connect(parent_window.load_file)
         file_menu.addAction(open_action)
 
+        resume_action = QAction("Resume Session...", parent_window)
+        resume_action.setStatusTip("Reopen a recording with a previously saved selection")
+        resume_action.setShortcut(QKeySequence("Ctrl+Shift+O"))
+        resume_action.triggered.connect(lambda: parent_window.resume_session())
+        file_menu.addAction(resume_action)
+
+        browse_action = QAction("Browse Recordings...", parent_window)
+        browse_action.setStatusTip("Search the recordings of a study folder by name, grid or muscle")
+        browse_action.setShortcut(QKeySequence("Ctrl+B"))
+        browse_action.triggered.connect(parent_window.open_recording_browser)
+        file_menu.addAction(browse_action)
+
         self.save_action = QAction("Save Selection", parent_window)
         self.save_action.setShortcut(QKeySequence("Ctrl+S"))
         self.save_action.setStatusTip("Save current channel selection and labels")
@@ -51,6 +64,13 @@ class MenuManager:
         self.save_action.triggered.connect(partial(self._perform_save_selection, parent_window))
         file_menu.addAction(self.save_action)
 
+        self.save_selected_only_action = QAction("Save Selected Channels Only...", parent_window)
+        self.save_selected_only_action.setStatusTip("Save the selection; the .mat file contains only the selected channels")
+        self.save_selected_only_action.setEnabled(False)
+        self.save_selected_only_action.triggered.connect(
+            lambda: self._perform_save_selection(parent_window, selected_only=True))
+        file_menu.addAction(self.save_selected_only_action)
+
         app_settings_menu = QAction("Settings", parent_window)
         app_settings_menu.setStatusTip("Open application settings")
         app_settings_menu.setIcon(QIcon(CustomIcon.SETTINGS.value))
@@ -153,11 +173,12 @@ class MenuManager:
         version_label.setStyleSheet("padding-right: 10px;")
         parent_window.statusBar().addPermanentWidget(version_label)
 
-    def _perform_save_selection(self, parent_window):
+    def _perform_save_selection(self, parent_window, *, selected_only=False):
         """
         Collects necessary data from global_state and calls the save_selection function.
-        If an output_file was provided via command-line arguments and save is successful,
-        automatically closes the application.
+        The files are written in the background by the window's FileSaver.
+        If an output_file was provided via command-line arguments, they are written
+        synchronously instead and the application closes only if the save succeeded.
         """
         # Retrieve all required data from the global_state singleton
         channel_status = global_state.get_channel_status()
@@ -170,7 +191,10 @@ class MenuManager:
             output_file=output_file,
             emg_file=emg_file,
             channel_status=channel_status,
-            channel_labels=channel_labels  # Pass the collected labels
+            channel_labels=channel_labels,  # Pass the collected labels
+            selected_only=selected_only,
+            # The window closes after a command-line save, so its result must be known here
+            saver=None if output_file else parent_window.file_saver
         )
 
         # If output_file was provided (via command-line) and save was successful, close the app
@@ -210,6 +234,9 @@ class MenuManager:
     def get_save_action(self):
         return self.save_action
 
+    def get_save_selected_only_action(self):
+        return self.save_selected_only_action
+
     def get_change_grid_action(self):
         return self.change_grid_action
 
@@ -0,0 +1,87 @@
+import numpy as np
+from PyQt5.QtCore import QObject, QThread, pyqtSignal
+
+from hdsemg_select._log.log_config import logger
+from hdsemg_select.logic.density.pyramid import AmplitudePyramid
+
+
+class _PyramidWorker(QObject):
+    finished = pyqtSignal(object, object)   # token, AmplitudePyramid
+    error = pyqtSignal(object, str)
+
+    def __init__(self, token, data: np.ndarray, columns: tuple):
+        super().__init__()
+        self._token = token
+        self._data = data
+        self._columns = columns
+
+    def run(self):
+        try:
+            self.finished.emit(self._token, AmplitudePyramid(self._data, self._columns))
+        except Exception as exc:
+            self.error.emit(self._token, str(exc))
+
+
+class AmplitudePyramidLoader(QObject):
+    """Builds AmplitudePyramid instances off the GUI thread.
+
+    Views call request() as soon as their data is set and keep computing
+    frames directly from the raw samples until ready is emitted for the
+    token they are currently waiting on.
+    """
+
+    ready = pyqtSignal(object, object)  # token, AmplitudePyramid
+    failed = pyqtSignal(object, str)    # token, message
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._threads: dict = {}   # token -> (QThread, worker)
+
+    def is_pending(self, token) -> bool:
+        return token in self._threads
+
+    def request(self, token, data: np.ndarray, columns: tuple) -> None:
+        if token in self._threads:
+            return
+        worker = _PyramidWorker(token, data, columns)
+        thread = QThread(self)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.finished.connect(self._on_finished)
+        worker.error.connect(self._on_error)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+
+        self._threads[token] = (thread, worker)
+        thread.start()
+
+    def shutdown(self) -> None:
+        """Wait for running workers; called when the owning view closes."""
+        for thread, _ in list(self._threads.values()):
+            try:
+                if thread.isRunning():
+                    thread.quit()
+                    thread.wait()
+            except RuntimeError:
+                pass  # C++ object already deleted — thread finished naturally
+        self._threads.clear()
+
+    def _release(self, token) -> bool:
+        """Join the worker thread of *token*; False if the loader was shut down meanwhile."""
+        entry = self._threads.pop(token, None)
+        if entry is None:
+            return False
+        thread, _ = entry
+        thread.quit()
+        thread.wait()  # run() has returned once the worker reports, so this is immediate
+        return True
+
+    def _on_finished(self, token, pyramid: AmplitudePyramid):
+        if self._release(token):
+            self.ready.emit(token, pyramid)
+
+    def _on_error(self, token, message: str):
+        if not self._release(token):
+            return
+        logger.warning("Amplitude pyramid build failed: %s", message)
+        self.failed.emit(token, message)
@@ -0,0 +1,430 @@
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing, contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import numpy as np
+import scipy.io as sio
+from PyQt5.QtCore import QObject, QThread, pyqtSignal
+from hdsemg_shared.fileio.file_io import EMGFile
+
+from hdsemg_select._log.log_config import logger
+from hdsemg_select.controller.decoded_cache import decoded_cache, description_array
+from hdsemg_select.controller.rms_loader import RMSLoader
+
+DEFAULT_INDEX_PATH = os.path.join(os.path.expanduser("~"), ".hdsemg_cache", "recording_index.sqlite")
+_SCHEMA_VERSION = 1
+_SELECTION_EXTENSIONS = (".json", ".npz", ".msgpack")
+_COMMIT_EVERY = 50  # unchanged files whose sidecars were refreshed
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS recordings (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    file_name TEXT NOT NULL,
+    file_type TEXT,
+    channel_count INTEGER,
+    sample_count INTEGER,
+    sampling_frequency REAL,
+    duration_s REAL,
+    grids TEXT NOT NULL DEFAULT '[]',
+    search_text TEXT NOT NULL DEFAULT '',
+    selection_file TEXT,
+    rms_file TEXT,
+    error TEXT,
+    indexed_at REAL NOT NULL
+)
+"""
+
+
+@dataclass
+class RecordingInfo:
+    """Metadata of one recording as stored in the index."""
+    path: str
+    file_name: str
+    size: int
+    mtime_ns: int
+    file_type: Optional[str] = None
+    channel_count: Optional[int] = None
+    sample_count: Optional[int] = None
+    sampling_frequency: Optional[float] = None
+    grids: List[dict] = field(default_factory=list)  # grid_key, model_code, rows, cols, ied_mm, muscle, channels
+    selection_file: Optional[str] = None  # selection saved next to the recording
+    rms_file: Optional[str] = None  # RMS quality sidecar
+    error: Optional[str] = None  # why the metadata could not be read
+
+    @property
+    def duration_s(self) -> Optional[float]:
+        if not self.sample_count or not self.sampling_frequency:
+            return None
+        return self.sample_count / self.sampling_frequency
+
+    @property
+    def grid_summary(self) -> str:
+        return ", ".join(f"{g['grid_key']} ({g['muscle']})" if g.get("muscle") else g["grid_key"]
+                         for g in self.grids)
+
+    @property
+    def search_text(self) -> str:
+        parts = []
+        for grid in self.grids:
+            parts.extend(str(grid.get(key) or "") for key in ("grid_key", "model_code", "muscle"))
+        return " ".join(p for p in parts if p).lower()
+
+
+@dataclass
+class ScanSummary:
+    """Outcome of RecordingIndex.scan."""
+    folder: str
+    indexed: int = 0    # read (again) because they are new or changed
+    unchanged: int = 0
+    removed: int = 0
+    failed: int = 0
+    cancelled: bool = False
+
+
+def _channels_and_samples(shape: tuple) -> tuple:
+    # Same orientation rule as EMGFile._sanitize: samples along the longer axis
+    if len(shape) < 2:
+        return 1, int(shape[0]) if shape else 0
+    return int(min(shape[0], shape[1])), int(max(shape[0], shape[1]))
+
+
+def _grid_entries(description, channel_count: int) -> List[dict]:
+    if description is None or len(description) == 0:
+        return []
+    emg = EMGFile(np.empty((0, channel_count)), np.empty(0), description, 1.0, "", 0, "")
+    return [{
+        "grid_key": grid.grid_key,
+        "model_code": grid.model_code,
+        "rows": grid.rows,
+        "cols": grid.cols,
+        "ied_mm": grid.ied_mm,
+        "muscle": grid.muscle,
+        "channels": len([i for i in grid.emg_indices if i is not None]),
+    } for grid in emg.grids]
+
+
+def _mat_metadata(path: str) -> tuple:
+    """(description, sampling frequency, file shape) of a .mat file without reading Data."""
+    shapes = {name: shape for name, shape, _ in sio.whosmat(path)}
+    if "Data" not in shapes:
+        raise ValueError("no 'Data' variable")
+    variables = sio.loadmat(path, variable_names=["Description", "SamplingFrequency"])
+    sampling_frequency = float(np.asarray(variables["SamplingFrequency"]).flat[0]) \
+        if "SamplingFrequency" in variables else 1.0
+    return variables.get("Description"), sampling_frequency, shapes["Data"]
+
+
+def read_metadata(path: str) -> RecordingInfo:
+    """Lightweight metadata of the recording at *path*.
+
+    Served from the decoded-data cache if the file is cached there; .mat
+    files are read without their data matrix. Other formats have no
+    header-only reader, so they are decoded completely (and released).
+    Errors are recorded in the result rather than raised.
+    """
+    stat = os.stat(path)
+    info = RecordingInfo(path, os.path.basename(path), stat.st_size, stat.st_mtime_ns,
+                         file_type=Path(path).suffix.lower().lstrip("."))
+    try:
+        cached = decoded_cache.metadata(path)
+        if cached is not None:
+            meta, shape = cached
+            description = description_array(meta["description"])
+            sampling_frequency = meta["sampling_frequency"]
+            info.file_type = meta.get("file_type") or info.file_type
+        elif info.file_type == "mat":
+            description, sampling_frequency, shape = _mat_metadata(path)
+        else:
+            emg = EMGFile.load(path)
+            description, sampling_frequency, shape = emg.description, emg.sampling_frequency, emg.data.shape
+            info.file_type = emg.file_type
+        info.channel_count, info.sample_count = _channels_and_samples(shape)
+        info.sampling_frequency = float(sampling_frequency)
+        info.grids = _grid_entries(description, info.channel_count)
+    except Exception as e:
+        logger.warning(f"Could not read metadata of {path}: {e}")
+        info.error = str(e) or type(e).__name__
+    info.selection_file, info.rms_file = _sidecars(path)
+    return info
+
+
+def _sidecars(path: str) -> tuple:
+    """(selection file, RMS file) next to the recording at *path*, each None if absent."""
+    stem = os.path.splitext(path)[0]
+    selection = next((stem + ext for ext in _SELECTION_EXTENSIONS if os.path.isfile(stem + ext)), None)
+    rms = RMSLoader.get_rms_file_path(path)
+    return selection, rms if os.path.isfile(rms) else None
+
+
+def _is_recording(name: str) -> bool:
+    lower = name.lower()
+    return any(lower.endswith(ext) for ext in EMGFile.supported_extensions())
+
+
+def _list_recordings(folder: str) -> List[str]:
+    found = []
+    for directory, subdirs, files in os.walk(folder):
+        subdirs[:] = sorted(d for d in subdirs if not d.startswith("."))
+        found.extend(os.path.join(directory, name) for name in sorted(files) if _is_recording(name))
+    return found
+
+
+class RecordingIndex:
+    """Persistent index of the recordings below study folders, kept in SQLite.
+
+    A scan only reads files that are new or whose size or modification time
+    changed since they were indexed; for the others only the sidecar
+    columns are refreshed. Each call opens its own connection, so the index
+    can be scanned in a worker thread while the GUI queries it.
+    """
+
+    def __init__(self, path: str = DEFAULT_INDEX_PATH):
+        self.path = path
+
+    @contextmanager
+    def _connect(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with closing(sqlite3.connect(self.path, timeout=10)) as conn:
+            conn.row_factory = sqlite3.Row
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != _SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS recordings")
+                conn.execute(_SCHEMA)
+                conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+                conn.execute("PRAGMA journal_mode = WAL")
+                conn.commit()
+            with conn:
+                yield conn
+
+    @staticmethod
+    def _prefix(folder: str) -> str:
+        return os.path.join(os.path.abspath(folder), "")
+
+    def _rows_below(self, conn, folder: str, columns: str = "*", where: str = "", params: tuple = ()):
+        prefix = self._prefix(folder)
+        return conn.execute(f"SELECT {columns} FROM recordings WHERE substr(path, 1, ?) = ?{where} ORDER BY path",
+                            (len(prefix), prefix) + params).fetchall()
+
+    def scan(self, folder: str,
+             progress: Optional[Callable[[int, str], None]] = None,
+             is_cancelled: Optional[Callable[[], bool]] = None) -> ScanSummary:
+        """Bring the entries below *folder* up to date with the files on disk.
+
+        *progress* is called with (percent, file name) per file and
+        *is_cancelled* is polled in between; a cancelled scan keeps what it
+        indexed so far and removes nothing.
+        """
+        folder = os.path.abspath(folder)
+        summary = ScanSummary(folder)
+        paths = _list_recordings(folder)
+        with self._connect() as conn:
+            known = {row["path"]: row for row in
+                     self._rows_below(conn, folder, "path, mtime_ns, size, selection_file, rms_file")}
+            pending = 0
+            for i, path in enumerate(paths):
+                if is_cancelled is not None and is_cancelled():
+                    summary.cancelled = True
+                    return summary
+                if progress is not None:
+                    progress(int(100 * i / len(paths)), os.path.relpath(path, folder))
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue  # vanished during the scan
+                row = known.get(path)
+                if row is not None and row["mtime_ns"] == stat.st_mtime_ns and row["size"] == stat.st_size:
+                    summary.unchanged += 1
+                    sidecars = _sidecars(path)
+                    if sidecars != (row["selection_file"], row["rms_file"]):
+                        conn.execute("UPDATE recordings SET selection_file = ?, rms_file = ? WHERE path = ?",
+                                     sidecars + (path,))
+                        pending += 1
+                        if pending >= _COMMIT_EVERY:
+                            conn.commit()
+                            pending = 0
+                    continue
+                info = read_metadata(path)
+                self._store(conn, info)
+                conn.commit()  # readers see each file as soon as it is indexed
+                pending = 0
+                summary.indexed += 1
+                summary.failed += info.error is not None
+
+            gone = set(known) - set(paths)
+            conn.executemany("DELETE FROM recordings WHERE path = ?", ((p,) for p in gone))
+            summary.removed = len(gone)
+        if progress is not None:
+            progress(100, "")
+        logger.info(f"Indexed {folder}: {summary.indexed} read, {summary.unchanged} unchanged, "
+                    f"{summary.removed} removed, {summary.failed} unreadable")
+        return summary
+
+    @staticmethod
+    def _store(conn, info: RecordingInfo) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO recordings (path, mtime_ns, size, file_name, file_type, channel_count, "
+            "sample_count, sampling_frequency, duration_s, grids, search_text, selection_file, rms_file, error, "
+            "indexed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (info.path, info.mtime_ns, info.size, info.file_name, info.file_type, info.channel_count,
+             info.sample_count, info.sampling_frequency, info.duration_s, json.dumps(info.grids),
+             info.search_text, info.selection_file, info.rms_file, info.error, time.time()))
+
+    def search(self, folder: str, text: str = "") -> List[RecordingInfo]:
+        """Indexed recordings below *folder* matching every word of *text*.
+
+        A word matches the path relative to *folder* (so subject or session
+        folder names work), a grid key, an electrode model code or a muscle,
+        case-insensitively.
+        """
+        where, params = "", ()
+        offset = len(self._prefix(folder)) + 1
+        for word in text.lower().split():
+            pattern = "%" + word.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            where += (" AND (lower(substr(path, ?)) LIKE ? ESCAPE '\\'"
+                      " OR search_text LIKE ? ESCAPE '\\')")
+            params += (offset, pattern, pattern)
+        with self._connect() as conn:
+            return [self._info(row) for row in self._rows_below(conn, folder, where=where, params=params)]
+
+    def get(self, path: str) -> Optional[RecordingInfo]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM recordings WHERE path = ?", (os.path.abspath(path),)).fetchone()
+        return self._info(row) if row is not None else None
+
+    @staticmethod
+    def _info(row) -> RecordingInfo:
+        return RecordingInfo(row["path"], row["file_name"], row["size"], row["mtime_ns"], row["file_type"],
+                             row["channel_count"], row["sample_count"], row["sampling_frequency"],
+                             json.loads(row["grids"]), row["selection_file"], row["rms_file"], row["error"])
+
+
+recording_index = RecordingIndex()
+
+
+class _ScanWorker(QObject):
+    progress = pyqtSignal(int, str)
+    finished = pyqtSignal(object)  # ScanSummary
+    error = pyqtSignal(str)
+
+    def __init__(self, index: RecordingIndex, folder: str):
+        super().__init__()
+        self._index = index
+        self._folder = folder
+        self._cancel_requested = False
+
+    def cancel(self):
+        self._cancel_requested = True
+
+    def run(self):
+        try:
+            summary = self._index.scan(self._folder, self.progress.emit, lambda: self._cancel_requested)
+        except Exception as exc:
+            logger.error(f"Error indexing {self._folder}: {exc}", exc_info=True)
+            self.error.emit(str(exc))
+            return
+        self.finished.emit(summary)
+
+
+class RecordingIndexer(QObject):
+    """Runs RecordingIndex.scan in a worker thread, one folder at a time.
+
+    Emits progress while scanning and scanned or failed at the end of each
+    scan that was not cancelled. Cancelled scans stop after their current
+    file and are joined when they report, or at the latest in shutdown().
+    """
+
+    progress = pyqtSignal(int, str)
+    scanned = pyqtSignal(object)  # ScanSummary
+    failed = pyqtSignal(str)
+
+    def __init__(self, index: RecordingIndex = recording_index, parent=None):
+        super().__init__(parent)
+        self._index = index
+        self._thread = None
+        self._worker = None
+        self._superseded = []  # (thread, worker) of cancelled scans that have not reported yet
+
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    def scan(self, folder: str) -> None:
+        self.cancel()
+        worker = _ScanWorker(self._index, folder)
+        thread = QThread(self)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.progress.connect(self._on_progress)
+        worker.finished.connect(self._on_finished)
+        worker.error.connect(self._on_error)
+        for done in (worker.finished, worker.error):
+            done.connect(thread.quit)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+
+        self._thread = thread
+        self._worker = worker
+        thread.start()
+
+    def cancel(self) -> None:
+        """Stop the running scan after the current file; what was indexed so far is kept."""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._superseded.append((self._thread, self._worker))
+            self._thread = None
+            self._worker = None
+
+    def shutdown(self) -> None:
+        """Cancel and wait for all workers, superseded ones included; called when the owning dialog closes."""
+        self.cancel()
+        superseded, self._superseded = self._superseded, []
+        for thread, _ in superseded:
+            try:
+                if thread.isRunning():
+                    thread.quit()
+                    thread.wait()
+            except RuntimeError:
+                pass  # C++ object already deleted — thread finished naturally
+
+    def _is_current(self) -> bool:
+        return self._worker is not None and self.sender() is self._worker
+
+    def _on_progress(self, percent: int, text: str):
+        if self._is_current():
+            self.progress.emit(percent, text)
+
+    def _release(self):
+        # The worker is done once it reports; join the thread so it never outlives its owner
+        self._thread.quit()
+        self._thread.wait()
+        self._thread = None
+        self._worker = None
+
+    def _reap(self, worker):
+        """Join the thread of a superseded scan once its worker has reported."""
+        for entry in self._superseded:
+            if entry[1] is worker:
+                self._superseded.remove(entry)
+                entry[0].quit()
+                entry[0].wait()
+                return
+
+    def _on_finished(self, summary: ScanSummary):
+        if self._is_current():
+            self._release()
+            self.scanned.emit(summary)
+        else:
+            self._reap(self.sender())
+
+    def _on_error(self, message: str):
+        if self._is_current():
+            self._release()
+            self.failed.emit(message)
+        else:
+            self._reap(self.sender())
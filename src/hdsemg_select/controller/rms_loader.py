@@ -5,16 +5,36 @@ Loads and parses companion _rms.json files containing channel quality metrics.
 """
 import json
 import os
+import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 from hdsemg_select._log.log_config import logger
 from hdsemg_select.ui.labels.base_labels import BaseChannelLabel
 
 
+_LABEL_MAP = {
+    "excellent": BaseChannelLabel.RMS_EXCELLENT.value,
+    "good": BaseChannelLabel.RMS_GOOD.value,
+    "ok": BaseChannelLabel.RMS_OK.value,
+}
+
+# "8mm_5x13", "8 mm 5x13_2", ... as generated by hdsemg-shared
+_DIMENSION_KEY = re.compile(r"^(\d+(?:\.\d+)?)\s*mm[\s_-]*(\d+)\s*x\s*(\d+)(?:[\s_-]+(\d+))?$")
+# OT Bioelettronica model codes: <2-letter series><ied>MM<rows><cols>, e.g. "HD08MM1305", "GR08MM1305"
+# (same shape as the codes recognised in channel descriptions, see ui.electrode_layout)
+_MODEL_CODE = re.compile(r"^[a-z]{2}(\d+)mm(\d{2})(\d{2})(?:[\s_-]+(\d+))?$")
+
+_CACHE_SIZE = 64
+
+
 class RMSData:
     """Container for RMS quality data for a single channel."""
 
+    __slots__ = ("channel_number", "rms_label", "rms_quality")
+
     def __init__(self, channel_number: int, rms_label: str, rms_quality: str):
         self.channel_number = channel_number  # 0-indexed from JSON
         self.rms_label = rms_label  # "excellent", "good", "ok"
@@ -22,16 +42,80 @@ class RMSData:
 
     def get_base_label(self) -> Optional[dict]:
         """Convert rms_label string to BaseChannelLabel value dict."""
-        label_map = {
-            "excellent": BaseChannelLabel.RMS_EXCELLENT.value,
-            "good": BaseChannelLabel.RMS_GOOD.value,
-            "ok": BaseChannelLabel.RMS_OK.value,
-        }
-        return label_map.get(self.rms_label.lower())
+        return _LABEL_MAP.get(self.rms_label.lower())
+
+
+def normalize_grid_key(grid_key: str) -> Optional[Tuple[float, int, int, int]]:
+    """(inter-electrode distance in mm, rows, columns, instance) described by *grid_key*, or None.
+
+    Understands the keys generated by hdsemg-shared ("8mm_5x13", "8mm_5x13_2")
+    and OT Bioelettronica model codes of any series ("HD08MM1305", "GR08MM1305"). The instance is 1
+    unless the key carries a numeric suffix.
+    """
+    key = grid_key.lower().strip()
+    match = _DIMENSION_KEY.match(key) or _MODEL_CODE.match(key)
+    if match is None:
+        return None
+    ied, rows, cols, instance = match.groups()
+    ied = float(ied)
+    return (int(ied) if ied.is_integer() else ied), int(rows), int(cols), int(instance or 1)
+
+
+class RMSSidecar(dict):
+    """Parsed _rms.json: grid_key -> {channel_number: RMSData}, with an index for matching grid keys.
+
+    The index is built once, so find() costs a few dictionary lookups
+    however many grids the file lists.
+    """
+
+    def __init__(self, grids: Dict[str, Dict[int, RMSData]]):
+        super().__init__(grids)
+        self._by_name = {}
+        self._by_geometry = {}
+        self._by_footprint = {}  # rows and columns in either order
+        for rms_grid_key in self:
+            self._by_name.setdefault(rms_grid_key.lower().strip(), rms_grid_key)
+            geometry = normalize_grid_key(rms_grid_key)
+            if geometry is not None:
+                self._by_geometry.setdefault(geometry, rms_grid_key)
+                self._by_footprint.setdefault(self._footprint(geometry), rms_grid_key)
+
+    @staticmethod
+    def _footprint(geometry: tuple) -> tuple:
+        ied, rows, cols, instance = geometry
+        return ied, min(rows, cols), max(rows, cols), instance
+
+    def find_key(self, emg_grid_key: str) -> Optional[str]:
+        """The RMS grid key matching *emg_grid_key*: exact, same geometry, or same geometry transposed.
+
+        If the file lists a grid in both orientations, the one with the same orientation is used.
+        """
+        rms_grid_key = self._by_name.get(emg_grid_key.lower().strip())
+        if rms_grid_key is not None:
+            return rms_grid_key
+        geometry = normalize_grid_key(emg_grid_key)
+        if geometry is None:
+            return None
+        rms_grid_key = self._by_geometry.get(geometry)
+        if rms_grid_key is not None:
+            return rms_grid_key
+        return self._by_footprint.get(self._footprint(geometry))
+
+    def find(self, emg_grid_key: str) -> Optional[Dict[int, RMSData]]:
+        rms_grid_key = self.find_key(emg_grid_key)
+        return self[rms_grid_key] if rms_grid_key is not None else None
 
 
 class RMSLoader:
-    """Loads RMS quality data from companion _rms.json files."""
+    """Loads RMS quality data from companion _rms.json files.
+
+    Parsed files are cached on their path, size and modification time, so
+    re-opening a recording (or several recordings sharing a sidecar) parses
+    each sidecar once.
+    """
+
+    _cache: "OrderedDict[str, Tuple[int, int, RMSSidecar]]" = OrderedDict()
+    _cache_lock = threading.Lock()
 
     @staticmethod
     def get_rms_file_path(data_file_path: str) -> str:
@@ -47,12 +131,13 @@ class RMSLoader:
         return str(rms_path)
 
     @staticmethod
-    def load_rms_file(data_file_path: str) -> Optional[Dict[str, Dict[int, RMSData]]]:
+    def load_rms_file(data_file_path: str) -> Optional[RMSSidecar]:
         """
         Loads the companion RMS file if it exists.
 
         Returns:
-            Dict mapping grid_key -> {channel_number: RMSData} or None if file not found
+            RMSSidecar mapping grid_key -> {channel_number: RMSData} or None if file not found.
+            The result is shared between callers and must not be modified.
         """
         rms_path = RMSLoader.get_rms_file_path(data_file_path)
 
@@ -60,11 +145,25 @@ class RMSLoader:
             logger.debug(f"No RMS file found at {rms_path}")
             return None
 
+        cache_key = os.path.abspath(rms_path)
         try:
+            stat = os.stat(rms_path)
+            with RMSLoader._cache_lock:
+                cached = RMSLoader._cache.get(cache_key)
+                if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                    RMSLoader._cache.move_to_end(cache_key)
+                    return cached[2]
+
             with open(rms_path, "r", encoding="utf-8") as f:
                 data = json.load(f)
 
-            return RMSLoader._parse_rms_data(data)
+            sidecar = RMSLoader._parse_rms_data(data)
+            with RMSLoader._cache_lock:
+                RMSLoader._cache[cache_key] = (stat.st_mtime_ns, stat.st_size, sidecar)
+                RMSLoader._cache.move_to_end(cache_key)
+                while len(RMSLoader._cache) > _CACHE_SIZE:
+                    RMSLoader._cache.popitem(last=False)
+            return sidecar
 
         except json.JSONDecodeError as e:
             logger.warning(f"Invalid JSON in RMS file {rms_path}: {e}")
@@ -74,7 +173,7 @@ class RMSLoader:
             return None
 
     @staticmethod
-    def _parse_rms_data(data: dict) -> Dict[str, Dict[int, RMSData]]:
+    def _parse_rms_data(data: dict) -> RMSSidecar:
         """
         Parses the RMS JSON structure into RMSData objects.
 
@@ -108,21 +207,28 @@ class RMSLoader:
                         f"Invalid channel data for grid {grid_key}, channel {channel_str}: {e}"
                     )
 
-        return result
+        return RMSSidecar(result)
 
     @staticmethod
     def match_grid_key(rms_grid_key: str, emg_grid_key: str) -> bool:
         """
         Determines if an RMS grid key matches an EMG file grid key.
 
-        This handles potential naming variations between systems.
-        Simple exact match for now, can be extended for fuzzy matching.
+        This handles naming variations between systems: keys match if they are
+        equal ignoring case and whitespace, or if both describe the same grid
+        geometry (e.g. "8mm_5x13" and "HD08MM1305"), in either orientation.
         """
         # Normalize: lowercase and strip whitespace
         rms_normalized = rms_grid_key.lower().strip()
         emg_normalized = emg_grid_key.lower().strip()
+        if rms_normalized == emg_normalized:
+            return True
 
-        return rms_normalized == emg_normalized
+        rms_geometry = normalize_grid_key(rms_grid_key)
+        emg_geometry = normalize_grid_key(emg_grid_key)
+        if rms_geometry is None or emg_geometry is None:
+            return False
+        return RMSSidecar._footprint(rms_geometry) == RMSSidecar._footprint(emg_geometry)
 
     @staticmethod
     def find_matching_grid(
@@ -133,9 +239,9 @@ class RMSLoader:
 
         Returns the RMS channel data dict for the matching grid, or None.
         """
-        for rms_grid_key, channel_data in rms_data.items():
-            if RMSLoader.match_grid_key(rms_grid_key, emg_grid_key):
-                return channel_data
-
-        logger.debug(f"No RMS grid match found for EMG grid '{emg_grid_key}'")
-        return None
+        if not isinstance(rms_data, RMSSidecar):
+            rms_data = RMSSidecar(rms_data)
+        channel_data = rms_data.find(emg_grid_key)
+        if channel_data is None:
+            logger.debug(f"No RMS grid match found for EMG grid '{emg_grid_key}'")
+        return channel_data
@@ -0,0 +1,316 @@
+import importlib.util
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from hdsemg_select._log.log_config import logger
+from hdsemg_select.controller.decoded_cache import description_text
+from hdsemg_select.state.enum.layout_mode_enums import FiberMode, LayoutMode
+
+# Encodings of the selection sidecar written next to the .mat file
+FORMAT_JSON = "json"            # nested, human-readable schema (default)
+FORMAT_COLUMNAR = "columnar"    # columnar schema as compact JSON
+FORMAT_NPZ = "npz"              # columnar schema as NumPy arrays
+FORMAT_MSGPACK = "msgpack"      # columnar schema as MessagePack (needs the msgpack package)
+DEFAULT_FORMAT = FORMAT_JSON
+
+COLUMNAR_SCHEMA = "hdsemg-select/selection-columnar"
+COLUMNAR_VERSION = 1
+
+_UNKNOWN_LABEL_COLOR = "lightblue"  # LabelBeanWidget's default
+
+_EXTENSIONS = {
+    FORMAT_JSON: ".json",
+    FORMAT_COLUMNAR: ".json",
+    FORMAT_NPZ: ".npz",
+    FORMAT_MSGPACK: ".msgpack",
+}
+
+
+def msgpack_available() -> bool:
+    return importlib.util.find_spec("msgpack") is not None
+
+
+def resolve_format(fmt: Optional[str]) -> str:
+    """*fmt* if it can be written here, otherwise the nearest format that can."""
+    if fmt not in _EXTENSIONS:
+        return DEFAULT_FORMAT
+    if fmt == FORMAT_MSGPACK and not msgpack_available():
+        logger.warning("msgpack is not installed; writing the selection as columnar JSON instead")
+        return FORMAT_COLUMNAR
+    return fmt
+
+
+def selection_extension(fmt: str) -> str:
+    return _EXTENSIONS[fmt]
+
+
+def layout_association(state) -> dict:
+    """The fiber → layout mapping of *state* as stored in the selection file."""
+    return {
+        "layout_mapping": {fiber.name.lower(): layout.name.lower() for fiber, layout in state.get_layout().items()},
+        "set_by_user": str(state.is_fiber_to_layout_user_set()),
+    }
+
+
+def description_texts(description, n_channels: int) -> List[str]:
+    """Description text of every channel, with a placeholder where the description is missing."""
+    texts = []
+    rows = description.shape[0] if isinstance(description, np.ndarray) else 0
+    for i in range(n_channels):
+        texts.append(description_text(description[i]) if i < rows else f"Channel {i + 1}")
+    return texts
+
+
+def build_columnar_selection(file_name: str, grids: list, channel_status: list, description,
+                             channel_labels: dict, layout: dict, source_file: Optional[str] = None,
+                             crop_range: Optional[tuple] = None,
+                             exported_channels: Optional[List[int]] = None) -> dict:
+    """The selection in the columnar schema.
+
+    Channels are stored as parallel arrays in channel order, so the position
+    in each array is the channel index. Labels are stored once in
+    ``label_names``; the labels of channel *i* are
+    ``label_ids[label_offsets[i]:label_offsets[i + 1]]``. *source_file* and
+    *crop_range* let a later session resume from the original recording.
+    *exported_channels* lists the channel indices written to the .mat saved
+    with the selection when it holds only some of them (None: all channels).
+    """
+    n = len(channel_status)
+    names, ids, offsets = {}, [], [0]
+    for i in range(n):
+        for label in (channel_labels or {}).get(i, []):
+            ids.append(names.setdefault(label["name"], len(names)))
+        offsets.append(len(ids))
+
+    grids_out = []
+    for grid in grids or []:
+        grids_out.append({
+            "grid_key": grid.grid_key,
+            "rows": grid.rows,
+            "columns": grid.cols,
+            "inter_electrode_distance_mm": grid.ied_mm,
+            "channel_indices": [int(i) for i in grid.emg_indices if i is not None],
+            "reference_indices": [int(i) for i in grid.ref_indices if i is not None and i < n],
+        })
+
+    return {
+        "schema": COLUMNAR_SCHEMA,
+        "schema_version": COLUMNAR_VERSION,
+        "filename": file_name or "unknown",
+        "source_file": source_file,
+        "crop_range": list(crop_range) if crop_range is not None else None,
+        "exported_channels": _index_list(exported_channels),
+        "layout": layout,
+        "channel_count": n,
+        "selected": [bool(s) for s in channel_status],
+        "description": description_texts(description, n),
+        "label_names": list(names),
+        "label_offsets": offsets,
+        "label_ids": ids,
+        "grids": grids_out,
+    }
+
+
+def _index_list(indices) -> Optional[List[int]]:
+    return [int(i) for i in indices] if indices is not None else None
+
+
+_NPZ_ARRAYS = ("selected", "description", "label_names", "label_offsets", "label_ids")
+
+
+def _columnar_to_npz(path: str, selection: dict) -> None:
+    meta = {k: v for k, v in selection.items() if k not in _NPZ_ARRAYS}
+    with open(path, "wb") as f:
+        np.savez(
+            f,
+            meta=np.array(json.dumps(meta)),
+            selected=np.asarray(selection["selected"], dtype=bool),
+            description=np.asarray(selection["description"], dtype=str),
+            label_names=np.asarray(selection["label_names"], dtype=str),
+            label_offsets=np.asarray(selection["label_offsets"], dtype=np.int32),
+            label_ids=np.asarray(selection["label_ids"], dtype=np.int32),
+        )
+
+
+def _columnar_from_npz(path: str) -> dict:
+    with np.load(path, allow_pickle=False) as npz:
+        selection = json.loads(npz["meta"].item())
+        for key in _NPZ_ARRAYS:
+            selection[key] = npz[key].tolist()
+    return selection
+
+
+def write_selection(path: str, selection: dict, fmt: str = DEFAULT_FORMAT) -> None:
+    """Write *selection* (as built for *fmt*) to *path*; the caller takes care of atomicity."""
+    if fmt == FORMAT_JSON:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(selection, f, indent=4)
+    elif fmt == FORMAT_COLUMNAR:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(selection, f, separators=(",", ":"))
+    elif fmt == FORMAT_NPZ:
+        _columnar_to_npz(path, selection)
+    elif fmt == FORMAT_MSGPACK:
+        import msgpack
+        with open(path, "wb") as f:
+            f.write(msgpack.packb(selection, use_bin_type=True))
+    else:
+        raise ValueError(f"Unknown selection format '{fmt}'")
+
+
+@dataclass
+class SavedSelection:
+    """Channel selection read back from a selection file, in any of the supported formats."""
+    file_name: str
+    channel_status: List[bool]
+    channel_labels: Dict[int, List[str]] = field(default_factory=dict)  # channel index → label names
+    descriptions: List[str] = field(default_factory=list)
+    layout: dict = field(default_factory=dict)
+    source_file: Optional[str] = None  # absolute path of the reviewed recording, if recorded
+    crop_range: Optional[tuple] = None  # (start, end) inclusive sample indices
+    exported_channels: Optional[List[int]] = None  # channels in the .mat saved with it, if not all
+
+    @property
+    def channel_count(self) -> int:
+        return len(self.channel_status)
+
+    def channel_map(self, n_channels: int) -> List[int]:
+        """The selection's channel index for each channel of a file with *n_channels* channels.
+
+        The identity for the recording the selection was made on, and
+        *exported_channels* for a .mat saved with only the selected channels.
+        Raises ValueError if the file matches neither.
+        """
+        if n_channels == self.channel_count:
+            return list(range(n_channels))
+        if self.exported_channels is not None and n_channels == len(self.exported_channels):
+            return list(self.exported_channels)
+        exported = f" ({len(self.exported_channels)} exported)" if self.exported_channels is not None else ""
+        raise ValueError(f"The selection has {self.channel_count} channels{exported}, the loaded file {n_channels}")
+
+
+def _crop(value) -> Optional[tuple]:
+    return (int(value[0]), int(value[1])) if value is not None else None
+
+
+def _from_columnar(selection: dict) -> SavedSelection:
+    names, ids, offsets = selection["label_names"], selection["label_ids"], selection["label_offsets"]
+    labels = {}
+    for i in range(len(offsets) - 1):
+        start, stop = offsets[i], offsets[i + 1]
+        if stop > start:
+            labels[i] = [names[j] for j in ids[start:stop]]
+    return SavedSelection(selection.get("filename"), [bool(s) for s in selection["selected"]], labels,
+                          list(selection.get("description", [])), selection.get("layout") or {},
+                          selection.get("source_file"), _crop(selection.get("crop_range")),
+                          _index_list(selection.get("exported_channels")))
+
+
+def _from_nested(selection: dict) -> SavedSelection:
+    channels = sorted(selection["total_channels_summary"], key=lambda ch: ch["channel_index"])
+    labels = {ch["channel_index"]: list(ch["labels"]) for ch in channels if ch.get("labels")}
+    return SavedSelection(selection.get("filename"), [bool(ch["selected"]) for ch in channels], labels,
+                          [ch.get("description", "") for ch in channels], selection.get("layout") or {},
+                          selection.get("source_file"), _crop(selection.get("crop_range")),
+                          _index_list(selection.get("exported_channels")))
+
+
+def read_selection(path: str) -> SavedSelection:
+    """Read a selection file written by save_selection, whatever its format.
+
+    Raises ValueError if the file is not a selection file.
+    """
+    lower = path.lower()
+    if lower.endswith(".npz"):
+        selection = _columnar_from_npz(path)
+    elif lower.endswith(".msgpack"):
+        import msgpack
+        with open(path, "rb") as f:
+            selection = msgpack.unpackb(f.read(), raw=False)
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            selection = json.load(f)
+
+    try:
+        if selection.get("schema") == COLUMNAR_SCHEMA:
+            if selection.get("schema_version", 1) > COLUMNAR_VERSION:
+                raise ValueError(f"{path} was written by a newer version of hdsemg-select")
+            return _from_columnar(selection)
+        return _from_nested(selection)
+    except (KeyError, TypeError, AttributeError) as e:
+        raise ValueError(f"{path} is not a channel selection file ({e})") from e
+
+
+def find_recording(selection: SavedSelection, selection_path: str) -> Optional[str]:
+    """The recording *selection* was made on, or None if it cannot be found.
+
+    Tries the recorded source path first, then a file of the original name
+    next to the selection file.
+    """
+    if selection.source_file and os.path.isfile(selection.source_file):
+        return selection.source_file
+    if selection.file_name:
+        candidate = os.path.join(os.path.dirname(os.path.abspath(selection_path)), selection.file_name)
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def is_exported_recording(recording: str, selection_path: str) -> bool:
+    """True if *recording* is the .mat written together with the selection file (already cropped)."""
+    return os.path.abspath(os.path.splitext(recording)[0]) == os.path.abspath(os.path.splitext(selection_path)[0])
+
+
+def _unknown_label(name: str, idx: int) -> dict:
+    """Complete label dict for a stored label name that is no longer available."""
+    logger.warning(f"Unknown label '{name}' on channel {idx}, restoring it with the default color")
+    # string ids never collide with the integer ids of the base labels and custom flags
+    return {"id": f"unknown:{name}", "name": name, "color": _UNKNOWN_LABEL_COLOR}
+
+
+def apply_selection(selection: SavedSelection, state, available_labels: list, restore_crop: bool = True) -> None:
+    """Restore channel status, labels, the fiber layout and the crop range of *selection* into *state*.
+
+    *available_labels* (label dicts as returned by
+    ConfigManager.get_available_channel_labels) supply the colors of the
+    stored label names; an unknown name (e.g. a custom flag deleted since)
+    gets the default label color and an id derived from its name. All updates
+    are announced as one change set. A crop range that does not fit the
+    loaded data is ignored. The loaded file may also be the selected-only
+    .mat saved with the selection (see SavedSelection.channel_map). Raises
+    ValueError if the channel count matches neither.
+    """
+    channel_map = selection.channel_map(len(state.get_channel_status()))
+    status = [selection.channel_status[i] for i in channel_map]
+    stored = {idx: selection.channel_labels[i] for idx, i in enumerate(channel_map) if i in selection.channel_labels}
+
+    by_name = {label["name"]: label for label in available_labels}
+    current = state.get_channel_labels()
+    with state.batch():
+        for idx in set(current) | set(stored):
+            labels = [by_name.get(name) or _unknown_label(name, idx) for name in stored.get(idx, [])]
+            if labels != current.get(idx, []):
+                state.update_channel_labels(idx, labels)
+        state.set_channel_status(status)
+
+    layout = selection.layout or {}
+    if str(layout.get("set_by_user")) == "True":
+        for fiber, mode in (layout.get("layout_mapping") or {}).items():
+            try:
+                state.set_fiber_layout(FiberMode[fiber.upper()], LayoutMode[mode.upper()])
+            except KeyError:
+                logger.warning(f"Ignoring unknown layout mapping {fiber} → {mode}")
+            break  # the other fiber mode follows automatically
+
+    if restore_crop and selection.crop_range is not None:
+        start, end = selection.crop_range
+        emg_file = state.get_emg_file()
+        n_samples = emg_file.data.shape[0] if emg_file is not None and emg_file.data is not None else 0
+        if 0 <= start <= end < n_samples:
+            state.set_crop_range((start, end))
+        else:
+            logger.warning(f"Ignoring crop range {selection.crop_range} for data with {n_samples} samples")
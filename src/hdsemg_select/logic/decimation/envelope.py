@@ -0,0 +1,109 @@
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+import numpy as np
+
+_DEFAULT_MAX_ENTRIES = 128
+
+
+def m4_decimate(
+    signal: np.ndarray,
+    n_buckets: int,
+    start: int = 0,
+    end: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Min/max (M4) envelope of signal[start:end] for line plots.
+
+    The range is split into *n_buckets* equal buckets; for each bucket the
+    first, minimum, maximum and last samples are kept in time order. Drawn as
+    a polyline this is pixel-identical to the raw signal when the plot is
+    *n_buckets* pixels wide, and unlike plain striding it never drops peaks.
+
+    Returns (sample_indices, values); indices are absolute positions in
+    *signal*. Ranges with at most 4 · n_buckets samples are returned as is.
+    """
+    n_total = len(signal)
+    end = n_total if end is None else min(int(end), n_total)
+    start = max(0, int(start))
+    n = end - start
+    if n <= 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=float)
+    n_buckets = max(1, int(n_buckets))
+    if n <= 4 * n_buckets:
+        idx = np.arange(start, end, dtype=np.int64)
+        return idx, np.asarray(signal[start:end])
+
+    bucket = -(-n // n_buckets)  # ceil
+    n_full = n // bucket
+    seg = np.asarray(signal[start:start + n_full * bucket]).reshape(n_full, bucket)
+    offsets = start + np.arange(n_full, dtype=np.int64) * bucket
+    picks = np.stack([
+        offsets,
+        offsets + np.argmin(seg, axis=1),
+        offsets + np.argmax(seg, axis=1),
+        offsets + bucket - 1,
+    ], axis=1)
+
+    tail_start = start + n_full * bucket
+    if tail_start < end:
+        tail = np.asarray(signal[tail_start:end])
+        tail_picks = np.array([[
+            tail_start,
+            tail_start + int(np.argmin(tail)),
+            tail_start + int(np.argmax(tail)),
+            end - 1,
+        ]], dtype=np.int64)
+        picks = np.concatenate([picks, tail_picks], axis=0)
+
+    picks.sort(axis=1)
+    idx = picks.ravel()
+    return idx, np.asarray(signal[idx])
+
+
+class EnvelopeCache:
+    """LRU cache of M4 envelopes keyed by (channel key, range, bucket count).
+
+    *channel_key* is chosen by the caller and must identify the signal
+    (e.g. file path, channel index and crop range). Zooming re-decimates the
+    visible range; returning to a previous view is served from the cache.
+    """
+
+    def __init__(self, max_entries: int = _DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(
+        self,
+        channel_key: Hashable,
+        signal: np.ndarray,
+        n_buckets: int,
+        start: int = 0,
+        end: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        end = len(signal) if end is None else min(int(end), len(signal))
+        start = max(0, int(start))
+        key = (channel_key, start, end, int(n_buckets))
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit is not None:
+                self._entries.move_to_end(key)
+                return hit
+        value = m4_decimate(signal, n_buckets, start, end)
+        with self._lock:
+            self._entries[key] = value
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+envelope_cache = EnvelopeCache()
@@ -0,0 +1,180 @@
+import threading
+from collections import OrderedDict
+from typing import List, Tuple
+
+import numpy as np
+
+from hdsemg_select.logic.decimation.envelope import m4_decimate
+
+_DEFAULT_BASE_BLOCK = 64
+_DEFAULT_FACTOR = 4
+_DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class MinMaxPyramid:
+    """Multi-level block min/max summary of a 1-D signal for pixel-aware plotting.
+
+    Level 0 stores the min and max of every *base_block* samples, each
+    further level merges *factor* blocks of the previous one. A view of any
+    sample range at a given pixel width is answered from the coarsest level
+    whose blocks are still narrower than one pixel, so zooming and panning
+    cost O(pixels) instead of O(samples). Ranges with fewer samples per pixel
+    than *base_block* are decimated from the raw signal (bounded by
+    base_block · pixels samples).
+
+    The pyramid needs about 2.7 / base_block bytes per input byte.
+    """
+
+    def __init__(self, signal: np.ndarray, base_block: int = _DEFAULT_BASE_BLOCK,
+                 factor: int = _DEFAULT_FACTOR):
+        if signal.ndim != 1:
+            raise ValueError("MinMaxPyramid expects a 1-D signal")
+        if base_block < 1 or factor < 2:
+            raise ValueError("base_block must be >= 1 and factor >= 2")
+        self.signal = signal
+        self.base_block = int(base_block)
+        self.factor = int(factor)
+        self.block_sizes: List[int] = []
+        self.mins: List[np.ndarray] = []
+        self.maxs: List[np.ndarray] = []
+        self._build()
+
+    def __len__(self) -> int:
+        return len(self.signal)
+
+    def _build(self) -> None:
+        n = len(self.signal)
+        if n == 0:
+            return
+        n_blocks = -(-n // self.base_block)
+        padded = n_blocks * self.base_block
+        src = np.asarray(self.signal)
+        if padded != n:
+            # Pad with the edge value so the last partial block keeps its true extrema
+            src = np.concatenate([src, np.full(padded - n, src[-1], dtype=src.dtype)])
+        blocks = src.reshape(n_blocks, self.base_block)
+        mins, maxs = blocks.min(axis=1), blocks.max(axis=1)
+        block = self.base_block
+        while True:
+            self.block_sizes.append(block)
+            self.mins.append(mins)
+            self.maxs.append(maxs)
+            if len(mins) <= 1:
+                break
+            n_next = -(-len(mins) // self.factor)
+            pad = n_next * self.factor - len(mins)
+            if pad:
+                mins = np.concatenate([mins, np.full(pad, mins[-1], dtype=mins.dtype)])
+                maxs = np.concatenate([maxs, np.full(pad, maxs[-1], dtype=maxs.dtype)])
+            mins = mins.reshape(n_next, self.factor).min(axis=1)
+            maxs = maxs.reshape(n_next, self.factor).max(axis=1)
+            block *= self.factor
+
+    @property
+    def nbytes(self) -> int:
+        return sum(m.nbytes for m in self.mins) + sum(m.nbytes for m in self.maxs)
+
+    def extent(self) -> Tuple[float, float]:
+        """(min, max) of the whole signal, read from the top level."""
+        if not self.mins:
+            return 0.0, 0.0
+        return float(self.mins[-1].min()), float(self.maxs[-1].max())
+
+    def envelope(self, start: int, end: int, n_pixels: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Min/max envelope of signal[start:end] for a view *n_pixels* wide.
+
+        Returns (sample_indices, values) in the same form as m4_decimate:
+        every pixel column gets its minimum and maximum, and the first and
+        last samples of the range are always included.
+        """
+        n = len(self.signal)
+        start = max(0, int(start))
+        end = min(n, int(end))
+        if end <= start:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=float)
+        n_pixels = max(1, int(n_pixels))
+        samples_per_pixel = (end - start) / n_pixels
+
+        level = -1
+        for i, block in enumerate(self.block_sizes):
+            if block <= samples_per_pixel:
+                level = i
+            else:
+                break
+        if level < 0:
+            return m4_decimate(self.signal, n_pixels, start, end)
+
+        block = self.block_sizes[level]
+        b0 = start // block
+        b1 = -(-end // block)
+        edges = np.unique(np.linspace(b0, b1, n_pixels + 1).astype(np.int64))
+        bucket_starts = edges[:-1]
+        mins = np.minimum.reduceat(self.mins[level][b0:b1], bucket_starts - b0)
+        maxs = np.maximum.reduceat(self.maxs[level][b0:b1], bucket_starts - b0)
+
+        first = np.clip(bucket_starts * block, start, end - 1)
+        mid = np.clip((bucket_starts + edges[1:]) * block // 2, start, end - 1)
+        idx = np.empty(2 * len(first) + 2, dtype=np.int64)
+        values = np.empty(2 * len(first) + 2, dtype=np.result_type(mins.dtype, float))
+        idx[0], values[0] = start, self.signal[start]
+        idx[1:-1:2], values[1:-1:2] = first, mins
+        idx[2:-1:2], values[2:-1:2] = mid, maxs
+        idx[-1], values[-1] = end - 1, self.signal[end - 1]
+        return idx, values
+
+
+def _signal_token(signal: np.ndarray) -> tuple:
+    iface = signal.__array_interface__
+    return iface["data"][0], signal.shape, signal.strides, signal.dtype.str
+
+
+class PyramidCache:
+    """Byte-bounded LRU of MinMaxPyramids keyed by the identity of the signal's memory.
+
+    Column views such as ``data[:, ch]`` are created anew on every access;
+    they are matched by data pointer, shape, strides and dtype, so every view
+    of the same column shares one pyramid. Entries keep their signal alive,
+    which prevents the memory (and thus the key) from being reused while the
+    entry exists. Signals must not be modified in place after caching.
+    """
+
+    def __init__(self, max_bytes: int = _DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[tuple, MinMaxPyramid]" = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        with self._lock:
+            return self._nbytes
+
+    def get(self, signal: np.ndarray) -> MinMaxPyramid:
+        signal = np.asarray(signal)
+        key = _signal_token(signal)
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit is not None:
+                self._entries.move_to_end(key)
+                return hit
+        pyramid = MinMaxPyramid(signal)
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = pyramid
+                self._nbytes += pyramid.nbytes
+            while self._nbytes > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._nbytes -= evicted.nbytes
+        return pyramid
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+
+pyramid_cache = PyramidCache()
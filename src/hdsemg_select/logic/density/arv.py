@@ -27,7 +27,25 @@ def compute_arv_window(
     end = min(data.shape[0], center_sample + half + 1)
     if start >= end:
         return np.zeros(data.shape[1], dtype=float)
-    return np.mean(np.abs(data[start:end, :]), axis=0)
+    return np.mean(np.abs(data[start:end, :]), axis=0, dtype=np.float64)
+
+
+def compute_rms_window(
+    data: np.ndarray,
+    center_sample: int,
+    window_samples: int,
+) -> np.ndarray:
+    """Return the RMS vector for a centered window around *center_sample*.
+
+    Uses the same window and boundary clamping as compute_arv_window.
+    """
+    half = window_samples // 2
+    start = max(0, center_sample - half)
+    end = min(data.shape[0], center_sample + half + 1)
+    if start >= end:
+        return np.zeros(data.shape[1], dtype=float)
+    seg = np.asarray(data[start:end, :])
+    return np.sqrt(np.mean(np.square(seg), axis=0, dtype=np.float64))
 
 
 def channels_to_grid(
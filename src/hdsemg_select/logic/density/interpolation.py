@@ -0,0 +1,103 @@
+from typing import Optional
+
+import numpy as np
+from scipy import sparse
+
+_DEFAULT_UPSAMPLE = 8
+
+
+def build_interpolation_matrix(valid_mask: np.ndarray, upsample: int = _DEFAULT_UPSAMPLE) -> sparse.csr_matrix:
+    """Sparse bilinear interpolation from electrode cells to an upsampled map.
+
+    valid_mask:  (rows, cols) bool; True where the cell holds a usable value.
+                 Empty electrode positions and deselected channels are False.
+    upsample:    output pixels per cell along each axis
+
+    Returns a (rows·up · cols·up, rows·cols) CSR matrix M such that
+    ``(M @ grid.ravel()).reshape(rows·up, cols·up)`` is the smooth map for a
+    (rows, cols) value grid. Each output pixel is a bilinear blend of the
+    four surrounding cell centres; invalid neighbours are dropped and the
+    remaining weights renormalised. Pixels without any valid neighbour take
+    the value of the nearest valid cell, so gaps in the layout are filled.
+    Invalid cells are never read, so they may contain NaN.
+    """
+    valid_mask = np.asarray(valid_mask, dtype=bool)
+    rows, cols = valid_mask.shape
+    up = max(1, int(upsample))
+    out_rows, out_cols = rows * up, cols * up
+    n_out = out_rows * out_cols
+    if not valid_mask.any():
+        return sparse.csr_matrix((n_out, rows * cols), dtype=float)
+
+    # Output pixel centres in cell coordinates (cell centres at integers)
+    y = np.clip((np.arange(out_rows) + 0.5) / up - 0.5, 0, rows - 1)
+    x = np.clip((np.arange(out_cols) + 0.5) / up - 0.5, 0, cols - 1)
+    yy, xx = np.meshgrid(y, x, indexing="ij")
+    yy, xx = yy.ravel(), xx.ravel()
+    r0 = np.floor(yy).astype(int)
+    c0 = np.floor(xx).astype(int)
+    r1 = np.minimum(r0 + 1, rows - 1)
+    c1 = np.minimum(c0 + 1, cols - 1)
+    fy = yy - r0
+    fx = xx - c0
+
+    neighbours = [
+        (r0, c0, (1 - fy) * (1 - fx)),
+        (r0, c1, (1 - fy) * fx),
+        (r1, c0, fy * (1 - fx)),
+        (r1, c1, fy * fx),
+    ]
+    pixel = np.arange(n_out)
+    row_idx, col_idx, weights = [], [], []
+    weight_sum = np.zeros(n_out)
+    for r, c, w in neighbours:
+        keep = valid_mask[r, c] & (w > 0)
+        row_idx.append(pixel[keep])
+        col_idx.append((r * cols + c)[keep])
+        weights.append(w[keep])
+        weight_sum += np.where(keep, w, 0.0)
+
+    row_idx = np.concatenate(row_idx)
+    col_idx = np.concatenate(col_idx)
+    weights = np.concatenate(weights) / weight_sum[row_idx]
+
+    # Pixels surrounded only by invalid cells: nearest valid cell
+    orphans = np.flatnonzero(weight_sum == 0)
+    if orphans.size:
+        vr, vc = np.nonzero(valid_mask)
+        d2 = (yy[orphans, None] - vr[None, :]) ** 2 + (xx[orphans, None] - vc[None, :]) ** 2
+        nearest = np.argmin(d2, axis=1)
+        row_idx = np.concatenate([row_idx, orphans])
+        col_idx = np.concatenate([col_idx, vr[nearest] * cols + vc[nearest]])
+        weights = np.concatenate([weights, np.ones(orphans.size)])
+
+    return sparse.csr_matrix((weights, (row_idx, col_idx)), shape=(n_out, rows * cols))
+
+
+class GridInterpolator:
+    """Caches the interpolation matrix for the current layout and mask."""
+
+    def __init__(self, upsample: int = _DEFAULT_UPSAMPLE):
+        self.upsample = upsample
+        self._matrix: Optional[sparse.csr_matrix] = None
+        self._key: Optional[tuple] = None
+
+    def interpolate(self, grid_values: np.ndarray, valid_mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Return the (rows·up, cols·up) smooth map for *grid_values*.
+
+        valid_mask defaults to the non-NaN cells of *grid_values*. The matrix
+        is rebuilt only when the mask (or grid shape) changes.
+        """
+        if valid_mask is None:
+            valid_mask = ~np.isnan(grid_values)
+        valid_mask = np.asarray(valid_mask, dtype=bool) & ~np.isnan(grid_values)
+        key = (valid_mask.shape, valid_mask.tobytes())
+        if key != self._key:
+            self._matrix = build_interpolation_matrix(valid_mask, self.upsample)
+            self._key = key
+        rows, cols = grid_values.shape
+        flat = np.where(valid_mask, grid_values, 0.0).ravel()
+        out = self._matrix @ flat
+        if not valid_mask.any():
+            out[:] = np.nan
+        return out.reshape(rows * self.upsample, cols * self.upsample)
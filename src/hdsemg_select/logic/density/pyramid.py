@@ -0,0 +1,150 @@
+from typing import Optional, Sequence
+
+import numpy as np
+
+_BASE_BLOCK = 16      # samples per block at the finest level
+_LEVEL_FACTOR = 4     # each level aggregates this many blocks of the level below
+_MIN_TOP_BLOCKS = 4   # stop adding levels once a level would have fewer blocks
+_BUILD_CHUNK_BLOCKS = 4096  # finest-level blocks rectified per build step
+
+
+class AmplitudePyramid:
+    """Multi-resolution block sums of |x| and x² for fast ARV/RMS windows.
+
+    Level k stores per-channel sums over consecutive blocks of
+    ``base_block * factor**k`` samples. A window sum is assembled from the
+    coarsest blocks that fit inside it, refined level by level towards the
+    edges, plus fewer than ``base_block`` raw samples on each side. A lookup
+    therefore touches O(levels · factor) blocks regardless of window length.
+
+    data:     shape (n_samples, n_channels); kept by reference for the edges
+    columns:  data columns to aggregate (default: all). Results are returned
+              as full-length vectors with zeros for columns not aggregated.
+    """
+
+    def __init__(
+        self,
+        data: np.ndarray,
+        columns: Optional[Sequence[int]] = None,
+        base_block: int = _BASE_BLOCK,
+        factor: int = _LEVEL_FACTOR,
+    ):
+        self._data = data
+        self.n_samples, self.n_channels = data.shape
+        if columns is None:
+            columns = range(self.n_channels)
+        self.columns = np.asarray([c for c in columns if 0 <= c < self.n_channels], dtype=int)
+        self._all_columns = len(self.columns) == self.n_channels and np.array_equal(
+            self.columns, np.arange(self.n_channels)
+        )
+        self.base_block = max(1, int(base_block))
+        self.factor = max(2, int(factor))
+
+        # levels[k] = (block_size, abs_sums, sq_sums), sums shaped (n_blocks, n_columns)
+        self.levels: list = []
+        abs_sums, sq_sums = self._build_base_level()
+        block = self.base_block
+        while True:
+            self.levels.append((block, abs_sums, sq_sums))
+            n_next = abs_sums.shape[0] // self.factor
+            if n_next < _MIN_TOP_BLOCKS:
+                break
+            trim = n_next * self.factor
+            abs_sums = abs_sums[:trim].reshape(n_next, self.factor, -1).sum(axis=1)
+            sq_sums = sq_sums[:trim].reshape(n_next, self.factor, -1).sum(axis=1)
+            block *= self.factor
+
+    @property
+    def nbytes(self) -> int:
+        return sum(a.nbytes + s.nbytes for _, a, s in self.levels)
+
+    def _raw(self, start: int, end: int) -> np.ndarray:
+        seg = self._data[start:end]
+        if self._all_columns:
+            return np.asarray(seg)
+        return np.asarray(seg[:, self.columns])
+
+    def _build_base_level(self):
+        b = self.base_block
+        n_blocks = self.n_samples // b
+        n_cols = len(self.columns)
+        abs_sums = np.empty((n_blocks, n_cols), dtype=np.float64)
+        sq_sums = np.empty((n_blocks, n_cols), dtype=np.float64)
+        for i0 in range(0, n_blocks, _BUILD_CHUNK_BLOCKS):
+            i1 = min(n_blocks, i0 + _BUILD_CHUNK_BLOCKS)
+            seg = self._raw(i0 * b, i1 * b).reshape(i1 - i0, b, n_cols)
+            abs_sums[i0:i1] = np.abs(seg).sum(axis=1, dtype=np.float64)
+            sq_sums[i0:i1] = np.square(seg).sum(axis=1, dtype=np.float64)
+        return abs_sums, sq_sums
+
+    def window_sums(self, start: int, end: int):
+        """Return (sum |x|, sum x²) per aggregated column over samples [start, end)."""
+        start = max(0, int(start))
+        end = min(self.n_samples, int(end))
+        n_cols = len(self.columns)
+        abs_total = np.zeros(n_cols, dtype=np.float64)
+        sq_total = np.zeros(n_cols, dtype=np.float64)
+        if start >= end:
+            return abs_total, sq_total
+
+        pending = [(start, end)]
+        for block, abs_sums, sq_sums in reversed(self.levels):
+            refined = []
+            for s, e in pending:
+                i0 = -(-s // block)  # ceil
+                i1 = min(e // block, abs_sums.shape[0])
+                if i0 >= i1:
+                    refined.append((s, e))
+                    continue
+                abs_total += abs_sums[i0:i1].sum(axis=0)
+                sq_total += sq_sums[i0:i1].sum(axis=0)
+                if s < i0 * block:
+                    refined.append((s, i0 * block))
+                if i1 * block < e:
+                    refined.append((i1 * block, e))
+            pending = refined
+
+        for s, e in pending:
+            seg = self._raw(s, e)
+            abs_total += np.abs(seg).sum(axis=0, dtype=np.float64)
+            sq_total += np.square(seg).sum(axis=0, dtype=np.float64)
+        return abs_total, sq_total
+
+    def _centered_range(self, center_sample: int, window_samples: int):
+        # Same clamping as compute_arv_window
+        half = window_samples // 2
+        start = max(0, center_sample - half)
+        end = min(self.n_samples, center_sample + half + 1)
+        return start, end
+
+    def _expand(self, values: np.ndarray) -> np.ndarray:
+        if self._all_columns:
+            return values
+        full = np.zeros(self.n_channels, dtype=np.float64)
+        full[self.columns] = values
+        return full
+
+    def arv(self, center_sample: int, window_samples: int) -> np.ndarray:
+        """ARV vector for a centered window; equivalent to compute_arv_window."""
+        start, end = self._centered_range(center_sample, window_samples)
+        if start >= end:
+            return np.zeros(self.n_channels, dtype=float)
+        abs_sum, _ = self.window_sums(start, end)
+        return self._expand(abs_sum / (end - start))
+
+    def rms(self, center_sample: int, window_samples: int) -> np.ndarray:
+        """RMS vector for a centered window; equivalent to compute_rms_window."""
+        start, end = self._centered_range(center_sample, window_samples)
+        if start >= end:
+            return np.zeros(self.n_channels, dtype=float)
+        _, sq_sum = self.window_sums(start, end)
+        return self._expand(np.sqrt(np.maximum(sq_sum, 0.0) / (end - start)))
+
+    def mean(self, metric: str = "ARV") -> np.ndarray:
+        """Whole-recording ARV or RMS vector; equivalent to summary.mean_amplitude."""
+        if self.n_samples == 0:
+            return np.zeros(self.n_channels, dtype=float)
+        abs_sum, sq_sum = self.window_sums(0, self.n_samples)
+        if metric == "RMS":
+            return self._expand(np.sqrt(np.maximum(sq_sum, 0.0) / self.n_samples))
+        return self._expand(abs_sum / self.n_samples)
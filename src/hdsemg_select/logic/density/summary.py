@@ -0,0 +1,183 @@
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from hdsemg_select.logic.density.arv import ms_to_samples
+
+_DEFAULT_CHUNK_SAMPLES = 65_536
+_METRICS = ("ARV", "RMS")
+
+
+@dataclass
+class GridMapSpec:
+    """What is needed to turn per-channel values into a map for one grid.
+
+    display_grid:  (rows, cols) array of local electrode indices, NaN = empty
+    emg_indices:   local electrode index → data column
+    """
+    grid_key: str
+    display_grid: np.ndarray
+    emg_indices: list
+
+
+@dataclass
+class GridAmplitudeSummary:
+    """Amplitude maps of one grid over a fixed, non-overlapping window grid.
+
+    maps[k] covers samples [window_starts[k], window_starts[k] + window_samples).
+    A trailing partial window is not part of *maps* but is included in
+    *mean_map*, which summarises the whole recording (ARV: mean |x|,
+    RMS: sqrt(mean x²)).
+    """
+    grid_key: str
+    metric: str
+    window_samples: int
+    window_starts: np.ndarray
+    maps: np.ndarray       # (n_windows, rows, cols)
+    mean_map: np.ndarray   # (rows, cols)
+
+
+def grid_map_specs(emg_file) -> list:
+    """Build a GridMapSpec for every grid of *emg_file*.
+
+    Uses the physical layout from ui.electrode_layout when the electrode model
+    is known and falls back to row-major channel order otherwise.
+    """
+    from hdsemg_select.ui.electrode_layout import electrode_model_code, get_display_grid
+
+    specs = []
+    for grid in emg_file.grids:
+        emg_indices = list(grid.emg_indices)
+        name = grid.model_code or electrode_model_code(emg_file.description, emg_indices)
+        display_grid = get_display_grid(name, grid.rows, grid.cols) if name else None
+        if display_grid is None:
+            n_cells = grid.rows * grid.cols
+            local = np.arange(n_cells, dtype=float)
+            local[local >= len(emg_indices)] = np.nan
+            display_grid = local.reshape(grid.rows, grid.cols)
+        specs.append(GridMapSpec(grid.grid_key, display_grid, emg_indices))
+    return specs
+
+
+def mean_amplitude(
+    data: np.ndarray,
+    columns: Sequence[int],
+    metric: str = "ARV",
+    chunk_samples: int = _DEFAULT_CHUNK_SAMPLES,
+) -> np.ndarray:
+    """Whole-recording ARV (mean |x|) or RMS (sqrt(mean x²)) per channel.
+
+    Only the totals of *columns* are accumulated, so this is the cheap way to
+    get GridAmplitudeSummary.mean_map without the per-window maps. Returns a
+    full-length vector with zeros for columns not requested, like
+    AmplitudePyramid.
+    """
+    if metric not in _METRICS:
+        raise ValueError(f"Unknown metric '{metric}', expected one of {_METRICS}.")
+
+    n_samples, n_channels = data.shape
+    columns = sorted({c for c in columns if 0 <= c < n_channels})
+    total = np.zeros(len(columns), dtype=np.float64)
+    step = max(1, int(chunk_samples))
+    for start in range(0, n_samples, step):
+        seg = np.asarray(data[start:start + step, columns])
+        values = np.abs(seg) if metric == "ARV" else np.square(seg)
+        total += values.sum(axis=0, dtype=np.float64)
+
+    overall = total / max(1, n_samples)
+    if metric == "RMS":
+        overall = np.sqrt(overall)
+    result = np.zeros(n_channels, dtype=np.float64)
+    result[columns] = overall
+    return result
+
+
+def summarize_amplitude_maps(
+    data: np.ndarray,
+    specs: Sequence[GridMapSpec],
+    fs: float,
+    window_ms: float = 250.0,
+    metric: str = "ARV",
+    chunk_samples: int = _DEFAULT_CHUNK_SAMPLES,
+) -> dict:
+    """Compute ARV/RMS maps for every grid in a single streaming pass.
+
+    data:           shape (n_samples, n_channels); may be a memory map
+    specs:          one GridMapSpec per grid (see grid_map_specs)
+    window_ms:      length of the fixed, non-overlapping analysis windows
+    chunk_samples:  samples read per step; peak memory is proportional to
+                    chunk_samples × (channels used by the grids)
+
+    Returns {grid_key: GridAmplitudeSummary}.
+    """
+    if metric not in _METRICS:
+        raise ValueError(f"Unknown metric '{metric}', expected one of {_METRICS}.")
+
+    n_samples, n_channels = data.shape
+    window = ms_to_samples(window_ms, fs)
+    n_windows = n_samples // window
+
+    # Union of all data columns used by the grids, read once per chunk
+    columns = sorted({c for spec in specs for c in spec.emg_indices if 0 <= c < n_channels})
+    col_pos = {c: i for i, c in enumerate(columns)}
+    n_cols = len(columns)
+
+    window_sums = np.zeros((n_windows, n_cols), dtype=np.float64)
+    total = np.zeros(n_cols, dtype=np.float64)
+
+    # Chunks always hold whole windows so no window straddles two chunks
+    step = max(window, (max(1, int(chunk_samples)) // window) * window)
+    for start in range(0, n_samples, step):
+        end = min(n_samples, start + step)
+        seg = np.asarray(data[start:end, columns])
+        values = np.abs(seg) if metric == "ARV" else np.square(seg)
+        total += values.sum(axis=0, dtype=np.float64)
+
+        n_full = (end - start) // window
+        if n_full:
+            first = start // window
+            window_sums[first:first + n_full] = (
+                values[:n_full * window].reshape(n_full, window, n_cols).sum(axis=1, dtype=np.float64)
+            )
+
+    per_window = window_sums / window
+    overall = total / max(1, n_samples)
+    if metric == "RMS":
+        per_window = np.sqrt(per_window)
+        overall = np.sqrt(overall)
+
+    summaries = {}
+    for spec in specs:
+        gather = _gather_index(spec.display_grid, spec.emg_indices, col_pos)
+        valid = gather >= 0
+        rows, cols = spec.display_grid.shape
+        maps = np.full((n_windows, rows, cols), np.nan, dtype=float)
+        mean_map = np.full((rows, cols), np.nan, dtype=float)
+        if valid.any():
+            maps[:, valid] = per_window[:, gather[valid]]
+            mean_map[valid] = overall[gather[valid]]
+        summaries[spec.grid_key] = GridAmplitudeSummary(
+            grid_key=spec.grid_key,
+            metric=metric,
+            window_samples=window,
+            window_starts=np.arange(n_windows, dtype=np.int64) * window,
+            maps=maps,
+            mean_map=mean_map,
+        )
+    return summaries
+
+
+def _gather_index(display_grid: np.ndarray, emg_indices: list, col_pos: dict) -> np.ndarray:
+    """(rows, cols) positions into the compact column vector, -1 for empty cells.
+
+    Same cell → channel mapping as channels_to_grid.
+    """
+    gather = np.full(display_grid.shape, -1, dtype=np.int64)
+    for (r, c), local in np.ndenumerate(display_grid):
+        if np.isnan(local):
+            continue
+        idx = int(local)
+        if idx < len(emg_indices):
+            gather[r, c] = col_pos.get(emg_indices[idx], -1)
+    return gather
@@ -0,0 +1,149 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+from hdsemg_shared.preprocessing.differential import to_differential
+
+from hdsemg_select._log.log_config import logger
+from hdsemg_select.logic.precision import as_working
+
+_DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # 512 MiB of differential signals
+
+
+def filter_params_key(params: dict) -> tuple:
+    """Return a hashable, order-independent representation of filter params."""
+    return tuple(sorted((str(k), float(v)) for k, v in params.items()))
+
+
+@dataclass(frozen=True)
+class DifferentialKey:
+    """Identifies one set of SD/DD signals derived from a recording.
+
+    source:         path of the loaded file (distinguishes recordings)
+    grid_key:       grid the lines belong to
+    layout_mode:    LayoutMode name the lines were built for
+    mode:           "SD" or "DD"
+    filter_params:  output of filter_params_key()
+    crop_range:     (start, end) sample range or None for the full signal
+    lines:          per fiber line, the data columns ordered along the fiber
+    """
+    source: str
+    grid_key: str
+    layout_mode: str
+    mode: str
+    filter_params: tuple
+    crop_range: Optional[tuple]
+    lines: tuple
+
+
+@dataclass
+class DifferentialSet:
+    """Differential matrices for every line of a DifferentialKey.
+
+    matrices[i] has shape (n_diff, n_samples) or is None when line i has too
+    few channels for the requested mode (or filtering failed).
+    """
+    lines: tuple
+    matrices: list
+
+    @property
+    def nbytes(self) -> int:
+        return sum(m.nbytes for m in self.matrices if m is not None)
+
+
+def compute_differential_set(
+    data: np.ndarray,
+    lines: tuple,
+    fs: float,
+    filter_params: dict,
+    mode: str,
+) -> DifferentialSet:
+    """Compute SD (mode="SD") or DD (mode="DD") signals along each line.
+
+    data:  shape (n_samples, n_channels) monopolar signals
+    lines: tuple of tuples of column indices into *data*
+    """
+    n_steps = 1 if mode == "SD" else 2
+    matrices = []
+    for line_idx, line in enumerate(lines):
+        if len(line) < n_steps + 1:
+            matrices.append(None)
+            continue
+        mp_mat = np.asarray(data[:, list(line)]).T  # (n, T)
+        try:
+            sd_mats, _ = to_differential([mp_mat], fs, filter_params)
+            final_mat = sd_mats[0]
+            if mode == "DD":
+                dd_mats, _ = to_differential([final_mat], fs, filter_params)
+                final_mat = dd_mats[0]
+            # Filtered in float64 by to_differential; cached in the working precision
+            final_mat = as_working(final_mat)
+        except Exception as exc:
+            logger.warning("to_differential failed for line %d: %s", line_idx, exc)
+            final_mat = None
+        matrices.append(final_mat)
+    return DifferentialSet(lines=tuple(lines), matrices=matrices)
+
+
+class DifferentialBank:
+    """Size-bounded LRU cache of DifferentialSets shared by all views."""
+
+    def __init__(self, max_bytes: int = _DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[DifferentialKey, DifferentialSet]" = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: DifferentialKey) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def get(self, key: DifferentialKey) -> Optional[DifferentialSet]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: DifferentialKey, value: DifferentialSet) -> None:
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._nbytes -= old.nbytes
+            self._entries[key] = value
+            self._nbytes += value.nbytes
+            # Evict least recently used entries, but always keep the newest one
+            while self._nbytes > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._nbytes -= evicted.nbytes
+
+    def get_or_compute(self, key: DifferentialKey, data: np.ndarray, fs: float) -> DifferentialSet:
+        """Return the cached set for *key*, computing and storing it on a miss."""
+        value = self.get(key)
+        if value is not None:
+            return value
+        value = compute_differential_set(data, key.lines, fs, dict(key.filter_params), key.mode)
+        self.put(key, value)
+        logger.debug(
+            "Cached %s for grid %s (%d lines, %.1f MiB)",
+            key.mode, key.grid_key, len(key.lines), value.nbytes / 2**20,
+        )
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+
+differential_bank = DifferentialBank()
@@ -0,0 +1,28 @@
+"""Floating-point precision of the data the analysis works on.
+
+EMG is recorded with 16–24 bit ADCs, so float32 holds it without loss of
+meaningful resolution. With Settings.WORKING_PRECISION set to "float32",
+scaled data, differential signals, ARV/RMS inputs, spectra and the fiber
+trajectory signals are kept in float32, halving their memory. Reductions
+over many samples (window sums, means) still accumulate in float64.
+"""
+import numpy as np
+
+from hdsemg_select.config.config_enums import Settings
+from hdsemg_select.config.config_manager import config
+
+FLOAT64 = "float64"
+FLOAT32 = "float32"
+DEFAULT_PRECISION = FLOAT64
+
+
+def working_dtype() -> np.dtype:
+    """The configured working dtype (float64 unless float32 is selected)."""
+    if config.get(Settings.WORKING_PRECISION, DEFAULT_PRECISION) == FLOAT32:
+        return np.dtype(np.float32)
+    return np.dtype(np.float64)
+
+
+def as_working(array) -> np.ndarray:
+    """*array* in the working dtype; no copy if it already is."""
+    return np.asarray(array, dtype=working_dtype())
@@ -28,6 +28,9 @@ def main():
     parser = argparse.ArgumentParser(description="hdsemg_select")
     parser.add_argument("--inputFile", type=str, help="File to be opened upon startup")
     parser.add_argument("--outputFile", type=str, help="Destination .mat file for saving the selection")
+    parser.add_argument("--selectionFile", type=str,
+                        help="Previously saved selection (.json/.npz/.msgpack) to resume; "
+                             "opens its recording unless --inputFile is given")
     args = parser.parse_args()
 
     os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "1"
@@ -40,7 +43,9 @@ def main():
     app.setStyleSheet(get_app_stylesheet())
 
     # If an input file was specified, load it automatically.
-    if args.inputFile:
+    if args.selectionFile:
+        window.resume_session(args.selectionFile, recording=args.inputFile)
+    elif args.inputFile:
         window.load_file_path(args.inputFile)
 
     sys.exit(app.exec_())
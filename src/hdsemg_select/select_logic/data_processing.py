@@ -1,15 +1,19 @@
 import numpy as np
 from scipy.signal import welch
 
+from hdsemg_select.logic.precision import as_working, working_dtype
+
 def compute_upper_quartile(data):
     abs_amplitudes = np.abs(data)
     upper_quartile = np.percentile(abs_amplitudes, 75)
     return upper_quartile
 
 def scale_data(data, upper_quartile):
+    # Result in the working precision, without an intermediate float64 copy
     if upper_quartile == 0:
-        return data
-    return data / upper_quartile
+        return as_working(data)
+    out = np.empty_like(data, dtype=working_dtype(), subok=False)
+    return np.divide(data, upper_quartile, out=out, casting="same_kind")
 
 
 # %% ---------------------------------------------------------------------------
@@ -47,6 +51,7 @@ def welchPS(y, fs):
     plt.show()
     """
     # power spectrum, via scipy welch. 'boxcar' means no window, nperseg=len(y) so that fft computed on the whole signal.
+    y = as_working(y)
     xf, yf = welch(y, fs=fs, window='boxcar', nperseg=len(y), scaling='spectrum', axis=-1, average='mean')
     yf = yf * 4
     return xf, yf
@@ -6,6 +6,8 @@ import numpy as np
 from scipy.signal import correlate
 from scipy.stats import linregress
 
+from hdsemg_select.logic.precision import as_working
+
 
 @dataclass
 class FiberTrajectoryResult:
@@ -142,7 +144,7 @@ class FiberTrajectoryAnalyzer:
                 global_ch_idx = emg_indices[local_electrode_idx]  # column in signals
                 if global_ch_idx >= signals.shape[1]:
                     continue
-                sig = signals[:, global_ch_idx].astype(np.float64)
+                sig = as_working(signals[:, global_ch_idx])
                 if np.linalg.norm(sig) < 1e-12:
                     continue  # zero-line / dead channel — exclude from analysis
                 mono[(r, c)] = sig
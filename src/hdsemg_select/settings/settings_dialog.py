@@ -8,6 +8,7 @@ from .tabs.custom_flagger_settings_tab import CustomFlaggerSettingsTab
 # Import the new tab classes
 from .tabs.log_setting import LoggingSettingsTab
 from .tabs.auto_flagger_settings_tab import AutoFlaggerSettingsTab
+from .tabs.performance_settings_tab import PerformanceSettingsTab
 
 from hdsemg_select.config.config_manager import config
 from hdsemg_select.ui.theme import Colors, Spacing, BorderRadius, Styles, Fonts
@@ -73,11 +74,13 @@ class SettingsDialog(QDialog):
         self.logging_tab_widget = LoggingSettingsTab(self.tab_widget) # Parent is tab_widget
         self.auto_flag_tab_widget = AutoFlaggerSettingsTab(self.tab_widget) # Parent is tab_widget
         self.custom_flag_tab_widget = CustomFlaggerSettingsTab(self.tab_widget)
+        self.performance_tab_widget = PerformanceSettingsTab(self.tab_widget)
 
         # Add tab widgets to the tab widget with shorter names
         self.tab_widget.addTab(self.logging_tab_widget, "Logging")
         self.tab_widget.addTab(self.auto_flag_tab_widget, "Auto-Flagging")
         self.tab_widget.addTab(self.custom_flag_tab_widget, "Custom Labels")
+        self.tab_widget.addTab(self.performance_tab_widget, "Performance")
 
         # Add standard dialog buttons (OK and Cancel)
         self.button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
@@ -99,6 +102,7 @@ class SettingsDialog(QDialog):
         self.logging_tab_widget.loadSettings(config)
         self.auto_flag_tab_widget.loadSettings(config)
         self.custom_flag_tab_widget.loadSettings(config)
+        self.performance_tab_widget.loadSettings(config)
 
     def saveSettings(self) -> None:
         """Saves settings from all tab widgets."""
@@ -106,6 +110,8 @@ class SettingsDialog(QDialog):
         self.logging_tab_widget.saveSettings(config)
         self.auto_flag_tab_widget.saveSettings(config)
         self.custom_flag_tab_widget.saveSettings(config)
+        self.performance_tab_widget.saveSettings(config)
+        config.flush()  # one write for all tabs
 
     def accept(self) -> None:
         """Overrides the accept method to save settings before closing."""
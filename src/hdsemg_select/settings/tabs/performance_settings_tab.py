@@ -0,0 +1,150 @@
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import (
+    QCheckBox, QComboBox, QFormLayout, QGroupBox, QHBoxLayout, QLabel, QPushButton,
+    QSpinBox, QVBoxLayout, QWidget
+)
+
+from hdsemg_select._log.log_config import logger
+from hdsemg_select.config.config_enums import Settings
+from hdsemg_select.controller.decoded_cache import decoded_cache, DEFAULT_MAX_MB
+from hdsemg_select.controller.selection_io import (
+    DEFAULT_FORMAT, FORMAT_COLUMNAR, FORMAT_JSON, FORMAT_MSGPACK, FORMAT_NPZ, msgpack_available
+)
+from hdsemg_select.logic.precision import DEFAULT_PRECISION, FLOAT32, FLOAT64
+from hdsemg_select.ui.theme import Spacing, Styles
+
+
+class PerformanceSettingsTab(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.initUI()
+
+    def initUI(self) -> None:
+        layout = QVBoxLayout(self)
+        layout.setSpacing(Spacing.LG)
+        layout.setContentsMargins(Spacing.MD, Spacing.MD, Spacing.MD, Spacing.MD)
+
+        header_label = QLabel("Performance")
+        header_label.setStyleSheet(Styles.label_heading(size="lg"))
+        layout.addWidget(header_label)
+
+        info_label = QLabel("Decoded recordings can be kept in a local cache, so re-opening a file "
+                            "maps the cached data instead of parsing the file again.")
+        info_label.setStyleSheet(Styles.label_secondary())
+        info_label.setWordWrap(True)
+        layout.addWidget(info_label)
+
+        cache_group = QGroupBox("Decoded-Data Cache")
+        cache_group.setStyleSheet(Styles.groupbox())
+        cache_layout = QFormLayout(cache_group)
+        cache_layout.setSpacing(Spacing.MD)
+        cache_layout.setLabelAlignment(Qt.AlignRight)
+        cache_layout.setFieldGrowthPolicy(QFormLayout.ExpandingFieldsGrow)
+
+        self.cache_enabled_checkbox = QCheckBox("Cache decoded recordings")
+        self.cache_enabled_checkbox.setToolTip("Store opened files as memory-mapped arrays for near-instant re-opening")
+        cache_layout.addRow("", self.cache_enabled_checkbox)
+
+        self.cache_size_spinbox = QSpinBox()
+        self.cache_size_spinbox.setStyleSheet(Styles.input_field())
+        self.cache_size_spinbox.setRange(64, 1024 * 1024)
+        self.cache_size_spinbox.setSingleStep(256)
+        self.cache_size_spinbox.setSuffix(" MB")
+        self.cache_size_spinbox.setToolTip("Least recently opened recordings are removed once the cache exceeds this size")
+        cache_layout.addRow("Maximum Size:", self.cache_size_spinbox)
+
+        usage_container = QHBoxLayout()
+        usage_container.setSpacing(Spacing.SM)
+        self.cache_usage_label = QLabel()
+        self.cache_usage_label.setStyleSheet(Styles.label_secondary())
+        usage_container.addWidget(self.cache_usage_label, 1)
+
+        self.clear_cache_button = QPushButton("Clear Cache")
+        self.clear_cache_button.setStyleSheet(Styles.button_secondary())
+        self.clear_cache_button.clicked.connect(self._clear_cache)
+        usage_container.addWidget(self.clear_cache_button)
+        cache_layout.addRow("In Use:", usage_container)
+
+        location_label = QLabel(decoded_cache.directory)
+        location_label.setStyleSheet(Styles.label_secondary())
+        location_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        location_label.setWordWrap(True)
+        cache_layout.addRow("Location:", location_label)
+
+        layout.addWidget(cache_group)
+
+        precision_group = QGroupBox("Working Precision")
+        precision_group.setStyleSheet(Styles.groupbox())
+        precision_layout = QFormLayout(precision_group)
+        precision_layout.setSpacing(Spacing.MD)
+        precision_layout.setLabelAlignment(Qt.AlignRight)
+        precision_layout.setFieldGrowthPolicy(QFormLayout.ExpandingFieldsGrow)
+
+        self.precision_combo = QComboBox()
+        self.precision_combo.setStyleSheet(Styles.combobox())
+        self.precision_combo.addItem("64-bit (float64)", FLOAT64)
+        self.precision_combo.addItem("32-bit (float32)", FLOAT32)
+        self.precision_combo.setToolTip("Precision of scaled data, differential signals, ARV and spectra")
+        precision_layout.addRow("Precision:", self.precision_combo)
+
+        precision_help = QLabel("32-bit halves the memory of the processed signals; results agree with 64-bit "
+                                "well within the resolution of EMG amplifiers. Saved files keep the precision "
+                                "of the original recording. Applies to files opened after the change.")
+        precision_help.setStyleSheet(Styles.label_secondary())
+        precision_help.setWordWrap(True)
+        precision_layout.addRow("", precision_help)
+
+        layout.addWidget(precision_group)
+
+        selection_group = QGroupBox("Selection File")
+        selection_group.setStyleSheet(Styles.groupbox())
+        selection_layout = QFormLayout(selection_group)
+        selection_layout.setSpacing(Spacing.MD)
+        selection_layout.setLabelAlignment(Qt.AlignRight)
+        selection_layout.setFieldGrowthPolicy(QFormLayout.ExpandingFieldsGrow)
+
+        self.selection_format_combo = QComboBox()
+        self.selection_format_combo.setStyleSheet(Styles.combobox())
+        self.selection_format_combo.addItem("JSON, detailed (.json)", FORMAT_JSON)
+        self.selection_format_combo.addItem("JSON, columnar (.json)", FORMAT_COLUMNAR)
+        self.selection_format_combo.addItem("NumPy (.npz)", FORMAT_NPZ)
+        self.selection_format_combo.addItem("MessagePack (.msgpack)", FORMAT_MSGPACK)
+        if not msgpack_available():
+            item = self.selection_format_combo.model().item(self.selection_format_combo.findData(FORMAT_MSGPACK))
+            item.setEnabled(False)
+            item.setToolTip("Install the msgpack package to use this format")
+        self.selection_format_combo.setToolTip("Format of the channel selection saved next to the .mat file")
+        selection_layout.addRow("Format:", self.selection_format_combo)
+
+        selection_help = QLabel("The detailed JSON lists every channel per grid and is easiest to read. The "
+                                "columnar formats store one array per field and are much smaller and faster "
+                                "to write and read in batch processing.")
+        selection_help.setStyleSheet(Styles.label_secondary())
+        selection_help.setWordWrap(True)
+        selection_layout.addRow("", selection_help)
+
+        layout.addWidget(selection_group)
+        layout.addStretch(1)
+
+    def _update_usage(self):
+        self.cache_usage_label.setText(f"{decoded_cache.nbytes / (1024 * 1024):.0f} MB")
+
+    def _clear_cache(self):
+        decoded_cache.clear()
+        logger.info("Decoded-data cache cleared")
+        self._update_usage()
+
+    def loadSettings(self, config_manager) -> None:
+        self.cache_enabled_checkbox.setChecked(config_manager.get(Settings.DECODED_CACHE_ENABLED, True))
+        self.cache_size_spinbox.setValue(int(config_manager.get(Settings.DECODED_CACHE_MAX_MB, DEFAULT_MAX_MB)))
+        self._update_usage()
+        index = self.precision_combo.findData(config_manager.get(Settings.WORKING_PRECISION, DEFAULT_PRECISION))
+        self.precision_combo.setCurrentIndex(max(0, index))
+        index = self.selection_format_combo.findData(config_manager.get(Settings.SELECTION_FORMAT, DEFAULT_FORMAT))
+        self.selection_format_combo.setCurrentIndex(max(0, index))
+
+    def saveSettings(self, config_manager) -> None:
+        config_manager.set(Settings.DECODED_CACHE_ENABLED, self.cache_enabled_checkbox.isChecked())
+        config_manager.set(Settings.DECODED_CACHE_MAX_MB, self.cache_size_spinbox.value())
+        config_manager.set(Settings.WORKING_PRECISION, self.precision_combo.currentData())
+        config_manager.set(Settings.SELECTION_FORMAT, self.selection_format_combo.currentData())
@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from typing import Dict
 
 from PyQt5.QtCore import QObject
@@ -10,7 +11,10 @@ from hdsemg_select.state.enum.layout_mode_enums import FiberMode, LayoutMode
 
 
 class State(QObject):
-    channel_labels_changed = pyqtSignal(int, list)
+    channel_labels_changed = pyqtSignal(int, list)  # not emitted inside batch()
+    # Change sets: frozenset of the channel indices whose selection / labels changed
+    channel_status_changed = pyqtSignal(object)
+    labels_changed = pyqtSignal(object)
 
     _instance = None
 
@@ -27,6 +31,10 @@ class State(QObject):
         output_file = self._output_file if hasattr(self, '_output_file') else None
 
         self._channel_status = []
+        self._published_status = []  # copy of the status as last announced via channel_status_changed
+        self._batch_depth = 0
+        self._batched_status_changes = set()
+        self._batched_label_changes = set()
         self._file_path = None
         self._scaled_data = None
         self._emg_file = None
@@ -89,7 +97,62 @@ class State(QObject):
         self._emg_file = emg_file
 
     def set_channel_status(self, value: list):
+        """Replace the selection status and announce the channels whose status differs.
+
+        Callers may mutate the list returned by get_channel_status() in place
+        before handing it back; the change set is computed against the status
+        as it was last announced.
+        """
         self._channel_status = value
+        self._publish_status_changes(self._diff_channel_status())
+
+    def set_channel_selected(self, channel_idx: int, selected: bool):
+        """Set the selection status of a single channel."""
+        if not 0 <= channel_idx < len(self._channel_status):
+            logger.warning(f"Attempted to update status for channel index {channel_idx} which is out of bounds.")
+            return
+        self._channel_status[channel_idx] = bool(selected)
+        self._publish_status_changes(self._diff_channel_status())
+
+    def _diff_channel_status(self) -> frozenset:
+        old, new = self._published_status, self._channel_status
+        common = min(len(old), len(new))
+        changed = {i for i in range(common) if bool(old[i]) != bool(new[i])}
+        changed.update(range(common, max(len(old), len(new))))
+        self._published_status = [bool(s) for s in new]
+        return frozenset(changed)
+
+    def _publish_status_changes(self, changed: frozenset):
+        if self._batch_depth:
+            self._batched_status_changes.update(changed)
+        elif changed:
+            self.channel_status_changed.emit(changed)
+
+    @contextmanager
+    def batch(self):
+        """Group status and label updates into a single change set per signal.
+
+        Inside the block, channel_status_changed and labels_changed are held
+        back and channel_labels_changed is not emitted; on leaving the
+        outermost block each signal fires once with all affected channels.
+
+            with global_state.batch():
+                for idx in flagged:
+                    global_state.update_channel_labels(idx, labels)
+                global_state.set_channel_status(status)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                status_changes, self._batched_status_changes = self._batched_status_changes, set()
+                label_changes, self._batched_label_changes = self._batched_label_changes, set()
+                if status_changes:
+                    self.channel_status_changed.emit(frozenset(status_changes))
+                if label_changes:
+                    self.labels_changed.emit(frozenset(label_changes))
 
     def set_grid_info(self, value: dict):
         self._grid_info = value
@@ -97,9 +160,16 @@ class State(QObject):
     def set_file_path(self, value: str):
         self._file_path = value
 
-    def set_scaled_data(self, value):
-        all_emg_idx = [idx for cfg in self._emg_file.grids for idx in cfg.emg_indices]
-        self.max_amplitude = np.abs(value[:, all_emg_idx]).max()
+    def set_scaled_data(self, value, max_amplitude: float = None):
+        """Store the scaled data; *max_amplitude* of the EMG channels is computed if not given.
+
+        *value* may be memory-mapped from the decoded-data cache, in which
+        case channels are only read from disk when accessed.
+        """
+        if max_amplitude is None:
+            all_emg_idx = [idx for cfg in self._emg_file.grids for idx in cfg.emg_indices]
+            max_amplitude = np.abs(value[:, all_emg_idx]).max()
+        self.max_amplitude = max_amplitude
         self._scaled_data = value
 
     def get_input_file(self):
@@ -130,7 +200,11 @@ class State(QObject):
             del self._channel_labels[channel_idx]
 
         # Emit signal to notify that channel labels have changed
-        self.channel_labels_changed.emit(channel_idx, labels)
+        if self._batch_depth:
+            self._batched_label_changes.add(channel_idx)
+        else:
+            self.channel_labels_changed.emit(channel_idx, labels)
+            self.labels_changed.emit(frozenset((channel_idx,)))
 
     def set_fiber_layout(self,
                          fiber_mode: FiberMode,
@@ -3,6 +3,8 @@ from matplotlib import pyplot as plt
 from matplotlib.backends.backend_qt import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 
+from hdsemg_select.ui.plot.decimated_line import DecimatedLine
+
 
 class ChannelDetailWindow(QMainWindow):
     def __init__(self, parent, data, channel_idx, ref_signal=None):
@@ -10,14 +12,20 @@ class ChannelDetailWindow(QMainWindow):
         self.setWindowTitle(f"Channel {channel_idx + 1} - Detailed View")
 
         fig, ax = plt.subplots(figsize=(10, 6))
-        ax.plot(data[:, channel_idx], color="blue", label="Channel Signal")
-        ax.plot(ref_signal, color="black", label="Reference Signal", linestyle="--") if ref_signal is not None else None
+        canvas = FigureCanvas(fig)
+        # Lines hold only the min/max envelope of the visible range; zoom/pan re-decimates
+        (line,) = ax.plot([], [], color="blue", label="Channel Signal")
+        self._decimated_lines = [DecimatedLine(line, data[:, channel_idx])]
+        if ref_signal is not None:
+            (ref_line,) = ax.plot([], [], color="black", label="Reference Signal", linestyle="--")
+            self._decimated_lines.append(DecimatedLine(ref_line, ref_signal))
+        ax.relim()
+        ax.autoscale_view()
         ax.legend(loc='upper right', frameon=False, fontsize='small') if ref_signal is not None else None
         ax.set_title(f"Channel {channel_idx + 1}")
         ax.set_xlabel("Time (s)")
         ax.set_ylabel("Amplitude (μV)")
 
-        canvas = FigureCanvas(fig)
         toolbar = NavigationToolbar(canvas, self)
 
         layout = QVBoxLayout()
@@ -7,6 +7,7 @@ from matplotlib.widgets import SpanSelector
 
 from hdsemg_select._log.log_config import logger
 from hdsemg_select.state.state import global_state
+from hdsemg_select.ui.plot.decimated_line import DecimatedLine
 from hdsemg_select.ui.theme import Colors, Spacing, BorderRadius, Fonts, Styles
 
 
@@ -26,6 +27,7 @@ class CropSignalDialog(QtWidgets.QDialog):
         super().__init__(parent)
         self._crop_range: tuple[int, int] | None = None
         self._threshold_lines: list = []
+        self._decimated_lines: list = []
         self._span_selector = None
         self._lower = 0
         self._upper = 0
@@ -290,6 +292,9 @@ class CropSignalDialog(QtWidgets.QDialog):
     # ------------------------------------------------------------------ #
     def _update_plot(self):
         self._threshold_lines.clear()
+        for decimated in self._decimated_lines:
+            decimated.disconnect()
+        self._decimated_lines.clear()
         self._ax.clear()
         self._ax.set_facecolor(Colors.BG_PRIMARY)
 
@@ -311,8 +316,12 @@ class CropSignalDialog(QtWidgets.QDialog):
                         emg_file.description[ch_idx]
                         if ch_idx < len(emg_file.description) else f"Ch{ch_idx}"
                     )
-                    self._ax.plot(scaled[:, ch_idx], label=f"Ch{ch_idx}: {desc}", linewidth=1.2)
+                    (line,) = self._ax.plot([], [], label=f"Ch{ch_idx}: {desc}", linewidth=1.2)
+                    # Zoom/pan re-decimates the visible range to the axes' pixel width
+                    self._decimated_lines.append(DecimatedLine(line, scaled[:, ch_idx]))
 
+        self._ax.relim()
+        self._ax.autoscale_view()
         self._ax.set_xlabel("Sample Index", fontsize=11)
         self._ax.set_ylabel("Amplitude", fontsize=11)
         self._ax.legend(loc='upper right', framealpha=0.9, fontsize=8)
@@ -0,0 +1,226 @@
+import os
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QTableWidget, QTableWidgetItem,
+    QHeaderView, QAbstractItemView, QProgressBar, QFileDialog
+)
+
+from hdsemg_select.config.config_enums import Settings
+from hdsemg_select.config.config_manager import config
+from hdsemg_select.controller.recording_index import RecordingIndexer, ScanSummary, recording_index
+from hdsemg_select.ui.theme import Spacing, Styles
+
+_COLUMNS = ["File", "Grids", "Channels", "Sampling Rate", "Duration", "Selection", "RMS"]
+
+
+class _SortItem(QTableWidgetItem):
+    """Table item that sorts by the value stored in Qt.UserRole instead of its text."""
+
+    def __init__(self, text: str, value):
+        super().__init__(text)
+        self.setData(Qt.UserRole, value)
+
+    def __lt__(self, other):
+        mine, theirs = self.data(Qt.UserRole), other.data(Qt.UserRole)
+        if mine is None or theirs is None:
+            return mine is None and theirs is not None
+        return mine < theirs
+
+
+class RecordingBrowserDialog(QDialog):
+    """
+    Searchable list of the recordings in a study folder.
+
+    The folder is indexed in the background (see RecordingIndex) and only new
+    or changed files are read again, so reopening the browser on a large study
+    shows the last index at once. After exec_(), ``recording`` is the chosen
+    file and ``selection_file`` the selection to resume it with, if any.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Browse Recordings")
+        self.resize(960, 560)
+
+        self.recording = None
+        self.selection_file = None
+        self._folder = config.get(Settings.RECORDING_BROWSER_FOLDER)
+        self._entries = []
+        self._indexer = RecordingIndexer(recording_index, self)
+        self._indexer.progress.connect(self._on_scan_progress)
+        self._indexer.scanned.connect(self._on_scanned)
+        self._indexer.failed.connect(self._on_scan_failed)
+
+        layout = QVBoxLayout(self)
+        layout.setSpacing(Spacing.SM)
+
+        folder_row = QHBoxLayout()
+        self.folder_edit = QLineEdit()
+        self.folder_edit.setReadOnly(True)
+        self.folder_edit.setPlaceholderText("Choose a study folder…")
+        self.folder_edit.setStyleSheet(Styles.input_field())
+        folder_row.addWidget(self.folder_edit, 1)
+        choose_button = QPushButton("Choose Folder...")
+        choose_button.setStyleSheet(Styles.button_secondary())
+        choose_button.clicked.connect(self._choose_folder)
+        folder_row.addWidget(choose_button)
+        self.rescan_button = QPushButton("Rescan")
+        self.rescan_button.setStyleSheet(Styles.button_secondary())
+        self.rescan_button.setToolTip("Read new and changed files of the folder again")
+        self.rescan_button.clicked.connect(self._rescan)
+        folder_row.addWidget(self.rescan_button)
+        layout.addLayout(folder_row)
+
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Filter by file or folder name, grid, electrode or muscle")
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.setStyleSheet(Styles.input_field())
+        self.search_edit.textChanged.connect(self._refresh)
+        layout.addWidget(self.search_edit)
+
+        self.table = QTableWidget(0, len(_COLUMNS))
+        self.table.setHorizontalHeaderLabels(_COLUMNS)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        header.setSectionResizeMode(1, QHeaderView.Stretch)
+        self.table.itemSelectionChanged.connect(self._update_buttons)
+        self.table.itemDoubleClicked.connect(lambda _: self._accept(resume=False))
+        layout.addWidget(self.table, 1)
+
+        status_row = QHBoxLayout()
+        self.status_label = QLabel()
+        self.status_label.setStyleSheet(Styles.label_secondary())
+        status_row.addWidget(self.status_label, 1)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setStyleSheet(Styles.progress_bar())
+        self.progress_bar.setFixedWidth(200)
+        self.progress_bar.setVisible(False)
+        status_row.addWidget(self.progress_bar)
+        layout.addLayout(status_row)
+
+        button_row = QHBoxLayout()
+        button_row.addStretch()
+        self.resume_button = QPushButton("Resume Session")
+        self.resume_button.setStyleSheet(Styles.button_secondary())
+        self.resume_button.setToolTip("Open the recording with the selection saved next to it")
+        self.resume_button.clicked.connect(lambda: self._accept(resume=True))
+        button_row.addWidget(self.resume_button)
+        self.open_button = QPushButton("Open")
+        self.open_button.setStyleSheet(Styles.button_primary())
+        self.open_button.setDefault(True)
+        self.open_button.clicked.connect(lambda: self._accept(resume=False))
+        button_row.addWidget(self.open_button)
+        close_button = QPushButton("Close")
+        close_button.setStyleSheet(Styles.button_secondary())
+        close_button.clicked.connect(self.reject)
+        button_row.addWidget(close_button)
+        layout.addLayout(button_row)
+
+        if self._folder and os.path.isdir(self._folder):
+            self._set_folder(self._folder)
+        else:
+            self._folder = None
+            self._update_buttons()
+
+    def _choose_folder(self):
+        folder = QFileDialog.getExistingDirectory(self, "Choose Study Folder", self._folder or "")
+        if folder:
+            config.set(Settings.RECORDING_BROWSER_FOLDER, folder)
+            self._set_folder(folder)
+
+    def _set_folder(self, folder: str):
+        self._folder = os.path.abspath(folder)
+        self.folder_edit.setText(self._folder)
+        self._refresh()  # what is indexed already, while the scan brings it up to date
+        self._rescan()
+
+    def _rescan(self):
+        if not self._folder:
+            return
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        self.rescan_button.setEnabled(False)
+        self._indexer.scan(self._folder)
+
+    def _on_scan_progress(self, percent: int, text: str):
+        self.progress_bar.setValue(percent)
+        self.status_label.setText(f"Indexing {text}…" if text else "Indexing…")
+
+    def _on_scanned(self, summary: ScanSummary):
+        self._scan_done()
+        self._refresh()
+        details = f"{summary.indexed} read, {summary.removed} removed" if summary.indexed or summary.removed \
+            else "up to date"
+        self.status_label.setText(f"{self.status_label.text()} — index {details}")
+
+    def _on_scan_failed(self, message: str):
+        self._scan_done()
+        self.status_label.setText(f"Indexing failed: {message}")
+
+    def _scan_done(self):
+        self.progress_bar.setVisible(False)
+        self.rescan_button.setEnabled(True)
+
+    def _refresh(self):
+        if not self._folder:
+            return
+        self._entries = recording_index.search(self._folder, self.search_edit.text())
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(len(self._entries))
+        for row, info in enumerate(self._entries):
+            relative = os.path.relpath(info.path, self._folder)
+            duration = info.duration_s
+            items = [
+                _SortItem(relative, relative.lower()),
+                _SortItem(info.grid_summary or ("unreadable" if info.error else "—"), info.grid_summary),
+                _SortItem("" if info.channel_count is None else str(info.channel_count), info.channel_count),
+                _SortItem("" if info.sampling_frequency is None else f"{info.sampling_frequency:g} Hz",
+                          info.sampling_frequency),
+                _SortItem("" if duration is None else f"{duration:.1f} s", duration),
+                _SortItem("✓" if info.selection_file else "", bool(info.selection_file)),
+                _SortItem("✓" if info.rms_file else "", bool(info.rms_file)),
+            ]
+            items[0].setData(Qt.UserRole + 1, row)  # index into self._entries, survives sorting
+            items[0].setToolTip(info.path if info.error is None else f"{info.path}\n{info.error}")
+            if info.selection_file:
+                items[5].setToolTip(info.selection_file)
+            if info.rms_file:
+                items[6].setToolTip(info.rms_file)
+            for column, item in enumerate(items):
+                if info.error is not None:
+                    item.setForeground(Qt.gray)
+                if column >= 2:
+                    item.setTextAlignment(Qt.AlignCenter)
+                self.table.setItem(row, column, item)
+        self.table.setSortingEnabled(True)
+        self.status_label.setText(f"{len(self._entries)} recordings")
+        self._update_buttons()
+
+    def _current(self):
+        rows = self.table.selectionModel().selectedRows() if self.table.selectionModel() else []
+        if not rows:
+            return None
+        return self._entries[self.table.item(rows[0].row(), 0).data(Qt.UserRole + 1)]
+
+    def _update_buttons(self):
+        info = self._current()
+        self.open_button.setEnabled(info is not None and info.error is None)
+        self.resume_button.setEnabled(info is not None and info.error is None and info.selection_file is not None)
+
+    def _accept(self, resume: bool):
+        info = self._current()
+        if info is None or info.error is not None:
+            return
+        self.recording = info.path
+        self.selection_file = info.selection_file if resume else None
+        self.accept()
+
+    def done(self, result):
+        self._indexer.shutdown()
+        super().done(result)
@@ -7,9 +7,16 @@ base0[col][row] = 0-based local electrode index within the grid.
 np.nan marks physically empty positions.
 """
 
+import re
+
 import numpy as np
 from typing import Optional
 
+from hdsemg_select.controller.decoded_cache import description_text
+
+# OTBiolab electrode model code: 2 letters + digits + MM + 4 digits (e.g. HD08MM0513)
+_MODEL_CODE = re.compile(r'\b([A-Z]{2}\d+MM\d{4})\b')
+
 # Each entry: list of columns, each column is a list of row values (top→bottom).
 # base0[col][row] = 0-based local electrode index.
 _LAYOUTS_BASE0: dict[str, list] = {
@@ -136,3 +143,20 @@ def get_display_grid(electrode_name: str, rows: int, cols: int) -> Optional[np.n
         pass
 
     return None
+
+
+def electrode_model_code(description, indices) -> str:
+    """Electrode model code in the description of the first channel of *indices*.
+
+    Descriptions may contain full strings like
+    'Novecento+ (147 - 210) HD08MM0513 ch1 [MUSCLE:...]'; returns "" when no
+    token matches the model-code pattern.
+    """
+    if description is None or len(indices) == 0:
+        return ""
+    try:
+        text = description_text(description[indices[0]])
+    except (IndexError, TypeError):
+        return ""
+    match = _MODEL_CODE.search(text)
+    return match.group(1) if match else ""
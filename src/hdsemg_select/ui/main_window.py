@@ -1,28 +1,40 @@
 # main_window.py
 
+import os
+
 import numpy as np
-from PyQt5.QtCore import Qt, QSignalBlocker
+from PyQt5.QtCore import Qt, QSignalBlocker, QTimer
 from PyQt5.QtGui import QIcon, QFont, QResizeEvent
 from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QHBoxLayout, QFrame, QVBoxLayout, QLabel, QScrollArea, \
-    QGridLayout, QPushButton, QStyle, QCheckBox, QFileDialog, QMessageBox, QComboBox
+    QGridLayout, QPushButton, QStyle, QCheckBox, QFileDialog, QMessageBox, QComboBox, QProgressDialog, QDialog
 
 from hdsemg_select._log.log_config import logger
 from hdsemg_select.config.config_enums import Settings
-from hdsemg_select.controller.file_management import FileManager
+from hdsemg_select.controller.file_loader import FileLoader, LoadedFile
+from hdsemg_select.controller.file_management import FileManager, show_save_result
+from hdsemg_select.controller.file_saver import FileSaver
+from hdsemg_select.controller.selection_io import find_recording, is_exported_recording, read_selection
 from hdsemg_select.controller.grid_setup_handler import GridSetupHandler
 from hdsemg_select.controller.rms_loader import RMSLoader
 from hdsemg_select.controller.menu_manager import MenuManager
+from hdsemg_select.logic.decimation.envelope import envelope_cache
+from hdsemg_select.logic.decimation.pyramid import pyramid_cache
+from hdsemg_select.logic.differential.bank import differential_bank
 from hdsemg_select.select_logic.auto_flagger import AutoFlagger
-from hdsemg_select.select_logic.channel_management import select_all_channels, update_channel_status_single, count_selected_channels
+from hdsemg_select.select_logic.channel_management import select_all_channels, count_selected_channels
 from hdsemg_select.settings.settings_dialog import SettingsDialog
 from hdsemg_select.settings.tabs.auto_flagger_settings_tab import validate_auto_flagger_settings
 from hdsemg_select.state.state import global_state
 from hdsemg_select.ui.dialog.channel_details import ChannelDetailWindow
 from hdsemg_select.ui.dialog.channel_spectrum import ChannelSpectrum
 from hdsemg_select.ui.dialog.crop_signal import CropSignalDialog
+from hdsemg_select.ui.dialog.recording_browser import RecordingBrowserDialog
 from hdsemg_select.ui.plot.density_map_dialog import DensityMapDialog
 from hdsemg_select.ui.dialog.grid_orientation_dialog import GridOrientationDialog
+from hdsemg_select.ui.plot.channel_scroll_view import ChannelScrollView, grid_tile_sections
 from hdsemg_select.ui.plot.channel_widget import ChannelWidget
+from hdsemg_select.ui.plot.grid_view_model import GridViewModel
+from hdsemg_select.ui.plot.page_render_cache import PageRenderCache, page_render_key, prefetch_pages
 from hdsemg_select.ui.widgets.electrode_widget import ElectrodeWidget
 from hdsemg_select.ui.selection.amplitude_based import AutomaticAmplitudeSelection
 from hdsemg_select.ui.selection.zero_line_selection import ZeroLineSelection
@@ -56,16 +68,36 @@ class ChannelSelector(QMainWindow):
         # Instantiate handlers
         self.menu_manager = MenuManager()
         self.file_handler = FileManager()
+        # Loads files in a worker thread; results are applied in _on_file_loaded
+        self._file_loader = FileLoader(self)
+        self._file_loader.progress.connect(self._on_file_load_progress)
+        self._file_loader.loaded.connect(self._on_file_loaded)
+        self._file_loader.failed.connect(self._on_file_load_failed)
+        self._load_progress = None
+        self._pending_session = None  # (SavedSelection, restore_crop) to apply once the file is loaded
+        self._session_restored = False  # labels came from a saved selection; RMS labels are not re-applied
+        # Writes saved selections in a worker thread, so the next file can be reviewed meanwhile
+        self._file_saver = FileSaver(self)
+        self._file_saver.progress.connect(self._on_save_progress)
+        self._file_saver.saved.connect(self._on_saved)
         self.grid_setup_handler = GridSetupHandler()
         self.checkboxes = []
         self.channels_per_row = 4
         self.auto_flagger = AutoFlagger()
 
         self.upper_quartile = None
-        self.global_min = None
-        self.global_max = None
         self.ylim = None
-        self.channel_widgets = []
+        self._grid_view_model = GridViewModel()  # per-grid y-limits and scaled reference signals
+        self.channel_widgets = []  # widgets bound to the current page
+        self._channel_widget_pool = []  # reusable ChannelWidgets, indexed by slot
+        self._channel_widget_positions = {}  # slot -> (row, col) in grid_layout
+        self._page_render_cache = PageRenderCache(parent=self)  # pre-rendered neighbour pages
+        # Status/label change sets from the state, applied to the visible views in one pass
+        self._pending_status_changes = set()
+        self._pending_label_changes = set()
+        self._channel_updates_scheduled = False
+        global_state.channel_status_changed.connect(self._queue_status_changes)
+        global_state.labels_changed.connect(self._queue_label_changes)
 
         # Create the main layout
         self.main_widget = QWidget(self)
@@ -114,6 +146,14 @@ class ChannelSelector(QMainWindow):
         self.scroll_area.setWidgetResizable(True)
         self.layout.addWidget(self.scroll_area, 1)
 
+        # Continuous, virtualized view of all channels of all grids (alternative to paging)
+        self.channel_scroll_view = ChannelScrollView(self)
+        self.channel_scroll_view.channel_status_changed.connect(self.handle_single_channel_update)
+        self.channel_scroll_view.view_detail_requested.connect(self.view_channel_in_detail)
+        self.channel_scroll_view.view_spectrum_requested.connect(self.view_channel_spectrum)
+        self.channel_scroll_view.setHidden(True)
+        self.layout.addWidget(self.channel_scroll_view, 1)
+
         # Pagination controls
         self.pagination_layout = QHBoxLayout()
         self.layout.addLayout(self.pagination_layout)
@@ -134,6 +174,12 @@ class ChannelSelector(QMainWindow):
         self.next_button.clicked.connect(self.next_page)
         self.pagination_layout.addWidget(self.next_button)
 
+        self.all_channels_checkbox = QCheckBox("Show all channels")
+        self.all_channels_checkbox.setToolTip("Scroll continuously through all channels of all grids instead of paging")
+        self.all_channels_checkbox.setEnabled(False)
+        self.all_channels_checkbox.toggled.connect(self.set_all_channels_mode)
+        self.pagination_layout.addWidget(self.all_channels_checkbox)
+
         # Create the menu bar using the MenuManager
         self.automatic_selection = AutomaticAmplitudeSelection(self)
         self.zero_line_selection = ZeroLineSelection(self)
@@ -178,6 +224,7 @@ class ChannelSelector(QMainWindow):
 
         # Get references to actions/menus created by the manager to control their enabled state
         self.save_action = self.menu_manager.get_save_action()
+        self.save_selected_only_action = self.menu_manager.get_save_selected_only_action()
         self.change_grid_action = self.menu_manager.get_change_grid_action()
         self.amplidude_menu = self.menu_manager.get_amplitude_menu()
         self.zero_line_menu = self.menu_manager.get_zero_line_menu()
@@ -193,16 +240,17 @@ class ChannelSelector(QMainWindow):
         """Handles changes in the reference signal checkbox."""
         if self.show_ref_signals.isChecked():
             self.select_ref_signal.setEnabled(True)
-            selected_signal = self.select_ref_signal.currentData()
-            ref_sig_scaled = ChannelWidget.scale_ref_signal(global_state.get_effective_scaled_data()[:, selected_signal])
-            if selected_signal is not None:
+            ref_sig_scaled = self.get_selected_ref_signal()
+            if ref_sig_scaled is not None:
                 for channel_widget in self.channel_widgets:
                     channel_widget.set_overlay_signal(ref_sig_scaled)
+                self.channel_scroll_view.set_reference(ref_sig_scaled)
         else:
             self.select_ref_signal.setEnabled(False)
             logger.debug("Hiding reference signal")
             for channel_widget in self.channel_widgets:
                 channel_widget.set_overlay_signal(None)
+            self.channel_scroll_view.set_reference(None)
 
 
     def populate_ref_signal_dropdown(self):
@@ -260,13 +308,123 @@ class ChannelSelector(QMainWindow):
         if file_path:
             self.load_file_path(file_path)
 
-    def load_file_path(self, file_path):
+    def load_file_path(self, file_path, session=None):
         """
-        Loads a file from the provided path using the FileManager.
+        Loads a file from the provided path in the background, showing progress.
+        The window stays responsive; the load can be cancelled from the progress dialog.
+        *session* is an optional (SavedSelection, restore_crop) pair restored once the file is loaded.
         """
-        # Delegate file processing to the FileManager
+        self._file_loader.cancel()
+        self.reset_to_start_state()
+        if not self.file_handler.check_file(file_path, self):
+            return
+        self._pending_session = session
+
+        logger.info(f"Loading file {file_path}")
+        self._load_progress = QProgressDialog("Reading file…", "Cancel", 0, 100, self)
+        self._load_progress.setWindowTitle("Loading File")
+        self._load_progress.setWindowModality(Qt.WindowModal)
+        self._load_progress.setMinimumDuration(300)
+        self._load_progress.setAutoClose(False)
+        self._load_progress.setAutoReset(False)
+        self._load_progress.canceled.connect(self._cancel_file_load)
+        self._load_progress.setValue(0)
+        self._file_loader.load(file_path)
+
+    def resume_session(self, selection_path: str = None, recording: str = None):
+        """
+        Reopens a recording with a previously saved selection.
+
+        Channel status, labels, layout mapping and crop are restored from the selection file
+        instead of starting from a fresh selection; the recording is found via the path stored
+        in the selection, next to it by name, or asked from the user.
+        """
+        if not selection_path:
+            selection_path, _ = QFileDialog.getOpenFileName(
+                self, "Resume Session", "", "Selection Files (*.json *.npz *.msgpack);;All Files (*)")
+            if not selection_path:
+                return
+        try:
+            selection = read_selection(selection_path)
+        except Exception as e:
+            logger.error(f"Could not read selection file {selection_path}: {e}")
+            QMessageBox.critical(self, "Resume Session", f"Could not read the selection file:\n{e}")
+            return
+
+        recording = recording or find_recording(selection, selection_path)
+        if recording is None:
+            ext_glob = " ".join(f"*{e}" for e in EMGFile.supported_extensions())
+            recording, _ = QFileDialog.getOpenFileName(
+                self, f"Locate {selection.file_name}", os.path.dirname(selection_path),
+                f"EMG Files ({ext_glob});;All Files (*)")
+            if not recording:
+                return
+
+        # The .mat saved with the selection is already cropped
+        restore_crop = not is_exported_recording(recording, selection_path)
+        logger.info(f"Resuming session from {selection_path} on {recording}")
+        self.load_file_path(recording, session=(selection, restore_crop))
+
+    def open_recording_browser(self):
+        """Opens the recording browser and loads (or resumes) the recording chosen there."""
+        dlg = RecordingBrowserDialog(parent=self)
+        accepted = dlg.exec_() == QDialog.Accepted
+        recording, selection_file = dlg.recording, dlg.selection_file
+        dlg.deleteLater()  # parented to the window, which would otherwise keep every browser opened
+        if not accepted or not recording:
+            return
+        if selection_file:
+            self.resume_session(selection_file, recording=recording)
+        else:
+            self.load_file_path(recording)
+
+    def _on_file_load_progress(self, percent: int, text: str):
+        if self._load_progress is not None:
+            self._load_progress.setLabelText(text)
+            self._load_progress.setValue(percent)
+
+    def _close_load_progress(self):
+        if self._load_progress is not None:
+            self._load_progress.canceled.disconnect(self._cancel_file_load)
+            self._load_progress.close()
+            self._load_progress.deleteLater()
+            self._load_progress = None
+
+    def _cancel_file_load(self):
+        logger.info("File loading cancelled.")
+        self._close_load_progress()
+        self._file_loader.cancel()
         self.reset_to_start_state()
-        success = self.file_handler.process_file(file_path, self)  # Pass self for parent window context
+
+    def _on_file_load_failed(self, message: str):
+        self._close_load_progress()
+        self.file_handler.show_load_error(self, message)
+        self.reset_to_start_state()
+
+    @property
+    def file_saver(self) -> FileSaver:
+        return self._file_saver
+
+    def _on_save_progress(self, job, percent: int):
+        self.statusBar().showMessage(f"Saving {job.name}… {percent}%")
+
+    def _on_saved(self, job, success: bool, messages: list):
+        if success:
+            self.statusBar().showMessage(f"Saved {job.name}", 5000)
+        else:
+            self.statusBar().clearMessage()
+            show_save_result(self, False, messages)
+
+    def _on_file_loaded(self, loaded: LoadedFile):
+        self._close_load_progress()
+        success = self.file_handler.apply_loaded_file(loaded, self)  # Pass self for parent window context
+
+        if success and self._pending_session is not None:
+            selection, restore_crop = self._pending_session
+            self._pending_session = None
+            self._session_restored = self.file_handler.restore_session(selection, self, restore_crop)
+            if self._session_restored:
+                self.statusBar().showMessage(f"Restored selection of {selection.file_name}", 5000)
 
         if success:
             # Update UI elements enabled/disabled state based on successful load and processing
@@ -277,6 +435,8 @@ class ChannelSelector(QMainWindow):
             if hasattr(self, 'change_grid_action') and self.change_grid_action: self.change_grid_action.setEnabled(True)
             if hasattr(self, 'amplidude_menu') and self.amplidude_menu: self.amplidude_menu.setEnabled(True)
             if hasattr(self, 'save_action') and self.save_action: self.save_action.setEnabled(True)
+            if hasattr(self, 'save_selected_only_action') and self.save_selected_only_action:
+                self.save_selected_only_action.setEnabled(True)
             if hasattr(self, 'suggest_flags_action') and self.suggest_flags_action: self.suggest_flags_action.setEnabled(True)
             if hasattr(self, 'crop_signal_action') and self.crop_signal_action:
                 self.crop_signal_action.setEnabled(True)
@@ -339,14 +499,17 @@ class ChannelSelector(QMainWindow):
             self.electrode_widget.set_orientation_highlight(self.grid_setup_handler.get_orientation(),
                                                             self.grid_setup_handler.get_current_page())
 
-            # Apply RMS labels for the selected grid (if RMS data available)
-            self._apply_rms_labels_for_grid(selected_grid)
+            # Apply RMS labels for the selected grid (if RMS data available); a restored
+            # selection already holds the labels as they were saved
+            self._apply_rms_labels_for_grid(selected_grid, add_labels=not self._session_restored)
 
             self.display_page(orientation_changed)  # Refresh the display
 
             # Enable relevant actions
             self.save_action.setEnabled(True)
+            self.save_selected_only_action.setEnabled(True)
             self.select_all_checkbox.setEnabled(True)
+            self.all_channels_checkbox.setEnabled(True)
             layout_mode = global_state.get_layout_for_fiber(orientation)
             selected_grid_obj = global_state.get_emg_file().get_grid(grid_key=selected_grid)
             muscle = selected_grid_obj.muscle if selected_grid_obj and selected_grid_obj.muscle else None
@@ -357,10 +520,11 @@ class ChannelSelector(QMainWindow):
             dialog.reject()
             pass
 
-    def _apply_rms_labels_for_grid(self, grid_key: str):
+    def _apply_rms_labels_for_grid(self, grid_key: str, add_labels: bool = True):
         """
         Applies RMS quality labels to channels for the selected grid.
         Maps RMS data channel numbers (0-indexed) to channel indices.
+        With add_labels False only the RMS quality shown in the tooltips is set.
         """
         raw_rms_data = global_state.get_raw_rms_data()
         if raw_rms_data is None:
@@ -381,25 +545,26 @@ class ChannelSelector(QMainWindow):
         emg_indices = grid.emg_indices
         rms_quality_map = {}
 
-        for position_0indexed, rms_data in rms_channel_data.items():
-            # position_0indexed is the channel number in RMS file (0-indexed)
-            if 0 <= position_0indexed < len(emg_indices):
-                channel_idx = emg_indices[position_0indexed]
-                if channel_idx is not None:
-                    # Get the BaseChannelLabel for this RMS quality
-                    label = rms_data.get_base_label()
-                    if label:
-                        # Add label to channel (preserving existing labels)
-                        existing_labels = global_state.get_channel_labels(channel_idx)
-                        # Avoid duplicates based on label id
-                        if not any(l.get("id") == label.get("id") for l in existing_labels):
-                            new_labels = existing_labels + [label]
-                            global_state.update_channel_labels(channel_idx, new_labels)
-
-                    # Store RMS quality string for tooltip display
-                    rms_quality_map[channel_idx] = rms_data.rms_quality
-
-        global_state.set_rms_quality_data(rms_quality_map)
+        with global_state.batch():
+            for position_0indexed, rms_data in rms_channel_data.items():
+                # position_0indexed is the channel number in RMS file (0-indexed)
+                if 0 <= position_0indexed < len(emg_indices):
+                    channel_idx = emg_indices[position_0indexed]
+                    if channel_idx is not None:
+                        # Get the BaseChannelLabel for this RMS quality
+                        label = rms_data.get_base_label() if add_labels else None
+                        if label:
+                            # Add label to channel (preserving existing labels)
+                            existing_labels = global_state.get_channel_labels(channel_idx)
+                            # Avoid duplicates based on label id
+                            if not any(l.get("id") == label.get("id") for l in existing_labels):
+                                new_labels = existing_labels + [label]
+                                global_state.update_channel_labels(channel_idx, new_labels)
+
+                        # Store RMS quality string for tooltip display
+                        rms_quality_map[channel_idx] = rms_data.rms_quality
+
+            global_state.set_rms_quality_data(rms_quality_map)
         logger.info(f"Applied RMS labels to {len(rms_quality_map)} channels for grid '{grid_key}'")
 
     def toggle_select_all(self, shortcut=False):
@@ -421,16 +586,19 @@ class ChannelSelector(QMainWindow):
             # Update status in state
             global_state.set_channel_status(select_all_channels(channel_status, False))
             self.select_all_checkbox.setText("Select All")
-
-        self.display_page()  # Refresh display to show changes
-        self.update_info_label()  # Update selected count label
+        # Widgets, electrodes and the selected count follow via global_state.channel_status_changed
 
     def clear_grid_display(self):
-        """Clears all widgets from the channel grid layout."""
+        """Clears all widgets from the channel grid layout and drops the widget pool."""
         for i in reversed(range(self.grid_layout.count())):
             widget = self.grid_layout.itemAt(i).widget()
             if widget:
                 widget.setParent(None)
+        for channel_widget in self._channel_widget_pool:
+            channel_widget.deleteLater()
+        self._channel_widget_pool = []
+        self._channel_widget_positions = {}
+        self.channel_widgets = []
 
     def display_page(self, orientation_change=False):
         """Displays the channels for the current page."""
@@ -445,11 +613,14 @@ class ChannelSelector(QMainWindow):
         current_grid_indices = self.grid_setup_handler.get_current_grid_indices()
         selected_grid_key = self.grid_setup_handler.get_selected_grid()  # Needed for grid info lookup
 
+        if self.all_channels_checkbox.isChecked():
+            self._refresh_all_channels_view()
+            return
+
         self.page_label.setText(f"Page {current_page + 1}/{total_pages}")
         self.prev_button.setEnabled(current_page > 0)
         self.next_button.setEnabled(current_page < total_pages - 1)
 
-        self.clear_grid_display()
         self.checkboxes = []  # Clear list of checkboxes for the previous page
 
         start_idx = current_page * items_per_page
@@ -463,16 +634,14 @@ class ChannelSelector(QMainWindow):
 
         sel_grid = global_state.get_emg_file().get_grid(grid_key=selected_grid_key)
 
+        # Shared y-limits of the whole grid (extent plus 10 % buffer), cached per grid and crop
+        self.ylim = (-1.1, 1.1)
         if selected_grid_key and sel_grid:
             full_grid_indices_flat = [ch for ch in sel_grid.emg_indices if ch is not None]
 
             if full_grid_indices_flat and scaled_data is not None:
-                data_for_grid = scaled_data[:, full_grid_indices_flat]
-                self.global_min = np.min(data_for_grid)
-                self.global_max = np.max(data_for_grid)
+                self.ylim = self._grid_view_model.ylim(scaled_data, selected_grid_key, full_grid_indices_flat)
             else:
-                self.global_min = -1
-                self.global_max = 1
                 if scaled_data is None:
                     logger.warning("Scaled data is None when trying to calculate global min/max.")
                 if not full_grid_indices_flat and selected_grid_key:
@@ -481,68 +650,116 @@ class ChannelSelector(QMainWindow):
 
         else:
             # No grid selected or grid info missing
-            self.global_min = -1
-            self.global_max = 1
             logger.warning("Grid info or selected grid missing, using default ylim.")
 
-        buffer = 0.1 * (abs(self.global_max) + abs(
-            self.global_min)) if self.global_min is not None and self.global_max is not None else 0.2
-        self.ylim = (self.global_min - buffer if self.global_min is not None else -1.1,
-                     self.global_max + buffer if self.global_max is not None else 1.1)
-
         # Get the channels for the current page based on current_grid_indices
         page_channels = current_grid_indices[start_idx:end_idx]
 
         selected_ref_signal = self.get_selected_ref_signal()
 
-        # Create and add a ChannelWidget for each channel on the page
+        # Collect the channels to show; pooled ChannelWidgets are rebound to them
+        page_entries = []
         for page_pos, channel_idx in enumerate(page_channels):
             # channel_idx may be None for empty (NaN) electrode positions — skip them
             if channel_idx is None:
                 continue
 
-            # Ensure channel_idx is valid for scaled_data shape before creating widget
+            # Ensure channel_idx is valid for scaled_data shape before binding a widget
             if scaled_data is None or channel_idx < 0 or channel_idx >= scaled_data.shape[1]:
                 logger.warning(
                     f"Skipping display for channel index {channel_idx}: Data not available or index out of bounds.")
                 continue  # Skip this channel if data is missing or index invalid
+            page_entries.append((page_pos, channel_idx))
 
-            # Determine initial status and labels for this channel
-            initial_status = channel_status[channel_idx] if channel_idx < len(channel_status) else False
-            initial_labels = channel_labels.get(channel_idx, [])
+        thumbnail_size = self._thumbnail_size()
+        page_key = self._page_render_key([ch for _, ch in page_entries], thumbnail_size) if thumbnail_size else None
 
+        self.channel_widgets = []
+        for slot, (page_pos, channel_idx) in enumerate(page_entries):
+            # Determine status and labels for this channel
+            status = channel_status[channel_idx] if channel_idx < len(channel_status) else False
+            labels = channel_labels.get(channel_idx, [])
             electrode_number = self.grid_setup_handler.get_electrode_number(channel_idx)
-            channel_widget = ChannelWidget(
+
+            channel_widget = self._acquire_channel_widget(slot)
+            channel_widget.set_channel(
                 channel_idx=channel_idx,
                 electrode_number=electrode_number,
-                time_data=time_data,  # Pass data for plotting
-                scaled_data_slice=scaled_data[:, channel_idx],  # Pass slice for plotting
-                ylim=self.ylim,  # Pass calculated ylim
-                initial_status=initial_status,  # Pass initial checkbox state
-                initial_labels=initial_labels,  # Pass initial labels
-                parent=self,  # Set self as parent
-                _overlay_ref_signal=selected_ref_signal
+                time_data=time_data,
+                scaled_data_slice=scaled_data[:, channel_idx],
+                ylim=self.ylim,
+                status=status,
+                labels=labels,
+                overlay_ref_signal=selected_ref_signal,
+                prerendered=self._page_render_cache.lookup(page_key, channel_idx) if page_key else None,
             )
 
-            # Connect signals from the ChannelWidget to ChannelSelector methods
-            channel_widget.channel_status_changed.connect(self.handle_single_channel_update)
-            channel_widget.view_detail_requested.connect(self.view_channel_in_detail)
-            channel_widget.view_spectrum_requested.connect(self.view_channel_spectrum)
-
             # Calculate row and col for the QGridLayout
-            ui_col = page_pos % self.channels_per_row
-            # Each ChannelWidget now takes up 1 'logical' row in the grid layout
-            ui_row = page_pos // self.channels_per_row
+            ui_pos = (page_pos // self.channels_per_row, page_pos % self.channels_per_row)
+            if self._channel_widget_positions.get(slot) != ui_pos:
+                if slot in self._channel_widget_positions:
+                    self.grid_layout.removeWidget(channel_widget)
+                self.grid_layout.addWidget(channel_widget, *ui_pos)
+                self._channel_widget_positions[slot] = ui_pos
+            channel_widget.setVisible(True)
+            self.channel_widgets.append(channel_widget)
 
-            # Add the ChannelWidget to the grid layout
-            self.grid_layout.addWidget(channel_widget, ui_row, ui_col)
+        # Park pooled widgets that are not needed on this page
+        for slot in range(len(page_entries), len(self._channel_widget_pool)):
+            channel_widget = self._channel_widget_pool[slot]
+            if self._channel_widget_positions.pop(slot, None) is not None:
+                self.grid_layout.removeWidget(channel_widget)
+            channel_widget.setVisible(False)
+
+        self._refresh_side_panels()
+        # Render the neighbouring pages once the layout has settled
+        QTimer.singleShot(0, self._prefetch_neighbour_pages)
+
+    def _thumbnail_size(self):
+        """Size of the channel thumbnails on screen, or None before the first layout pass."""
+        if not self.channel_widgets:
+            return None
+        size = self.channel_widgets[0].thumbnail.size()
+        return None if size.isEmpty() else size
+
+    def _page_render_key(self, channels: list, size) -> tuple:
+        """Everything the pre-rendered thumbnails of a page depend on."""
+        ref_key = self.select_ref_signal.currentData() if self.show_ref_signals.isChecked() else None
+        return page_render_key(global_state.get_file_path(), global_state.get_crop_range(), channels,
+                               ref_key, self.ylim, (size.width(), size.height()))
+
+    def _page_channels(self, page: int, n_channels: int) -> list:
+        """Valid data channel indices shown on *page* of the current grid."""
+        items_per_page = self.grid_setup_handler.get_items_per_page()
+        indices = self.grid_setup_handler.get_current_grid_indices()[page * items_per_page:(page + 1) * items_per_page]
+        return [ch for ch in indices if ch is not None and 0 <= ch < n_channels]
 
-            # Store the widget instance
-            self.channel_widgets.append(channel_widget)
+    def _prefetch_neighbour_pages(self):
+        """Pre-render the pages next to the current one (and the current one) in the background."""
+        if self.all_channels_checkbox.isChecked() or self.ylim is None:
+            return
+        size = self._thumbnail_size()
+        scaled_data = global_state.get_effective_scaled_data()
+        if size is None or scaled_data is None:
+            return
+        ref_signal = self.get_selected_ref_signal()
+        overlay = ChannelWidget.overlay_signal(ref_signal) if ref_signal is not None else None
 
+        current_page = self.grid_setup_handler.get_current_page()
+        total_pages = self.grid_setup_handler.get_total_pages()
+        requests = []
+        for page in prefetch_pages(current_page, total_pages):
+            channels = self._page_channels(page, scaled_data.shape[1])
+            jobs = [(ch, scaled_data[:, ch], self.ylim, (size.width(), size.height()), overlay)
+                    for ch in channels]
+            requests.append((self._page_render_key(channels, size), jobs))
+        self._page_render_cache.prefetch(requests)
+
+    def _refresh_side_panels(self):
+        """Update the info label and electrode widget after the channel display changed."""
         self.update_info_label()
         self.electrode_widget.update_all(
-            channel_status,
+            global_state.get_channel_status(),
             self.grid_setup_handler.get_current_grid_indices(),
             self.grid_setup_handler.get_grid_channel_map(),
         )
@@ -551,42 +768,122 @@ class ChannelSelector(QMainWindow):
             self.grid_setup_handler.get_current_page()  # Use handler's current page
         )
 
+    def set_all_channels_mode(self, enabled: bool):
+        """Switch between the paged channel grid and the continuous all-channels view."""
+        self.scroll_area.setHidden(enabled)
+        self.channel_scroll_view.setHidden(not enabled)
+        if enabled:
+            # Pooled page widgets are not needed while scrolling through all channels
+            self.clear_grid_display()
+        else:
+            self.channel_scroll_view.clear()
+        if global_state.get_emg_file() is not None and self.grid_setup_handler.get_selected_grid():
+            self.display_page()
+
+    def _build_tile_sections(self) -> list:
+        """One tile section per grid of the loaded file, channels in grid order."""
+        emg_file = global_state.get_emg_file()
+        if emg_file is None:
+            return []
+        return grid_tile_sections(emg_file.grids)
+
+    def _refresh_all_channels_view(self):
+        self.page_label.setText("All channels")
+        self.prev_button.setEnabled(True)
+        self.next_button.setEnabled(True)
+        self.channel_scroll_view.set_content(
+            self._build_tile_sections(),
+            global_state.get_effective_scaled_data(),
+            self.get_selected_ref_signal(),
+        )
+        self._refresh_side_panels()
+
+    def _acquire_channel_widget(self, slot: int) -> ChannelWidget:
+        """Return the pooled ChannelWidget for *slot*, creating it on first use."""
+        if slot < len(self._channel_widget_pool):
+            return self._channel_widget_pool[slot]
+        channel_widget = ChannelWidget(
+            channel_idx=-1,
+            time_data=None,
+            scaled_data_slice=None,
+            ylim=(-1.1, 1.1),
+            initial_status=False,
+            initial_labels=[],
+            parent=self,
+        )
+        # Connect once; the widget emits its currently bound channel index
+        channel_widget.channel_status_changed.connect(self.handle_single_channel_update)
+        channel_widget.view_detail_requested.connect(self.view_channel_in_detail)
+        channel_widget.view_spectrum_requested.connect(self.view_channel_spectrum)
+        self._channel_widget_pool.append(channel_widget)
+        return channel_widget
+
     def get_selected_ref_signal(self):
         selected_ref_signal = self.select_ref_signal.currentData() if self.show_ref_signals.isChecked() else None
-        selected_ref_signal = ChannelWidget.scale_ref_signal(
-            global_state.get_effective_scaled_data()[:, selected_ref_signal]) if selected_ref_signal is not None else None
-        return selected_ref_signal
+        scaled_data = global_state.get_effective_scaled_data()
+        if selected_ref_signal is None or scaled_data is None:
+            return None
+        return self._grid_view_model.reference(scaled_data, selected_ref_signal, global_state.get_max_amplitude())
 
     def handle_single_channel_update(self, idx, state):
         """Handles state change for a single channel checkbox."""
+        global_state.set_channel_selected(idx, state == Qt.Checked)
+
+    def _queue_status_changes(self, channel_indices):
+        self._pending_status_changes.update(channel_indices)
+        self._schedule_channel_updates()
+
+    def _queue_label_changes(self, channel_indices):
+        self._pending_label_changes.update(channel_indices)
+        self._schedule_channel_updates()
+
+    def _schedule_channel_updates(self):
+        # Bursts of changes (e.g. an automatic selection over all grids) are applied in one pass
+        if not self._channel_updates_scheduled:
+            self._channel_updates_scheduled = True
+            QTimer.singleShot(0, self._apply_channel_updates)
+
+    def _apply_channel_updates(self):
+        """Update only the widgets, electrodes and tiles of channels whose status or labels changed."""
+        self._channel_updates_scheduled = False
+        status_changed, self._pending_status_changes = self._pending_status_changes, set()
+        labels_changed, self._pending_label_changes = self._pending_label_changes, set()
+        if global_state.get_emg_file() is None or not (status_changed or labels_changed):
+            return
         channel_status = global_state.get_channel_status()
-        if idx < len(channel_status):  # Safety check
-            update_channel_status_single(channel_status, idx, state)
-        else:
-            logger.warning(f"Attempted to update status for channel index {idx} which is out of bounds.")
-            return  # Exit if index is invalid
+        channel_labels = global_state.get_channel_labels()
 
-        self.update_info_label()  # Update selected count label
+        for channel_widget in self.channel_widgets:
+            idx = channel_widget.channel_idx
+            if idx in status_changed and idx < len(channel_status):
+                channel_widget.update_channel_status(channel_status[idx])
+            if idx in labels_changed:
+                channel_widget.update_labels_display(channel_labels.get(idx, []))
 
-        grid_channel_map = self.grid_setup_handler.get_grid_channel_map()
-        if idx in grid_channel_map:
-            grid_idx = grid_channel_map[idx]
-            self.electrode_widget.set_orientation_highlight(
-                self.grid_setup_handler.get_orientation(),
-                self.grid_setup_handler.get_current_page()
-            )
-            self.electrode_widget.update_electrode(grid_idx, channel_status[idx])
-        else:
-            logger.debug(f"Channel index {idx} not found in current grid map.")
+        if status_changed:
+            self.update_info_label()
+            grid_channel_map = self.grid_setup_handler.get_grid_channel_map()
+            for idx in status_changed:
+                if idx in grid_channel_map and idx < len(channel_status):
+                    self.electrode_widget.update_electrode(grid_channel_map[idx], channel_status[idx])
+
+        if self.channel_scroll_view.isVisible():
+            self.channel_scroll_view.viewport().update()
 
     def prev_page(self):
         """Navigates to the previous page."""
+        if self.all_channels_checkbox.isChecked():
+            self.channel_scroll_view.scroll_pages(-1)
+            return
         if self.grid_setup_handler.get_current_page() > 0:
             self.grid_setup_handler.decrement_page()
             self.display_page()
 
     def next_page(self):
         """Navigates to the next page."""
+        if self.all_channels_checkbox.isChecked():
+            self.channel_scroll_view.scroll_pages(1)
+            return
         if self.grid_setup_handler.get_current_page() < self.grid_setup_handler.get_total_pages() - 1:
             self.grid_setup_handler.increment_page()
             self.display_page()  # Refresh display
@@ -666,24 +963,23 @@ class ChannelSelector(QMainWindow):
             current_labels = {}  # Initialize if None
 
         updated_count = 0
-        for channel_idx, suggestions in suggested_labels.items():
-            if not isinstance(channel_idx, int) or channel_idx < 0 or channel_idx >= global_state.get_emg_file().channel_count:
-                logger.warning(f"Skipping suggested labels for invalid channel index: {channel_idx}")
-                continue
+        with global_state.batch():
+            for channel_idx, suggestions in suggested_labels.items():
+                if not isinstance(channel_idx, int) or channel_idx < 0 or channel_idx >= global_state.get_emg_file().channel_count:
+                    logger.warning(f"Skipping suggested labels for invalid channel index: {channel_idx}")
+                    continue
 
-            # Get current labels for this channel, add suggestions, ensure uniqueness and sorting
-            existing_labels = current_labels.get(channel_idx, [])
-            combined_labels = sorted({str(label): label for label in (existing_labels + suggestions)}.values(), key=lambda l: l["name"])
+                # Get current labels for this channel, add suggestions, ensure uniqueness and sorting
+                existing_labels = current_labels.get(channel_idx, [])
+                combined_labels = sorted({str(label): label for label in (existing_labels + suggestions)}.values(), key=lambda l: l["name"])
 
-            # Only update state if labels actually changed
-            if combined_labels != existing_labels:
-                global_state.update_channel_labels(channel_idx, combined_labels)
-                updated_count += 1
+                # Only update state if labels actually changed
+                if combined_labels != existing_labels:
+                    global_state.update_channel_labels(channel_idx, combined_labels)
+                    updated_count += 1
 
         if updated_count > 0:
             logger.info(f"Applied suggested flags to {updated_count} channels.")
-            # Refresh the display page to show updated labels on the channel widgets
-            self.display_page()
             QMessageBox.information(self, "Auto-Flagger", f"Suggested flags applied to {total_emg_channels} emg-channels and {total_ref_channels} reference signals.")
         else:
             logger.info("Auto-flagger suggested no new flags for any channel.")
@@ -693,12 +989,13 @@ class ChannelSelector(QMainWindow):
         """Resets the application state and UI to the initial state."""
         # Reset the global state singleton
         global_state.reset()
+        self._pending_session = None
+        self._session_restored = False
 
         self.checkboxes = []
         self.upper_quartile = None
-        self.global_min = None
-        self.global_max = None
         self.ylim = None
+        self._grid_view_model.clear()
         self.channel_widgets = []
 
         self.grid_setup_handler = GridSetupHandler()
@@ -712,10 +1009,14 @@ class ChannelSelector(QMainWindow):
         self.separator_line.setHidden(True)
         self.setWindowTitle("hdsemg-select")
         self.clear_grid_display()  # Clear the visual grid layout
+        self.channel_scroll_view.clear()
+        self._page_render_cache.clear()
+        self.all_channels_checkbox.setEnabled(False)
         self.populate_ref_signal_dropdown()
 
         if self.amplidude_menu: self.amplidude_menu.setEnabled(False)
         if self.save_action: self.save_action.setEnabled(False)
+        if self.save_selected_only_action: self.save_selected_only_action.setEnabled(False)
         if self.change_grid_action: self.change_grid_action.setEnabled(False)
         if hasattr(self, 'crop_signal_action') and self.crop_signal_action:
             self.crop_signal_action.setEnabled(False)
@@ -729,6 +1030,9 @@ class ChannelSelector(QMainWindow):
             self.zero_line_menu.setEnabled(False)
         self.electrode_widget.invalidate_signal_overview()
         self.invalidate_density_map()
+        differential_bank.clear()
+        envelope_cache.clear()
+        pyramid_cache.clear()
 
     def open_density_map_dialog(self):
         """Open (or reuse the cached) animated ARV density map dialog."""
@@ -757,6 +1061,15 @@ class ChannelSelector(QMainWindow):
         self._fiber_trajectory_dialog.raise_()
         self._fiber_trajectory_dialog.activateWindow()
 
+    def closeEvent(self, event):
+        if self._file_saver.pending():
+            self.statusBar().showMessage("Finishing save…")
+            self._file_saver.wait()
+        self._file_loader.shutdown()
+        self.channel_scroll_view.shutdown()
+        self._page_render_cache.shutdown()
+        super().closeEvent(event)
+
     def resizeEvent(self, event: QResizeEvent) -> None:
         super().resizeEvent(event)
         if hasattr(self, 'electrode_scroll'):
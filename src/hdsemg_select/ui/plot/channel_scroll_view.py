@@ -0,0 +1,428 @@
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from PyQt5.QtCore import Qt, QObject, QThread, QRect, QPoint, pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QPainter, QColor, QPen, QImage
+from PyQt5.QtWidgets import QAbstractScrollArea, QMenu
+
+from hdsemg_select._log.log_config import logger
+from hdsemg_select.state.state import global_state
+from hdsemg_select.ui.plot.grid_view_model import shared_ylim
+from hdsemg_select.ui.plot.trace_thumbnail import render_trace_image
+from hdsemg_select.ui.theme import Colors
+
+_MIN_TILE_WIDTH = 280
+_TILE_HEIGHT = 170
+_HEADER_HEIGHT = 30   # section (grid) title row
+_TILE_TITLE_HEIGHT = 24
+_TILE_MARGIN = 4
+_PREFETCH_ROWS = 2    # rows rendered ahead of the viewport in both directions
+_CHECKBOX_SIZE = 14
+
+
+@dataclass
+class TileSection:
+    """A titled group of channel tiles, e.g. one electrode grid."""
+    title: str
+    channels: List[int]
+    labels: List[str] = field(default_factory=list)
+
+    def label(self, item: int) -> str:
+        if item < len(self.labels):
+            return self.labels[item]
+        return str(self.channels[item] + 1)
+
+
+def grid_tile_sections(grids) -> List[TileSection]:
+    """One tile section per grid, channels in grid order.
+
+    Tiles are labelled with the electrode number within the grid (local
+    electrode index + 1), the same number GridSetupHandler gives the channel
+    widgets of the selected grid, with or without a physical layout.
+    """
+    sections = []
+    for grid in grids:
+        channels, labels = [], []
+        for position, channel_idx in enumerate(grid.emg_indices or []):
+            if channel_idx is None:
+                continue
+            channels.append(int(channel_idx))
+            labels.append(str(position + 1))
+        if channels:
+            sections.append(TileSection(title=f"Grid: {grid.grid_key}", channels=channels, labels=labels))
+    return sections
+
+
+class TileLayout:
+    """Row geometry of a sectioned tile grid: one header row per section, then rows of tiles.
+
+    Rows have variable heights, so their top offsets are kept in a sorted
+    array and the rows intersecting any vertical range are found by binary
+    search — the basis for only materialising on-screen tiles.
+    """
+
+    def __init__(self, section_sizes: List[int], width: int, min_tile_width: int = _MIN_TILE_WIDTH,
+                 tile_height: int = _TILE_HEIGHT, header_height: int = _HEADER_HEIGHT):
+        self.columns = max(1, int(width) // max(1, min_tile_width))
+        self.tile_width = max(1, int(width) // self.columns)
+        self.tile_height = tile_height
+        self.header_height = header_height
+        self.rows: List[Tuple[int, int]] = []  # (section, first item) — first item -1 for headers
+        heights = []
+        for section, size in enumerate(section_sizes):
+            self.rows.append((section, -1))
+            heights.append(header_height)
+            for first in range(0, size, self.columns):
+                self.rows.append((section, first))
+                heights.append(tile_height)
+        self._section_sizes = list(section_sizes)
+        self.row_tops = np.concatenate(([0], np.cumsum(heights))).astype(np.int64)
+
+    @property
+    def total_height(self) -> int:
+        return int(self.row_tops[-1])
+
+    def rows_in(self, top: int, bottom: int) -> range:
+        """Indices of rows intersecting the vertical range [top, bottom)."""
+        if not self.rows:
+            return range(0)
+        first = max(0, int(np.searchsorted(self.row_tops, top, side='right')) - 1)
+        last = min(len(self.rows), int(np.searchsorted(self.row_tops, bottom, side='left')))
+        return range(first, last)
+
+    def row_items(self, row: int) -> List[Tuple[int, int, int]]:
+        """(section, item, column) for each tile in *row*; empty for header rows."""
+        section, first = self.rows[row]
+        if first < 0:
+            return []
+        last = min(first + self.columns, self._section_sizes[section])
+        return [(section, item, item - first) for item in range(first, last)]
+
+    def hit_test(self, x: int, y: int) -> Optional[Tuple[int, int, QRect]]:
+        """(section, item, tile rect) under the content position (x, y), or None."""
+        rows = self.rows_in(y, y + 1)
+        if not rows:
+            return None
+        row = rows.start
+        column = int(x) // self.tile_width
+        for section, item, col in self.row_items(row):
+            if col == column:
+                return section, item, self.tile_rect(row, col)
+        return None
+
+    def tile_rect(self, row: int, column: int) -> QRect:
+        return QRect(column * self.tile_width, int(self.row_tops[row]), self.tile_width, self.tile_height)
+
+
+class _TileRenderWorker(QObject):
+    """Renders tile images off the GUI thread; lives in the view's QThread for its whole lifetime."""
+    tile_rendered = pyqtSignal(object, object)  # key, QImage
+
+    def __init__(self, view: "ChannelScrollView"):
+        super().__init__()
+        self._view = view
+        self._ylims: Dict[tuple, tuple] = {}
+        self._lock = threading.Lock()
+
+    def reset(self):
+        with self._lock:
+            self._ylims.clear()
+
+    @pyqtSlot(object)
+    def render(self, jobs: list):
+        for key, section_key, signal, channels, size, reference in jobs:
+            if not self._view.wants(key):
+                continue  # scrolled away or content replaced before we got here
+            try:
+                ylim = self._section_ylim(section_key, channels)
+                image = render_trace_image(signal, ylim, size[0], size[1], reference)
+            except Exception as e:
+                logger.error(f"Rendering channel tile {key} failed: {e}")
+                continue
+            self.tile_rendered.emit(key, image)
+
+    def _section_ylim(self, section_key: tuple, channels: list) -> tuple:
+        """Shared y-limits of a section, as in the paged view (extent plus 10 % buffer)."""
+        with self._lock:
+            hit = self._ylims.get(section_key)
+        if hit is not None:
+            return hit
+        ylim = shared_ylim(channels)
+        with self._lock:
+            self._ylims[section_key] = ylim
+        return ylim
+
+
+class ChannelScrollView(QAbstractScrollArea):
+    """Continuous, virtualized view of all channels of all grids.
+
+    Only tiles inside the viewport (plus a few prefetch rows) exist as
+    images; they are rendered in a background thread and dropped once they
+    scroll out of that window, so memory is bounded by the viewport size
+    rather than the channel count. Emits the same signals as ChannelWidget.
+    """
+    channel_status_changed = pyqtSignal(int, int)  # channel_idx, state (Qt.Checked/Unchecked)
+    view_detail_requested = pyqtSignal(int)  # channel_idx
+    view_spectrum_requested = pyqtSignal(int)  # channel_idx
+    _render_requested = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.viewport().setAttribute(Qt.WA_OpaquePaintEvent)
+
+        self._sections: List[TileSection] = []
+        self._data: Optional[np.ndarray] = None
+        self._reference: Optional[np.ndarray] = None
+        self._layout = TileLayout([], 1)
+        self._generation = 0
+        self._images: Dict[tuple, QImage] = {}   # (generation, section, item) -> tile image
+        self._pending: set = set()
+        self._wanted: frozenset = frozenset()
+
+        self._thread = QThread(self)
+        self._worker = _TileRenderWorker(self)
+        self._worker.moveToThread(self._thread)
+        self._render_requested.connect(self._worker.render)
+        self._worker.tile_rendered.connect(self._on_tile_rendered)
+        self._thread.start()
+
+    # ------------------------------------------------------------------ #
+    # Content                                                              #
+    # ------------------------------------------------------------------ #
+    def set_content(self, sections: List[TileSection], data: Optional[np.ndarray],
+                    reference: Optional[np.ndarray] = None) -> None:
+        """Show *sections* of columns of *data*; a no-op if nothing changed."""
+        same_data = data is self._data or (
+            data is not None and self._data is not None
+            and data.__array_interface__ == self._data.__array_interface__)
+        same_ref = reference is self._reference or (
+            reference is not None and self._reference is not None
+            and reference.shape == self._reference.shape and np.array_equal(reference, self._reference))
+        if same_data and same_ref and sections == self._sections:
+            self.viewport().update()
+            return
+        self._sections = list(sections)
+        self._data = data
+        self._reference = reference
+        self._invalidate()
+
+    def set_reference(self, reference: Optional[np.ndarray]) -> None:
+        self.set_content(self._sections, self._data, reference)
+
+    def clear(self) -> None:
+        self._sections = []
+        self._data = None
+        self._reference = None
+        self._invalidate()
+
+    def scroll_pages(self, pages: int) -> None:
+        bar = self.verticalScrollBar()
+        bar.setValue(bar.value() + pages * bar.pageStep())
+
+    def shutdown(self) -> None:
+        """Stop the render thread; call before the owning window closes."""
+        self._wanted = frozenset()
+        if self._thread.isRunning():
+            self._thread.quit()
+            self._thread.wait()
+
+    def wants(self, key: tuple) -> bool:
+        return key in self._wanted
+
+    def cached_tile_count(self) -> int:
+        return len(self._images)
+
+    # ------------------------------------------------------------------ #
+    # Virtualization                                                       #
+    # ------------------------------------------------------------------ #
+    def _invalidate(self) -> None:
+        self._generation += 1
+        self._worker.reset()
+        self._images.clear()
+        self._pending.clear()
+        self._relayout()
+
+    def _relayout(self) -> None:
+        self._layout = TileLayout([len(s.channels) for s in self._sections], self.viewport().width())
+        bar = self.verticalScrollBar()
+        bar.setRange(0, max(0, self._layout.total_height - self.viewport().height()))
+        bar.setPageStep(self.viewport().height())
+        bar.setSingleStep(self._layout.tile_height // 4)
+        self._sync_tiles()
+        self.viewport().update()
+
+    def _image_size(self) -> Tuple[int, int]:
+        return (self._layout.tile_width - 2 * _TILE_MARGIN,
+                self._layout.tile_height - 2 * _TILE_MARGIN - _TILE_TITLE_HEIGHT)
+
+    def _sync_tiles(self) -> None:
+        """Drop images outside the prefetch window and queue rendering of missing ones."""
+        if self._data is None or not self._sections:
+            self._wanted = frozenset()
+            return
+        top = self.verticalScrollBar().value()
+        height = self.viewport().height()
+        visible = self._layout.rows_in(top, top + height)
+        margin = _PREFETCH_ROWS * self._layout.tile_height
+        window = self._layout.rows_in(max(0, top - margin), top + height + margin)
+
+        # Visible rows first, then the prefetch margin
+        ordered_rows = list(visible) + [r for r in window if r not in visible]
+        keys = [(self._generation, section, item)
+                for row in ordered_rows for section, item, _ in self._layout.row_items(row)]
+        self._wanted = frozenset(keys)
+        for key in [k for k in self._images if k not in self._wanted]:
+            del self._images[key]
+        self._pending &= self._wanted
+
+        jobs = []
+        size = self._image_size()
+        for key in keys:
+            if key in self._images or key in self._pending:
+                continue
+            _, section, item = key
+            channels = self._sections[section].channels
+            if not 0 <= channels[item] < self._data.shape[1]:
+                continue
+            section_signals = [self._data[:, ch] for ch in channels if 0 <= ch < self._data.shape[1]]
+            jobs.append((key, (self._generation, section), self._data[:, channels[item]],
+                         section_signals, size, self._reference))
+            self._pending.add(key)
+        if jobs:
+            self._render_requested.emit(jobs)
+
+    def _on_tile_rendered(self, key, image):
+        self._pending.discard(key)
+        if key in self._wanted:
+            self._images[key] = image
+            self.viewport().update()
+
+    # ------------------------------------------------------------------ #
+    # Qt events                                                            #
+    # ------------------------------------------------------------------ #
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        old_columns, old_width = self._layout.columns, self._layout.tile_width
+        self._layout = TileLayout([len(s.channels) for s in self._sections], self.viewport().width())
+        if (old_columns, old_width) != (self._layout.columns, self._layout.tile_width):
+            # Tile size changed: every image has to be re-rendered
+            self._generation += 1
+            self._images.clear()
+            self._pending.clear()
+        self._relayout()
+
+    def scrollContentsBy(self, dx, dy):
+        self._sync_tiles()
+        self.viewport().update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self.viewport())
+        painter.fillRect(event.rect(), QColor(Colors.BG_SECONDARY))
+        if not self._sections:
+            painter.setPen(QColor(Colors.TEXT_SECONDARY))
+            painter.drawText(self.viewport().rect(), Qt.AlignCenter, "No channels")
+            painter.end()
+            return
+
+        top = self.verticalScrollBar().value()
+        status = global_state.get_channel_status() or []
+        labels = global_state.get_channel_labels() or {}
+        painter.translate(0, -top)
+        for row in self._layout.rows_in(top, top + self.viewport().height()):
+            section, first = self._layout.rows[row]
+            if first < 0:
+                self._paint_header(painter, row, section)
+                continue
+            for _, item, column in self._layout.row_items(row):
+                channel = self._sections[section].channels[item]
+                selected = bool(status[channel]) if channel < len(status) else False
+                self._paint_tile(painter, self._layout.tile_rect(row, column), section, item,
+                                 selected, labels.get(channel, []))
+        painter.end()
+
+    def _paint_header(self, painter: QPainter, row: int, section: int):
+        rect = QRect(0, int(self._layout.row_tops[row]), self.viewport().width(), self._layout.header_height)
+        font = painter.font()
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(QColor(Colors.TEXT_PRIMARY))
+        painter.drawText(rect.adjusted(_TILE_MARGIN, 0, 0, 0), Qt.AlignVCenter | Qt.AlignLeft,
+                         self._sections[section].title)
+        font.setBold(False)
+        painter.setFont(font)
+
+    def _paint_tile(self, painter: QPainter, rect: QRect, section: int, item: int,
+                    selected: bool, channel_labels: list):
+        inner = rect.adjusted(_TILE_MARGIN, _TILE_MARGIN, -_TILE_MARGIN, -_TILE_MARGIN)
+        painter.fillRect(inner, QColor(Colors.BG_PRIMARY))
+        painter.setPen(QPen(QColor(Colors.BORDER_DEFAULT), 1))
+        painter.drawRect(inner)
+
+        box = self._checkbox_rect(rect)
+        painter.setPen(QPen(QColor(Colors.BLUE_600 if selected else Colors.BORDER_DEFAULT), 2))
+        painter.setBrush(QColor(Colors.BLUE_600) if selected else Qt.NoBrush)
+        painter.drawRect(box)
+        painter.setBrush(Qt.NoBrush)
+
+        title = f"Ch {self._sections[section].label(item)}"
+        if channel_labels:
+            title += "   " + ", ".join(label.get("name", "") for label in channel_labels)
+        painter.setPen(QColor(Colors.TEXT_PRIMARY))
+        text_rect = QRect(box.right() + 6, inner.top(), inner.right() - box.right() - 8, _TILE_TITLE_HEIGHT)
+        painter.drawText(text_rect, Qt.AlignVCenter | Qt.AlignLeft,
+                         painter.fontMetrics().elidedText(title, Qt.ElideRight, text_rect.width()))
+
+        image_rect = QRect(inner.left(), inner.top() + _TILE_TITLE_HEIGHT, *self._image_size())
+        image = self._images.get((self._generation, section, item))
+        if image is not None:
+            painter.drawImage(image_rect.topLeft(), image)
+        else:
+            painter.setPen(QColor(Colors.TEXT_SECONDARY))
+            painter.drawText(image_rect, Qt.AlignCenter, "…")
+
+    @staticmethod
+    def _checkbox_rect(tile_rect: QRect) -> QRect:
+        left = tile_rect.left() + _TILE_MARGIN + 6
+        top = tile_rect.top() + _TILE_MARGIN + (_TILE_TITLE_HEIGHT - _CHECKBOX_SIZE) // 2
+        return QRect(left, top, _CHECKBOX_SIZE, _CHECKBOX_SIZE)
+
+    def _channel_at(self, pos):
+        hit = self._layout.hit_test(pos.x(), pos.y() + self.verticalScrollBar().value())
+        if hit is None:
+            return None
+        section, item, rect = hit
+        return self._sections[section].channels[item], rect
+
+    def mousePressEvent(self, event):
+        hit = self._channel_at(event.pos()) if event.button() == Qt.LeftButton else None
+        if hit is not None:
+            channel, rect = hit
+            content_pos = QPoint(event.pos().x(), event.pos().y() + self.verticalScrollBar().value())
+            if self._checkbox_rect(rect).adjusted(-4, -4, 4, 4).contains(content_pos):
+                status = global_state.get_channel_status() or []
+                selected = bool(status[channel]) if channel < len(status) else False
+                self.channel_status_changed.emit(channel, Qt.Unchecked if selected else Qt.Checked)
+                self.viewport().update()
+                return
+        super().mousePressEvent(event)
+
+    def mouseDoubleClickEvent(self, event):
+        hit = self._channel_at(event.pos())
+        if hit is not None:
+            self.view_detail_requested.emit(hit[0])
+            return
+        super().mouseDoubleClickEvent(event)
+
+    def contextMenuEvent(self, event):
+        hit = self._channel_at(event.pos())
+        if hit is None:
+            return
+        channel = hit[0]
+        menu = QMenu(self)
+        menu.addAction("View Time Series", lambda: self.view_detail_requested.emit(channel))
+        menu.addAction("View Frequency Spectrum", lambda: self.view_spectrum_requested.emit(channel))
+        menu.exec_(event.globalPos())
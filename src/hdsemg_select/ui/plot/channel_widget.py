@@ -1,18 +1,15 @@
 # ui/channel_widget.py
-from functools import partial
-
 import numpy as np
 from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                              QCheckBox, QMenu, QWidgetAction, QToolButton)
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
 from PyQt5.QtCore import pyqtSignal
 
 from hdsemg_select.state.state import global_state
 from hdsemg_select.config.config_manager import config # For getting available labels
 from hdsemg_select.ui.labels.label_bean_widget import LabelBeanWidget
 from hdsemg_select.ui.labels.label_selection_widget import LabelSelectionWidget
+from hdsemg_select.ui.plot.trace_thumbnail import TraceThumbnail
 from hdsemg_select._log.log_config import logger
 from hdsemg_select.ui.theme import Colors, Spacing, BorderRadius, Styles
 
@@ -20,6 +17,8 @@ class ChannelWidget(QWidget):
     channel_status_changed = pyqtSignal(int, int)  # channel_idx, state (Qt.Checked/Unchecked)
     view_detail_requested = pyqtSignal(int)  # channel_idx
     view_spectrum_requested = pyqtSignal(int)  # channel_idx
+    REF_OVERLAY_SCALE = 0.9  # the reference overlay is drawn slightly smaller than the data
+    _last_overlay = (None, None)  # (scaled reference, overlay) shared by all widgets of a page
 
     def __init__(self, channel_idx: int, time_data, scaled_data_slice, ylim: tuple,
                  initial_status: bool, initial_labels: list, parent=None,
@@ -37,9 +36,8 @@ class ChannelWidget(QWidget):
         self.main_layout.setContentsMargins(Spacing.XS, Spacing.XS, Spacing.XS, Spacing.XS)
         self.main_layout.setSpacing(Spacing.XS)
 
-        self.figure = Figure(figsize=(4, 2), dpi=100)
-        self.canvas = FigureCanvas(self.figure)
-        self.main_layout.addWidget(self.canvas)
+        self.thumbnail = TraceThumbnail(self)
+        self.main_layout.addWidget(self.thumbnail)
         self._draw_plot()
 
         self.controls_layout = QVBoxLayout()
@@ -72,7 +70,7 @@ class ChannelWidget(QWidget):
 
         self.checkbox = QCheckBox(f"Ch {self.channel_number}")
         self.checkbox.setChecked(initial_status)
-        self.checkbox.stateChanged.connect(partial(self.channel_status_changed.emit, self.channel_idx))
+        self.checkbox.stateChanged.connect(self._on_checkbox_state_changed)
         self.buttons_h_layout.addWidget(self.checkbox)
 
         self.buttons_h_layout.addStretch(1)
@@ -82,7 +80,7 @@ class ChannelWidget(QWidget):
         self.view_button.setIcon(QIcon(":/resources/extend.png"))
         self.view_button.setToolTip("View Time Series")
         self.view_button.setFixedSize(30, 30)
-        self.view_button.clicked.connect(partial(self.view_detail_requested.emit, self.channel_idx))
+        self.view_button.clicked.connect(lambda: self.view_detail_requested.emit(self.channel_idx))
         self.buttons_h_layout.addWidget(self.view_button)
 
         self.spectrum_button = QPushButton()
@@ -90,15 +88,40 @@ class ChannelWidget(QWidget):
         self.spectrum_button.setIcon(QIcon(":/resources/frequency.png"))
         self.spectrum_button.setToolTip("View Frequency Spectrum")
         self.spectrum_button.setFixedSize(30, 30)
-        self.spectrum_button.clicked.connect(partial(self.view_spectrum_requested.emit, self.channel_idx))
+        self.spectrum_button.clicked.connect(lambda: self.view_spectrum_requested.emit(self.channel_idx))
         self.buttons_h_layout.addWidget(self.spectrum_button)
 
+        # Label changes are pushed in by the main window (global_state.labels_changed)
 
-        global_state.channel_labels_changed.connect(self._on_label_changed)
         # Initial check for available labels to set button state
         self._check_available_labels()
 
 
+    def set_channel(self, channel_idx: int, time_data, scaled_data_slice, ylim: tuple,
+                    status: bool, labels: list, overlay_ref_signal=None,
+                    electrode_number: int = None, prerendered=None):
+        """Rebind this (pooled) widget to another channel without rebuilding it.
+
+        *prerendered* is an optional QPixmap of the thumbnail from the page render cache.
+        """
+        channel_changed = channel_idx != self.channel_idx
+        self.channel_idx = channel_idx
+        self.channel_number = electrode_number if electrode_number is not None else channel_idx + 1
+        self.time_data = time_data
+        self.scaled_data_slice = scaled_data_slice
+        self.ylim = ylim
+        self._overlay_ref_signal = overlay_ref_signal
+        self._draw_plot(prerendered)
+
+        self.checkbox.setText(f"Ch {self.channel_number}")
+        self.update_channel_status(status)
+        if channel_changed or list(labels) != self._current_labels:
+            self._check_available_labels()
+            self.update_labels_display(labels)
+
+    def _on_checkbox_state_changed(self, state: int):
+        self.channel_status_changed.emit(self.channel_idx, state)
+
     def _check_available_labels(self):
         """Disables the add label button if no labels are available."""
         available_labels = config.get_available_channel_labels()
@@ -138,31 +161,36 @@ class ChannelWidget(QWidget):
     def _apply_new_labels(self, new_labels: list):
         global_state.update_channel_labels(self.channel_idx, new_labels)
         logger.info(f"Labels updated for Channel {self.channel_number} ({self.channel_idx}): {new_labels}")
-        # The global_state change will trigger _on_label_changed, which updates display.
+        # The main window refreshes this widget when global_state announces the change.
 
-    def _draw_plot(self):
+    def _draw_plot(self, prerendered=None):
         if self.time_data is None or self.scaled_data_slice is None:
-            ax = self.figure.add_subplot(111)
-            ax.text(0.5, 0.5, "No data", horizontalalignment='center', verticalalignment='center',
-                    transform=ax.transAxes)
-            ax.set_xticks([])
-            ax.set_yticks([])
-            self.canvas.draw()
+            self.thumbnail.set_data(None, None, self.ylim)
             return
 
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
-        ax.plot(self.time_data, self.scaled_data_slice, color="blue", linewidth=1, label=f"Ch {self.channel_number}")
-        if self._overlay_ref_signal is not None:
-            if len(self._overlay_ref_signal) == len(self.time_data):
-                ax.plot(self.time_data, self._overlay_ref_signal * 0.9, color="black", linewidth=1, label="Reference", linestyle="--")
-                ax.legend(loc='upper right', frameon=False, fontsize='small')
-            else:
-                logger.warning(f"Reference signal length does not match time data length for Channel {self.channel_number}")
-        ax.set_ylim(self.ylim)
-        ax.axis('off')
-        self.figure.tight_layout(pad=0)
-        self.canvas.draw()
+        self.thumbnail.set_data(self.time_data, self.scaled_data_slice, self.ylim, reference=self._overlay(),
+                                prerendered=prerendered)
+
+    def _overlay(self):
+        if self._overlay_ref_signal is None:
+            return None
+        if len(self._overlay_ref_signal) != len(self.time_data):
+            logger.warning(f"Reference signal length does not match time data length for Channel {self.channel_number}")
+            return None
+        return self.overlay_signal(self._overlay_ref_signal)
+
+    @classmethod
+    def overlay_signal(cls, ref_signal):
+        """The scaled reference as drawn over the channel traces.
+
+        Returns the same array for the same *ref_signal* object, so the widgets
+        of a page share one overlay (and its cached min/max pyramid).
+        """
+        source, overlay = cls._last_overlay
+        if source is not ref_signal:
+            overlay = ref_signal * cls.REF_OVERLAY_SCALE
+            cls._last_overlay = (ref_signal, overlay)
+        return overlay
 
     def update_labels_display(self, labels: list):
         self._current_labels = list(labels) # Update internal cache
@@ -205,19 +233,16 @@ class ChannelWidget(QWidget):
         self.checkbox.setChecked(status)
         self.checkbox.blockSignals(False)
 
-    def _on_label_changed(self, ch_idx: int, new_labels: list):
-        if ch_idx == self.channel_idx:
-            self.update_labels_display(new_labels)
-
     def set_overlay_signal(self, overlay_signal):
         """
         Set the overlay reference signal for the channel plot.
         :param overlay_signal: The reference signal to overlay on the channel plot.
         """
         self._overlay_ref_signal = overlay_signal
-        self._draw_plot()
-        self.canvas.draw_idle()
-        self.update()
+        if self.time_data is None or self.scaled_data_slice is None:
+            return
+        # Only the overlay changes; the thumbnail keeps its trace polyline
+        self.thumbnail.set_reference(self._overlay())
 
     @staticmethod
     def scale_ref_signal(ref_sig):
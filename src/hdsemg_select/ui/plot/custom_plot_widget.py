@@ -4,6 +4,12 @@ from PyQt5.QtGui import QPainter, QPen, QColor, QFont, QBrush
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QSizePolicy
 
 from hdsemg_select._log.log_config import logger
+from hdsemg_select.logic.decimation.envelope import m4_decimate
+from hdsemg_select.ui.plot.polyline import to_qpolygonf
+
+
+def _is_sorted(x: np.ndarray) -> bool:
+    return len(x) < 2 or bool(np.all(np.diff(x) >= 0))
 
 
 class CustomPlotWidget(QWidget):
@@ -24,6 +30,9 @@ class CustomPlotWidget(QWidget):
         self.y_data = None
         self.x_ref_data = None
         self.y_ref_data = None
+        self._x_sorted = False
+        self._x_ref_sorted = False
+        self._bounds_cache = None  # data bounds, recomputed only when data changes
 
         # Plot settings
         self.title = ""
@@ -75,6 +84,8 @@ class CustomPlotWidget(QWidget):
             self.x_data = None
             self.y_data = None
 
+        self._x_sorted = self.x_data is not None and _is_sorted(self.x_data)
+        self._invalidate_bounds()
         self.update()
 
     def set_reference_data(self, x_ref_data, y_ref_data):
@@ -91,6 +102,8 @@ class CustomPlotWidget(QWidget):
             self.x_ref_data = None
             self.y_ref_data = None
 
+        self._x_ref_sorted = self.x_ref_data is not None and _is_sorted(self.x_ref_data)
+        self._invalidate_bounds()
         self.update()
 
     def add_trace(self, x_data, y_data, color="blue", line_style=Qt.SolidLine, line_width=1, label=""):
@@ -109,14 +122,20 @@ class CustomPlotWidget(QWidget):
                 logger.warning(f"x_data and y_data lengths don't match for trace '{label}'")
                 return
 
+            trace['sorted'] = _is_sorted(trace['x'])
             self.traces.append(trace)
+            self._invalidate_bounds()
             self.update()
 
     def clear_traces(self):
         """Clear all traces."""
         self.traces.clear()
+        self._invalidate_bounds()
         self.update()
 
+    def _invalidate_bounds(self):
+        self._bounds_cache = None
+
     def set_axis_limits(self, x_min=None, x_max=None, y_min=None, y_max=None):
         """Set axis limits. None means auto-scale."""
         self.x_min = x_min
@@ -147,7 +166,12 @@ class CustomPlotWidget(QWidget):
         self.update()
 
     def _calculate_data_bounds(self):
-        """Calculate the bounds of all data for auto-scaling."""
+        """Calculate the bounds of all data for auto-scaling (cached until the data changes)."""
+        if self._bounds_cache is None:
+            self._bounds_cache = self._compute_data_bounds()
+        return self._bounds_cache
+
+    def _compute_data_bounds(self):
         x_min, x_max, y_min, y_max = None, None, None, None
 
         # Main data bounds (backward compatibility)
@@ -312,61 +336,67 @@ class CustomPlotWidget(QWidget):
             y = self.margin_top + (i + 1) * plot_height // 5
             painter.drawLine(self.margin_left, y, self.width() - self.margin_right, y)
 
+    def _series_polygons(self, x, y, is_sorted, bounds):
+        """Transform a series to widget coordinates in one pass; returns one QPolygonF per finite run.
+
+        Sorted series longer than a few points per pixel column are reduced to
+        their visible range and min/max decimated to the plot width first.
+        """
+        plot_x_min, plot_x_max, plot_y_min, plot_y_max = bounds
+        plot_width = self.width() - self.margin_left - self.margin_right
+        plot_height = self.height() - self.margin_top - self.margin_bottom
+
+        if is_sorted and plot_width > 0 and len(x) > 4 * plot_width:
+            start, end = np.searchsorted(x, [plot_x_min, plot_x_max])
+            start, end = max(int(start) - 1, 0), min(int(end) + 1, len(x))
+            idx, _ = m4_decimate(y, plot_width, start, end)
+            x, y = x[idx], y[idx]
+
+        if plot_x_max - plot_x_min == 0:
+            widget_x = np.full(len(x), self.margin_left + plot_width // 2, dtype=float)
+        else:
+            widget_x = self.margin_left + (x - plot_x_min) * (plot_width / (plot_x_max - plot_x_min))
+
+        if plot_y_max - plot_y_min == 0:
+            widget_y = np.full(len(y), self.margin_top + plot_height // 2, dtype=float)
+        else:
+            widget_y = (self.height() - self.margin_bottom) - (y - plot_y_min) * (plot_height / (plot_y_max - plot_y_min))
+
+        finite = np.isfinite(widget_x) & np.isfinite(widget_y)
+        if finite.all():
+            return [to_qpolygonf(widget_x, widget_y)]
+
+        # Break the line at NaN/inf samples instead of bridging the gap
+        edges = np.flatnonzero(np.diff(np.concatenate(([False], finite, [False])).astype(np.int8)))
+        return [to_qpolygonf(widget_x[a:b], widget_y[a:b])
+                for a, b in zip(edges[::2], edges[1::2]) if b - a >= 2]
+
+    def _draw_series(self, painter, pen, x, y, is_sorted):
+        if x is None or y is None or len(x) < 2:
+            return
+        painter.setPen(pen)
+        for polygon in self._series_polygons(x, y, is_sorted, self._get_plot_bounds()):
+            painter.drawPolyline(polygon)
+
     def _draw_traces(self, painter):
         """Draw all traces."""
         # Draw multi-traces first
         for trace in self.traces:
-            if len(trace['x']) < 2:
-                continue
-
             pen = QPen(trace['color'], trace['width'], trace['style'])
-            painter.setPen(pen)
-
-            # Convert first point
-            prev_x, prev_y = self._transform_coordinates(trace['x'][0], trace['y'][0])
-
-            # Draw line segments
-            for i in range(1, len(trace['x'])):
-                curr_x, curr_y = self._transform_coordinates(trace['x'][i], trace['y'][i])
-                painter.drawLine(prev_x, prev_y, curr_x, curr_y)
-                prev_x, prev_y = curr_x, curr_y
+            self._draw_series(painter, pen, trace['x'], trace['y'], trace.get('sorted', False))
 
         # Draw main data (backward compatibility)
         self._draw_data(painter)
 
     def _draw_data(self, painter):
         """Draw the main data line (backward compatibility)."""
-        if self.x_data is None or self.y_data is None or len(self.x_data) < 2:
-            return
-
         pen = QPen(self.line_color, self.line_width)
-        painter.setPen(pen)
-
-        # Convert first point
-        prev_x, prev_y = self._transform_coordinates(self.x_data[0], self.y_data[0])
-
-        # Draw line segments
-        for i in range(1, len(self.x_data)):
-            curr_x, curr_y = self._transform_coordinates(self.x_data[i], self.y_data[i])
-            painter.drawLine(prev_x, prev_y, curr_x, curr_y)
-            prev_x, prev_y = curr_x, curr_y
+        self._draw_series(painter, pen, self.x_data, self.y_data, self._x_sorted)
 
     def _draw_reference_data(self, painter):
         """Draw the reference data line."""
-        if self.x_ref_data is None or self.y_ref_data is None or len(self.x_ref_data) < 2:
-            return
-
         pen = QPen(self.ref_line_color, self.ref_line_width, self.ref_line_style)
-        painter.setPen(pen)
-
-        # Convert first point
-        prev_x, prev_y = self._transform_coordinates(self.x_ref_data[0], self.y_ref_data[0])
-
-        # Draw line segments
-        for i in range(1, len(self.x_ref_data)):
-            curr_x, curr_y = self._transform_coordinates(self.x_ref_data[i], self.y_ref_data[i])
-            painter.drawLine(prev_x, prev_y, curr_x, curr_y)
-            prev_x, prev_y = curr_x, curr_y
+        self._draw_series(painter, pen, self.x_ref_data, self.y_ref_data, self._x_ref_sorted)
 
     def paintEvent(self, event):
         """Main paint event handler."""
@@ -401,6 +431,7 @@ class CustomPlotWidget(QWidget):
         self.x_ref_data = None
         self.y_ref_data = None
         self.traces.clear()
+        self._invalidate_bounds()
         self.update()
 
 
@@ -0,0 +1,82 @@
+from typing import Optional
+
+import numpy as np
+
+from hdsemg_select.logic.decimation.pyramid import pyramid_cache
+
+
+class DecimatedLine:
+    """Keeps a matplotlib Line2D showing a pixel-resolution envelope of a long signal.
+
+    Instead of the full-resolution array, the line only ever holds the min/max
+    envelope of the visible x-range at the axes' pixel width. The envelope is
+    recomputed from a cached MinMaxPyramid whenever the x-limits change
+    (zoom/pan) or the canvas is resized. *scale* and *offset* are applied to
+    the envelope values (scale must be positive), so stacked or normalized
+    traces can share the pyramid of the raw signal.
+
+    The axes' xlim callbacks are dropped by ``ax.clear()``; call
+    :meth:`disconnect` before clearing to also release the canvas callback.
+    """
+
+    def __init__(self, line, signal: np.ndarray, x: Optional[np.ndarray] = None,
+                 scale: float = 1.0, offset: float = 0.0):
+        self.line = line
+        self.signal = signal
+        self.x = x
+        self.scale = float(scale)
+        self.offset = float(offset)
+        self.pyramid = pyramid_cache.get(signal)
+
+        ax = line.axes
+        self._xlim_cid = ax.callbacks.connect('xlim_changed', self._on_xlim_changed)
+        self._resize_cid = ax.figure.canvas.mpl_connect('resize_event', self._on_resize)
+        self._canvas = ax.figure.canvas
+        self._view = None
+        self._set_range(0, len(signal))
+
+    def disconnect(self) -> None:
+        if self._canvas is not None:
+            self._canvas.mpl_disconnect(self._resize_cid)
+            self._canvas = None
+        if self.line.axes is not None:
+            self.line.axes.callbacks.disconnect(self._xlim_cid)
+
+    def _pixel_width(self) -> int:
+        ax = self.line.axes
+        try:
+            return max(1, int(round(ax.get_window_extent().width)))
+        except Exception:
+            return 1000
+
+    def _sample_range(self, x0: float, x1: float):
+        n = len(self.signal)
+        lo, hi = min(x0, x1), max(x0, x1)
+        if self.x is None:
+            start, end = int(np.floor(lo)), int(np.ceil(hi)) + 1
+        else:
+            start = int(np.searchsorted(self.x, lo, side='left')) - 1
+            end = int(np.searchsorted(self.x, hi, side='right')) + 1
+        return max(0, start), min(n, end)
+
+    def _set_range(self, start: int, end: int) -> None:
+        width = self._pixel_width()
+        view = (start, end, width)
+        if view == self._view:
+            return
+        self._view = view
+        idx, values = self.pyramid.envelope(start, end, width)
+        xs = idx if self.x is None else self.x[idx]
+        self.line.set_data(xs, values * self.scale + self.offset)
+
+    def refresh(self) -> None:
+        ax = self.line.axes
+        if ax is None:
+            return
+        self._set_range(*self._sample_range(*ax.get_xlim()))
+
+    def _on_xlim_changed(self, ax):
+        self.refresh()
+
+    def _on_resize(self, event):
+        self.refresh()
@@ -14,13 +14,20 @@ from matplotlib.figure import Figure
 from matplotlib.gridspec import GridSpec
 from matplotlib.patches import Rectangle
 
-from hdsemg_shared.preprocessing.differential import to_differential
-
 from hdsemg_select._log.log_config import logger
 from hdsemg_select.config.config_enums import Settings
 from hdsemg_select.config.config_manager import config
+from hdsemg_select.controller.differential_loader import DifferentialLoader
 from hdsemg_select.controller.grid_setup_handler import GridSetupHandler
-from hdsemg_select.logic.density.arv import compute_arv_window, channels_to_grid, ms_to_samples
+from hdsemg_select.controller.pyramid_loader import AmplitudePyramidLoader
+from hdsemg_select.logic.density.arv import channels_to_grid, compute_arv_window, compute_rms_window, ms_to_samples
+from hdsemg_select.logic.density.interpolation import GridInterpolator
+from hdsemg_select.logic.density.pyramid import AmplitudePyramid
+from hdsemg_select.logic.density.summary import mean_amplitude
+from hdsemg_select.logic.decimation.envelope import envelope_cache
+from hdsemg_select.logic.differential.bank import (
+    DifferentialKey, DifferentialSet, differential_bank, filter_params_key,
+)
 from hdsemg_select.state.enum.layout_mode_enums import LayoutMode
 from hdsemg_select.state.state import global_state
 from hdsemg_select.ui.dialog.density_layout_builder import LayoutBuilderDialog
@@ -36,6 +43,7 @@ _EMG_CMAP = LinearSegmentedColormap.from_list(
 _EMG_CMAP.set_bad("#2a2a2a", alpha=0.8)
 
 _DEFAULT_ARV_MS = 250.0
+_DEFAULT_METRIC = "ARV"
 _DEFAULT_FPS = 30
 _DEFAULT_SPEED = 1.0
 _SEEK_SECONDS = 2.0
@@ -73,7 +81,7 @@ class DensityMapDialog(QDialog):
 
         # Data cache
         self._data: Optional[np.ndarray] = None
-        self._data_id: Optional[int] = None
+        self._data_token: Optional[tuple] = None
         self._fs: float = 2048.0
         self._n_samples: int = 0
 
@@ -91,11 +99,35 @@ class DensityMapDialog(QDialog):
         self._diff_data: Optional[np.ndarray] = None
         self._diff_display_grid: Optional[np.ndarray] = None
         self._diff_emg_indices: list = []
+        self._diff_key: Optional[DifferentialKey] = None
+        self._diff_axis: int = 0
+        self._diff_result_shape: tuple = (0, 0)
+        self._diff_loader = DifferentialLoader(self)
+        self._diff_loader.ready.connect(self._on_differential_ready)
+        self._diff_loader.failed.connect(self._on_differential_failed)
+
+        # Amplitude pyramid for the active data, built in the background whenever data or grid change
+        self._pyramid: Optional[AmplitudePyramid] = None
+        self._pyramid_source: Optional[np.ndarray] = None
+        self._pyramid_columns: tuple = ()
+        self._pyramid_loader = AmplitudePyramidLoader(self)
+        self._pyramid_loader.ready.connect(self._on_pyramid_ready)
+
+        # Smooth (upsampled) maps
+        self._interpolator = GridInterpolator()
+
+        # Whole-recording mean map (Display Options → Time-averaged map)
+        self._mean_map: Optional[np.ndarray] = None
+        self._mean_map_source: Optional[np.ndarray] = None
+        self._mean_map_key: Optional[tuple] = None
 
         # Reference signal cache
         self._ref_idx: Optional[int] = None
-        self._ref_data: Optional[np.ndarray] = None   # downsampled signal
-        self._ref_time: Optional[np.ndarray] = None   # downsampled time axis
+        self._ref_data: Optional[np.ndarray] = None   # min/max envelope for display
+        self._ref_time: Optional[np.ndarray] = None   # time axis of the envelope
+        self._ref_raw: Optional[np.ndarray] = None    # full-resolution channel
+        self._ref_key: Optional[tuple] = None         # envelope cache key
+        self._ref_line = None
         self._ref_dragging: bool = False
 
         # Matplotlib handles
@@ -130,7 +162,7 @@ class DensityMapDialog(QDialog):
         self._timer.stop()
         self._playing = False
         self._data = None
-        self._data_id = None
+        self._data_token = None
 
     # ------------------------------------------------------------------
     # UI construction
@@ -195,10 +227,17 @@ class DensityMapDialog(QDialog):
         sidebar_layout.addWidget(ref_box)
 
         # ARV Window group
-        arv_box = QGroupBox("ARV Window")
+        arv_box = QGroupBox("Amplitude Window")
         arv_box.setStyleSheet(self._groupbox_style())
         arv_box_layout = QVBoxLayout(arv_box)
         arv_row = QHBoxLayout()
+        self._metric_combo = QComboBox()
+        self._metric_combo.addItems(["ARV", "RMS"])
+        self._metric_combo.setCurrentText(config.get(Settings.DENSITY_AMPLITUDE_METRIC, _DEFAULT_METRIC))
+        self._metric_combo.setStyleSheet(self._combobox_style())
+        self._metric_combo.setToolTip("Amplitude estimate per window: average rectified value or root mean square")
+        self._metric_combo.currentTextChanged.connect(self._on_metric_changed)
+        arv_row.addWidget(self._metric_combo)
         self._arv_spin = QDoubleSpinBox()
         self._arv_spin.setRange(10.0, 2000.0)
         self._arv_spin.setSingleStep(10.0)
@@ -273,6 +312,12 @@ class DensityMapDialog(QDialog):
         self._ch_num_check.stateChanged.connect(self._on_ch_num_changed)
         disp_box_layout.addWidget(self._ch_num_check)
 
+        self._mean_check = QCheckBox("Time-averaged map")
+        self._mean_check.setToolTip("Show the mean ARV/RMS over the whole (cropped) recording instead of the cursor window")
+        self._mean_check.setStyleSheet(self._checkbox_style())
+        self._mean_check.stateChanged.connect(self._on_mean_changed)
+        disp_box_layout.addWidget(self._mean_check)
+
         self._sel_check = QCheckBox("Selection status")
         self._sel_check.setToolTip("Overlay selection state; click a cell to toggle it")
         self._sel_check.setStyleSheet(self._checkbox_style())
@@ -428,10 +473,12 @@ class DensityMapDialog(QDialog):
         self._resolve_ref_signal()
 
     def _resolve_ref_signal(self):
-        """Downsample the selected reference channel for display."""
+        """Envelope-decimate the selected reference channel for display."""
         self._ref_data = None
         self._ref_time = None
         self._ref_idx = None
+        self._ref_raw = None
+        self._ref_key = None
 
         idx = self._ref_combo.currentData()
         if idx is None:
@@ -444,12 +491,33 @@ class DensityMapDialog(QDialog):
         if data is None or idx >= data.shape[1]:
             return
 
-        raw = data[:, int(idx)]
-        n = len(raw)
-        stride = max(1, n // _REF_MAX_POINTS)
-        self._ref_data = raw[::stride]
-        self._ref_time = np.arange(len(self._ref_data)) * stride / self._fs
+        self._ref_raw = data[:, int(idx)]
         self._ref_idx = int(idx)
+        self._ref_key = ("density_ref", global_state.get_file_path(), self._ref_idx,
+                         global_state.get_crop_range())
+        self._decimate_ref(0, len(self._ref_raw))
+
+    def _decimate_ref(self, start: int, end: int) -> None:
+        """Fill _ref_data/_ref_time with the min/max envelope of [start, end)."""
+        idx, values = envelope_cache.get(
+            self._ref_key, self._ref_raw, _REF_MAX_POINTS // 4, start, end
+        )
+        self._ref_data = values
+        self._ref_time = idx / self._fs
+
+    def _on_ref_xlim_changed(self, ax):
+        """Re-decimate the reference trace for the visible range after zoom/pan."""
+        if self._ref_line is None or self._ref_raw is None or self._fs <= 0:
+            return
+        x0, x1 = ax.get_xlim()
+        n = len(self._ref_raw)
+        span = max(1, int((x1 - x0) * self._fs))
+        # Decimate a little beyond the view so small pans stay covered
+        start = max(0, int(x0 * self._fs) - span // 2)
+        end = min(n, int(x1 * self._fs) + span // 2 + 1)
+        self._decimate_ref(start, end)
+        self._ref_line.set_data(self._ref_time, self._ref_data)
+        self._canvas.draw_idle()
 
     def _load_data(self):
         data = global_state.get_effective_emg_data()
@@ -460,7 +528,7 @@ class DensityMapDialog(QDialog):
             return
 
         self._data = data
-        self._data_id = id(data)
+        self._data_token = self._current_data_token()
         self._n_samples = data.shape[0]
 
         emg_file = global_state.get_emg_file()
@@ -502,11 +570,31 @@ class DensityMapDialog(QDialog):
             return self._data, self._display_grid, self._emg_indices
         return self._diff_data, self._diff_display_grid, self._diff_emg_indices
 
+    def _current_data_token(self) -> tuple:
+        """Identify the effective EMG data without relying on slice identity."""
+        emg_file = global_state.get_emg_file()
+        base = emg_file.data if emg_file is not None else None
+        return id(base), global_state.get_crop_range()
+
+    def _is_differential_pending(self) -> bool:
+        return (
+            self._signal_view != "MP"
+            and self._diff_key is not None
+            and self._diff_data is None
+            and self._diff_loader.is_pending(self._diff_key)
+        )
+
     def _precompute_differential(self) -> None:
-        """Build _diff_data and _diff_display_grid for SD or DD mode."""
+        """Build _diff_data and _diff_display_grid for SD or DD mode.
+
+        The differential signals come from the shared differential bank. On a
+        cache miss they are computed in a worker thread and the plot is rebuilt
+        in _on_differential_ready.
+        """
         self._diff_data = None
         self._diff_display_grid = None
         self._diff_emg_indices = []
+        self._diff_key = None
 
         if self._signal_view == "MP":
             return
@@ -533,44 +621,55 @@ class DensityMapDialog(QDialog):
             )
             return
 
-        diff_grid = np.full(result_shape, np.nan)
-        diff_channels: list = []
-
+        lines = []
         for line_idx in range(n_lines):
             if axis == 0:
                 locals_in_line = [
-                    (r, int(self._display_grid[r, line_idx]))
+                    int(self._display_grid[r, line_idx])
                     for r in range(n_rows)
                     if not np.isnan(self._display_grid[r, line_idx])
                 ]
             else:
                 locals_in_line = [
-                    (c, int(self._display_grid[line_idx, c]))
+                    int(self._display_grid[line_idx, c])
                     for c in range(n_cols)
                     if not np.isnan(self._display_grid[line_idx, c])
                 ]
-
-            if len(locals_in_line) < n_diff_steps + 1:
+            if any(loc >= len(self._emg_indices) for loc in locals_in_line):
+                lines.append(())
                 continue
+            lines.append(tuple(self._emg_indices[loc] for loc in locals_in_line))
+
+        crop = global_state.get_crop_range()
+        key = DifferentialKey(
+            source=global_state.get_file_path() or "",
+            grid_key=self._grid_key or "",
+            layout_mode=layout_mode.name,
+            mode=self._signal_view,
+            filter_params=filter_params_key(self._diff_filter_params),
+            crop_range=tuple(crop) if crop is not None else None,
+            lines=tuple(lines),
+        )
+        self._diff_key = key
+        self._diff_axis = axis
+        self._diff_result_shape = result_shape
 
-            try:
-                mp_mat = np.array(
-                    [self._data[:, self._emg_indices[loc]] for _, loc in locals_in_line],
-                    dtype=float,
-                )  # shape (n_valid, T)
-            except IndexError:
-                continue
+        dset = differential_bank.get(key)
+        if dset is None:
+            self._diff_loader.request(key, self._data, self._fs)
+            return
+        self._assemble_differential(dset)
 
-            try:
-                sd_mats, _ = to_differential([mp_mat], self._fs, self._diff_filter_params)
-                final_mat = sd_mats[0]  # (n_valid-1, T)
-                if self._signal_view == "DD":
-                    dd_mats, _ = to_differential([final_mat], self._fs, self._diff_filter_params)
-                    final_mat = dd_mats[0]  # (n_valid-2, T)
-            except Exception as exc:
-                logger.warning("to_differential failed for line %d: %s", line_idx, exc)
-                continue
+    def _assemble_differential(self, dset: DifferentialSet) -> None:
+        """Place the per-line differential channels onto the display grid."""
+        axis = self._diff_axis
+        result_shape = self._diff_result_shape
+        diff_grid = np.full(result_shape, np.nan)
+        diff_channels: list = []
 
+        for line_idx, final_mat in enumerate(dset.matrices):
+            if final_mat is None:
+                continue
             for diff_i in range(final_mat.shape[0]):
                 r_pos = diff_i if axis == 0 else line_idx
                 c_pos = line_idx if axis == 0 else diff_i
@@ -587,6 +686,26 @@ class DensityMapDialog(QDialog):
                 self._signal_view, len(diff_channels), result_shape,
             )
 
+    def _on_differential_ready(self, key: DifferentialKey) -> None:
+        if key != self._diff_key:
+            return  # a newer request superseded this one; result stays cached
+        dset = differential_bank.get(key)
+        if dset is None:
+            return
+        self._assemble_differential(dset)
+        self._update_scale_from_data()
+        self._reset_plot()
+
+    def _on_differential_failed(self, key: DifferentialKey, _message: str) -> None:
+        if key == self._diff_key:
+            self._reset_plot()
+
+    def _update_scale_from_data(self) -> None:
+        self._grid_max_amplitude = self._compute_grid_max()
+        self._scale_spin.blockSignals(True)
+        self._scale_spin.setValue(self._grid_max_amplitude)
+        self._scale_spin.blockSignals(False)
+
     def _resolve_grid_layout(self):
         """Determine physical layout and emg_indices for the selected grid key."""
         key = self._grid_combo.currentText()
@@ -598,6 +717,7 @@ class DensityMapDialog(QDialog):
         self._diff_data = None
         self._diff_display_grid = None
         self._diff_emg_indices = []
+        self._diff_key = None
 
         emg_file = global_state.get_emg_file()
         if not emg_file or not key:
@@ -614,11 +734,7 @@ class DensityMapDialog(QDialog):
 
         # Precompute differential data (no-op for MP)
         self._precompute_differential()
-
-        self._grid_max_amplitude = self._compute_grid_max()
-        self._scale_spin.blockSignals(True)
-        self._scale_spin.setValue(self._grid_max_amplitude)
-        self._scale_spin.blockSignals(False)
+        self._update_scale_from_data()
 
     # ------------------------------------------------------------------
     # Plot management
@@ -654,7 +770,9 @@ class DensityMapDialog(QDialog):
             return
 
         if active_grid is None:
-            if self._signal_view != "MP":
+            if self._is_differential_pending():
+                self._show_no_data_placeholder(f"Computing {self._signal_view} signals…")
+            elif self._signal_view != "MP":
                 self._show_no_data_placeholder(
                     f"Not enough channels for {self._signal_view}.\n"
                     "Need ≥ 2 channels along fiber direction for SD, ≥ 3 for DD."
@@ -688,26 +806,23 @@ class DensityMapDialog(QDialog):
         self._figure.patch.set_facecolor(Colors.BG_PRIMARY)
 
         # --- Heatmap ---
-        arv = compute_arv_window(
-            active_data,
-            self._cursor_sample,
-            ms_to_samples(self._arv_spin.value(), self._fs),
-        )
-        grid_vals = channels_to_grid(arv, active_grid, active_emg)
-        masked = np.ma.masked_invalid(grid_vals)
-
-        interp = "bilinear" if self._smooth_check.isChecked() else "nearest"
+        self._request_pyramid(active_data, active_emg)
+        grid_vals = self._compute_frame_grid(active_data, active_grid, active_emg)
+        rows, cols = active_grid.shape
+        # Pin the extent to cell coordinates so overlays line up for both the
+        # per-cell and the upsampled (smooth) image
         self._image = self._ax.imshow(
-            masked,
+            self._to_image(grid_vals),
             cmap=_EMG_CMAP,
             vmin=0.0,
             vmax=self._scale_spin.value(),
             aspect="equal",
-            interpolation=interp,
+            interpolation="nearest",
             origin="upper",
+            extent=(-0.5, cols - 0.5, rows - 0.5, -0.5),
         )
         self._colorbar = self._figure.colorbar(self._image, cax=self._cbar_ax)
-        cbar_label = f"ARV {self._signal_view} (mV)"
+        cbar_label = f"{self._metric_combo.currentText()} {self._signal_view} (mV)"
         self._colorbar.set_label(cbar_label, color=Colors.TEXT_SECONDARY)
         self._colorbar.ax.yaxis.set_tick_params(color=Colors.TEXT_SECONDARY)
         for lbl in self._colorbar.ax.get_yticklabels():
@@ -716,8 +831,11 @@ class DensityMapDialog(QDialog):
         self._ax.set_ylabel("Row", color=Colors.TEXT_SECONDARY)
         self._ax.tick_params(colors=Colors.TEXT_SECONDARY)
         base_title = self._electrode_name or self._grid_key or ""
+        view_title = self._signal_view
+        if self._mean_check.isChecked():
+            view_title += " (time-averaged)"
         self._ax.set_title(
-            f"{base_title} — {self._signal_view}" if base_title else self._signal_view,
+            f"{base_title} — {view_title}" if base_title else view_title,
             color=Colors.TEXT_PRIMARY,
             fontsize=10,
         )
@@ -738,13 +856,16 @@ class DensityMapDialog(QDialog):
         ax = self._ref_ax
         ax.clear()
         ax.set_facecolor(Colors.BG_PRIMARY)
+        self._ref_line = None
 
         t_total = self._n_samples / self._fs if self._fs > 0 else 0.0
 
-        if self._ref_data is not None and self._ref_time is not None:
-            ax.plot(self._ref_time, self._ref_data,
-                    color=Colors.BLUE_500, linewidth=0.8, alpha=0.9)
+        if self._ref_raw is not None:
+            self._decimate_ref(0, len(self._ref_raw))
+            (self._ref_line,) = ax.plot(self._ref_time, self._ref_data,
+                                        color=Colors.BLUE_500, linewidth=0.8, alpha=0.9)
             ax.set_xlim(0, t_total)
+            ax.callbacks.connect('xlim_changed', self._on_ref_xlim_changed)
             label = self._ref_combo.currentText() or "Reference"
             ax.set_ylabel(label, color=Colors.TEXT_SECONDARY, fontsize=7)
         else:
@@ -917,6 +1038,8 @@ class DensityMapDialog(QDialog):
             channel_status[data_col] = new_state
 
         self._update_selection_overlay()
+        if self._smooth_check.isChecked():
+            self._render_frame()  # deselected channels drop out of the smooth map
 
     # ------------------------------------------------------------------
     # Reference signal scrubbing
@@ -970,9 +1093,10 @@ class DensityMapDialog(QDialog):
             self._play_btn.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
             return
 
-        if id(current_data) != self._data_id:
+        token = self._current_data_token()
+        if token != self._data_token:
             self._data = current_data
-            self._data_id = id(current_data)
+            self._data_token = token
             self._n_samples = current_data.shape[0]
             self._cursor_sample = 0
             self._precompute_differential()
@@ -998,18 +1122,94 @@ class DensityMapDialog(QDialog):
         if active_data is None or active_grid is None:
             return
 
-        arv = compute_arv_window(
-            active_data,
-            self._cursor_sample,
-            ms_to_samples(self._arv_spin.value(), self._fs),
-        )
-        grid_vals = channels_to_grid(arv, active_grid, active_emg)
-        masked = np.ma.masked_invalid(grid_vals)
-        self._image.set_data(masked)
+        grid_vals = self._compute_frame_grid(active_data, active_grid, active_emg)
+        self._image.set_data(self._to_image(grid_vals))
         self._image.set_clim(0.0, self._scale_spin.value())
         self._update_time_label()
         self._canvas.draw_idle()
 
+    def _request_pyramid(self, active_data: np.ndarray, active_emg: list) -> None:
+        """Start building the amplitude pyramid for *active_data* unless it is built or being built."""
+        columns = tuple(active_emg)
+        if self._pyramid_source is active_data and self._pyramid_columns == columns:
+            return
+        self._pyramid = None
+        self._pyramid_source = active_data  # holds the data, so the id in the token stays unique
+        self._pyramid_columns = columns
+        self._pyramid_loader.request((id(active_data), columns), active_data, columns)
+
+    def _on_pyramid_ready(self, token, pyramid: AmplitudePyramid) -> None:
+        if token != (id(self._pyramid_source), self._pyramid_columns):
+            return  # the data or grid changed while it was built
+        self._pyramid = pyramid
+        logger.debug(
+            "Built amplitude pyramid: %d levels, %.1f MiB",
+            len(pyramid.levels), pyramid.nbytes / 2**20,
+        )
+
+    def _get_pyramid(self, active_data: np.ndarray, active_emg: list) -> Optional[AmplitudePyramid]:
+        """The amplitude pyramid for *active_data*, or None while it is still being built."""
+        if self._pyramid_source is not active_data or self._pyramid_columns != tuple(active_emg):
+            return None
+        return self._pyramid
+
+    def _compute_frame_grid(self, active_data: np.ndarray, active_grid: np.ndarray,
+                            active_emg: list) -> np.ndarray:
+        """Map values for the current frame, or the whole-recording mean map."""
+        if self._mean_check.isChecked():
+            return self._get_mean_map(active_data, active_grid, active_emg)
+        amplitude = self._compute_frame_amplitude(active_data, active_emg)
+        return channels_to_grid(amplitude, active_grid, active_emg)
+
+    def _to_image(self, grid_vals: np.ndarray) -> np.ndarray:
+        """Per-cell map, or its upsampled interpolation when smoothing is on."""
+        if not self._smooth_check.isChecked():
+            return np.ma.masked_invalid(grid_vals)
+        smooth = self._interpolator.interpolate(grid_vals, self._selection_mask(grid_vals.shape))
+        return np.ma.masked_invalid(smooth)
+
+    def _selection_mask(self, shape: tuple) -> np.ndarray:
+        """Cells that may contribute to the smooth map (deselected MP channels excluded)."""
+        mask = np.ones(shape, dtype=bool)
+        if self._signal_view != "MP" or self._display_grid is None or self._display_grid.shape != shape:
+            return mask
+        channel_status = global_state.get_channel_status()
+        for (r, c), local in np.ndenumerate(self._display_grid):
+            if np.isnan(local) or int(local) >= len(self._emg_indices):
+                continue
+            data_col = self._emg_indices[int(local)]
+            if data_col < len(channel_status) and not channel_status[data_col]:
+                mask[r, c] = False
+        return mask
+
+    def _get_mean_map(self, active_data: np.ndarray, active_grid: np.ndarray,
+                      active_emg: list) -> np.ndarray:
+        metric = self._metric_combo.currentText()
+        key = (tuple(active_emg), metric, active_grid.shape)
+        if self._mean_map is None or self._mean_map_source is not active_data or self._mean_map_key != key:
+            # Whole-range sums of the background pyramid when it is ready, otherwise
+            # a single mean-only pass; never the per-window maps.
+            pyramid = self._get_pyramid(active_data, active_emg)
+            if pyramid is not None:
+                amplitude = pyramid.mean(metric)
+            else:
+                amplitude = mean_amplitude(active_data, active_emg, metric)
+            self._mean_map = channels_to_grid(amplitude, active_grid, active_emg)
+            self._mean_map_source = active_data
+            self._mean_map_key = key
+        return self._mean_map
+
+    def _compute_frame_amplitude(self, active_data: np.ndarray, active_emg: list) -> np.ndarray:
+        """ARV or RMS per channel for the window centred on the cursor."""
+        window = ms_to_samples(self._arv_spin.value(), self._fs)
+        rms = self._metric_combo.currentText() == "RMS"
+        pyramid = self._get_pyramid(active_data, active_emg)
+        if pyramid is None:
+            # Not built yet: one window read directly costs O(window), not the whole build
+            compute = compute_rms_window if rms else compute_arv_window
+            return compute(active_data, self._cursor_sample, window)
+        return pyramid.rms(self._cursor_sample, window) if rms else pyramid.arv(self._cursor_sample, window)
+
     def _update_time_label(self):
         t_current = self._cursor_sample / self._fs if self._fs > 0 else 0.0
         t_total = self._n_samples / self._fs if self._fs > 0 else 0.0
@@ -1065,6 +1265,12 @@ class DensityMapDialog(QDialog):
         config.set(Settings.DENSITY_ARV_WINDOW_MS, _value)
         self._render_frame()
 
+    def _on_metric_changed(self, text: str):
+        config.set(Settings.DENSITY_AMPLITUDE_METRIC, text)
+        if self._colorbar is not None:
+            self._colorbar.set_label(f"{text} {self._signal_view} (mV)", color=Colors.TEXT_SECONDARY)
+        self._render_frame()
+
     def _on_scale_changed(self, _value: float):
         if self._image is not None:
             self._image.set_clim(0.0, _value)
@@ -1082,11 +1288,12 @@ class DensityMapDialog(QDialog):
         if self._playing:
             self._timer.start(max(1, 1000 // self._fps))
 
-    def _on_smooth_changed(self, state: int):
-        if self._image is None:
-            return
-        self._image.set_interpolation("bilinear" if state == Qt.Checked else "nearest")
-        self._canvas.draw_idle()
+    def _on_smooth_changed(self, _state: int):
+        # Image resolution changes with smoothing, so rebuild the plot
+        self._reset_plot()
+
+    def _on_mean_changed(self, _state: int):
+        self._reset_plot()
 
     def _on_ch_num_changed(self, _state: int):
         self._update_channel_annotations()
@@ -1118,10 +1325,7 @@ class DensityMapDialog(QDialog):
             self._signal_view = "MP"
         self._filter_btn.setEnabled(self._signal_view != "MP")
         self._precompute_differential()
-        new_max = self._compute_grid_max()
-        self._scale_spin.blockSignals(True)
-        self._scale_spin.setValue(new_max)
-        self._scale_spin.blockSignals(False)
+        self._update_scale_from_data()
         self._reset_plot()
 
     def _open_filter_settings(self) -> None:
@@ -1130,12 +1334,16 @@ class DensityMapDialog(QDialog):
             self._diff_filter_params = dlg.params
             if self._signal_view != "MP":
                 self._precompute_differential()
-                new_max = self._compute_grid_max()
-                self._scale_spin.blockSignals(True)
-                self._scale_spin.setValue(new_max)
-                self._scale_spin.blockSignals(False)
+                self._update_scale_from_data()
                 self._reset_plot()
 
+    def closeEvent(self, event):
+        self._timer.stop()
+        self._playing = False
+        self._diff_loader.shutdown()
+        self._pyramid_loader.shutdown()
+        super().closeEvent(event)
+
     # ------------------------------------------------------------------
     # Style helpers
     # ------------------------------------------------------------------
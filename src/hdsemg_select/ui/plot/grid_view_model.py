@@ -0,0 +1,64 @@
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+from hdsemg_select.logic.decimation.pyramid import pyramid_cache
+from hdsemg_select.ui.plot.channel_widget import ChannelWidget
+
+
+def shared_ylim(signals: Iterable[np.ndarray]) -> tuple:
+    """Common y-limits of several channels: their joint extent plus a 10 % buffer.
+
+    The extents come from the channels' min/max pyramids, which the
+    thumbnails need anyway, so no copy of the channels is made.
+    """
+    lo, hi = np.inf, -np.inf
+    for signal in signals:
+        s_lo, s_hi = pyramid_cache.get(signal).extent()
+        lo, hi = min(lo, s_lo), max(hi, s_hi)
+    if not np.isfinite(lo) or not np.isfinite(hi):
+        lo, hi = -1.0, 1.0
+    buffer = 0.1 * (abs(hi) + abs(lo))
+    return lo - buffer, hi + buffer
+
+
+def _data_token(data: np.ndarray) -> tuple:
+    # Crops are views with their own start pointer and shape, so they get their own entries
+    return data.__array_interface__["data"][0], data.shape
+
+
+class GridViewModel:
+    """Display values shared by all channel widgets of a grid, computed once.
+
+    Holds the y-limits of each grid and the scaled reference signals, keyed
+    on the (cropped) data they were derived from, the grid and the
+    reference channel. Page flips and reference toggles reuse them instead
+    of rescanning the grid or rescaling the reference; the returned arrays
+    keep their identity, so per-array caches downstream keep hitting.
+    Call :meth:`clear` when a different file is loaded.
+    """
+
+    def __init__(self):
+        self._ylims: Dict[tuple, tuple] = {}
+        self._references: Dict[tuple, np.ndarray] = {}
+
+    def ylim(self, data: np.ndarray, grid_key: str, channels: list) -> tuple:
+        key = (_data_token(data), grid_key, tuple(channels))
+        hit = self._ylims.get(key)
+        if hit is None:
+            hit = self._ylims[key] = shared_ylim(data[:, ch] for ch in channels)
+        return hit
+
+    def reference(self, data: np.ndarray, ref_idx: int, max_amplitude: Optional[float]) -> Optional[np.ndarray]:
+        """Reference channel *ref_idx* centred and scaled to the data amplitude (see ChannelWidget.scale_ref_signal)."""
+        key = (_data_token(data), ref_idx, max_amplitude)
+        hit = self._references.get(key)
+        if hit is None:
+            hit = ChannelWidget.scale_ref_signal(data[:, ref_idx])
+            hit.setflags(write=False)
+            self._references[key] = hit
+        return hit
+
+    def clear(self) -> None:
+        self._ylims.clear()
+        self._references.clear()
@@ -0,0 +1,137 @@
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional
+
+from PyQt5.QtCore import QObject, QThread, pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QPixmap
+
+from hdsemg_select._log.log_config import logger
+from hdsemg_select.ui.plot.trace_thumbnail import render_trace_image
+
+_DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def page_render_key(file_path, crop_range, channels, ref_key, ylim, size: tuple) -> tuple:
+    """Everything the pre-rendered thumbnails of a page depend on.
+
+    *channels* are the data columns on the page, so it also tells grids and
+    pages apart; *ref_key* identifies the reference overlay (None = hidden).
+    """
+    return (file_path, crop_range, tuple(channels), ref_key, ylim, tuple(size))
+
+
+def prefetch_pages(current_page: int, total_pages: int) -> list:
+    """Pages to keep pre-rendered around *current_page*, in priority order."""
+    return [page for page in (current_page + 1, current_page - 1, current_page) if 0 <= page < total_pages]
+
+
+class _PageRenderWorker(QObject):
+    """Rasterises the thumbnails of one page per request; lives in the cache's QThread."""
+    page_rendered = pyqtSignal(object, object)  # page key, {channel_idx: QImage} (empty if skipped or failed)
+
+    def __init__(self, cache: "PageRenderCache"):
+        super().__init__()
+        self._cache = cache
+
+    @pyqtSlot(object)
+    def render(self, request):
+        page_key, jobs = request
+        if not self._cache.is_wanted(page_key):
+            # The user navigated elsewhere before this page came up; report it without images
+            # so the cache stops counting it as pending and can request it again later
+            self.page_rendered.emit(page_key, {})
+            return
+        images = {}
+        try:
+            for channel_idx, signal, ylim, size, reference in jobs:
+                images[channel_idx] = render_trace_image(signal, ylim, size[0], size[1], reference)
+        except Exception as e:
+            logger.error(f"Pre-rendering page {page_key} failed: {e}")
+            images = {}
+        self.page_rendered.emit(page_key, images)
+
+
+class PageRenderCache(QObject):
+    """Pre-rendered channel thumbnails of whole pages, bounded by pixmap memory.
+
+    Pages are rendered to QImages in a background thread and converted to
+    QPixmaps on the GUI thread. Keys are chosen by the caller and must cover
+    everything the pixels depend on (channels, crop, y-limits, overlay,
+    thumbnail size). Least recently used pages are evicted once the pixmaps
+    exceed *max_bytes*.
+    """
+    page_ready = pyqtSignal(object)  # page key
+    _render_requested = pyqtSignal(object)
+
+    def __init__(self, max_bytes: int = _DEFAULT_MAX_BYTES, parent=None):
+        super().__init__(parent)
+        self.max_bytes = max_bytes
+        self._pages: "OrderedDict[Hashable, Dict[int, QPixmap]]" = OrderedDict()
+        self._page_bytes: Dict[Hashable, int] = {}
+        self._pending: set = set()
+        self._wanted: frozenset = frozenset()
+
+        self._thread = QThread(self)
+        self._worker = _PageRenderWorker(self)
+        self._worker.moveToThread(self._thread)
+        self._render_requested.connect(self._worker.render)
+        self._worker.page_rendered.connect(self._on_page_rendered)
+        self._thread.start()
+
+    @property
+    def nbytes(self) -> int:
+        return sum(self._page_bytes.values())
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def __contains__(self, page_key) -> bool:
+        return page_key in self._pages
+
+    def is_wanted(self, page_key) -> bool:
+        return page_key in self._wanted
+
+    def lookup(self, page_key, channel_idx: int) -> Optional[QPixmap]:
+        page = self._pages.get(page_key)
+        if page is None:
+            return None
+        self._pages.move_to_end(page_key)
+        return page.get(channel_idx)
+
+    def prefetch(self, requests: list) -> None:
+        """Queue rendering of pages given as (page_key, jobs) pairs, in priority order.
+
+        Each job is (channel_idx, signal, ylim, (width, height), reference).
+        Pending renders of pages not listed here are skipped.
+        """
+        self._wanted = frozenset(key for key, _ in requests)
+        for page_key, jobs in requests:
+            if page_key in self._pages or page_key in self._pending or not jobs:
+                continue
+            self._pending.add(page_key)
+            self._render_requested.emit((page_key, jobs))
+
+    def clear(self) -> None:
+        self._wanted = frozenset()
+        self._pages.clear()
+        self._page_bytes.clear()
+        self._pending.clear()
+
+    def shutdown(self) -> None:
+        """Stop the render thread; call before the owning window closes."""
+        self.clear()
+        if self._thread.isRunning():
+            self._thread.quit()
+            self._thread.wait()
+
+    def _on_page_rendered(self, page_key, images):
+        self._pending.discard(page_key)
+        if not images:
+            return
+        page = {channel_idx: QPixmap.fromImage(image) for channel_idx, image in images.items()}
+        self._pages[page_key] = page
+        self._page_bytes[page_key] = sum(
+            pix.width() * pix.height() * pix.depth() // 8 for pix in page.values())
+        while self.nbytes > self.max_bytes and len(self._pages) > 1:
+            evicted, _ = self._pages.popitem(last=False)
+            self._page_bytes.pop(evicted, None)
+        self.page_ready.emit(page_key)
@@ -0,0 +1,20 @@
+import numpy as np
+from PyQt5.QtGui import QPolygonF
+
+
+def to_qpolygonf(x: np.ndarray, y: np.ndarray) -> QPolygonF:
+    """Build a QPolygonF from coordinate arrays without a per-point Python loop.
+
+    The polygon's point buffer (pairs of doubles) is filled directly through
+    NumPy, which keeps conversion cost negligible even for large traces.
+    """
+    n = min(len(x), len(y))
+    polygon = QPolygonF(n)
+    if n == 0:
+        return polygon
+    ptr = polygon.data()
+    ptr.setsize(n * 2 * np.dtype(np.float64).itemsize)
+    buf = np.frombuffer(ptr, dtype=np.float64).reshape(n, 2)
+    buf[:, 0] = x[:n]
+    buf[:, 1] = y[:n]
+    return polygon
@@ -8,25 +8,25 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
 
+from hdsemg_select.controller.differential_loader import DifferentialLoader
 from hdsemg_select.controller.grid_setup_handler import GridSetupHandler
+from hdsemg_select.logic.decimation.pyramid import pyramid_cache
+from hdsemg_select.logic.differential.bank import DifferentialKey, differential_bank, filter_params_key
 from hdsemg_select.state.enum.layout_mode_enums import LayoutMode, FiberMode
 from hdsemg_select.state.state import global_state
 from hdsemg_select._log.log_config import logger
-from hdsemg_shared.preprocessing.differential import to_differential
 
 from hdsemg_select.ui.dialog.differential_filter_settings_dialog import DifferentialFilterSettingsDialog
 from hdsemg_select.ui.icons.custom_icon_enum import CustomIcon, set_button_icon
+from hdsemg_select.ui.plot.decimated_line import DecimatedLine
 from hdsemg_select.ui.theme import Colors, Spacing, BorderRadius, Styles
 
 
-def _normalize_trace(trace: np.ndarray, max_amp: float = 1.1) -> np.ndarray:
-    """Skaliert *trace*, um eine Spitzenamplitude von *max_amp* (a.u.) zu haben."""
-    if trace.size == 0:
-        return trace
-    peak = np.max(np.abs(trace))
+def _normalization_factor(peak: float, max_amp: float = 1.1) -> float:
+    """Faktor, der eine Spitzenamplitude *peak* auf *max_amp* (a.u.) abbildet."""
     if peak is None or np.isclose(peak, 0.0) or np.isnan(peak):
-        return np.copy(trace)
-    return trace * (max_amp / peak)
+        return 1.0
+    return max_amp / peak
 
 
 class SignalPlotDialog(QDialog):
@@ -44,9 +44,15 @@ class SignalPlotDialog(QDialog):
         self._channel_checkboxes: list = []
         self._plotted_mp_indices: list = []
         self._plotted_lines: list = []
+        self._decimated_lines: list = []
 
         # Initialize differential filter parameters
         self._differential_filter_params = {'n': 4, 'low': 20.0, 'up': 450.0}
+        self._pending_diff_key = None
+        self._pending_view_limits = None
+        self._diff_loader = DifferentialLoader(self)
+        self._diff_loader.ready.connect(self._on_differential_ready)
+        self._diff_loader.failed.connect(self._on_differential_failed)
 
         flags = self.windowFlags()
         flags |= Qt.Window
@@ -196,6 +202,7 @@ class SignalPlotDialog(QDialog):
         return True
 
     def _show_no_grid_message(self, message="No grid selected"):
+        self._release_decimated_lines()
         self.ax.clear()
         self.ax.text(0.5, 0.5, message, ha='center', va='center',
                      transform=self.ax.transAxes, fontsize=12, color='red')
@@ -209,8 +216,18 @@ class SignalPlotDialog(QDialog):
         if self._apply_orientation_selection():
             QMessageBox.information(self, "Orientation selection updated successfully",
                                     f"<b>{self._layout_mode.name.title()}</b> are <b>parallel</b> to muscle fibers.")
+        self._diff_loader.shutdown()
         super().closeEvent(a0)
 
+    def _on_differential_ready(self, key):
+        if key == self._pending_diff_key:
+            self.update_plot()
+
+    def _on_differential_failed(self, key, message: str):
+        if key == self._pending_diff_key:
+            self._pending_diff_key = None
+            self._show_no_grid_message(f"{self._signal_mode} computation failed: {message}")
+
     def update_plot(self):
         """ Updates the plot based on the current grid and signal mode."""
         # Store the current plot orientation
@@ -220,6 +237,10 @@ class SignalPlotDialog(QDialog):
             stored_xlim = self.ax.get_xlim()
             stored_ylim = self.ax.get_ylim()
             logger.debug(f"Stored xlim: {stored_xlim}, ylim: {stored_ylim}")
+        elif self._pending_view_limits is not None:
+            # Keep the zoom that was active before the "Computing…" placeholder
+            stored_xlim, stored_ylim = self._pending_view_limits
+        self._pending_view_limits = None
 
         logger.debug(f"Updating Signal Plot Dialog. Mode: {self._signal_mode}, Layout: {self._layout_mode.name}")
         selected_grid_name = self.grid_handler.get_selected_grid()
@@ -252,7 +273,9 @@ class SignalPlotDialog(QDialog):
             logger.warning("Plot update skipped: Time vector not available.")
             return
 
-        source_data = np.asarray(source_data, dtype=float)
+        # No dtype cast: traces are views of the data columns, differential signals
+        # are computed in the working precision by the differential bank
+        source_data = np.asarray(source_data)
         n_channels_total_in_file = source_data.shape[1]
 
         # --- Reshape channel layout based on _layout_mode ---
@@ -310,48 +333,46 @@ class SignalPlotDialog(QDialog):
                     f"Not enough channels along fibers ({num_mp_along_fiber}) for DD. Need at least {min_ch_for_dd}.")
                 return
 
+            if source_data.shape[0] != time_vector.shape[0]:
+                logger.error(
+                    f"Sample mismatch for {self._signal_mode}. Data: {source_data.shape[0]}, Time: {time_vector.shape[0]}")
+                self._show_no_grid_message("Signal data and time vector lengths differ.")
+                return
+
+            lines = []
             for line_idx in range(num_fiber_lines):
-                mp_indices_this_line = grid_arr_indices[line_idx, :]
+                lines.append(tuple(
+                    int(ch_idx) for ch_idx in grid_arr_indices[line_idx, :]
+                    if ch_idx is not None and 0 <= ch_idx < n_channels_total_in_file
+                ))
+
+            crop = global_state.get_crop_range()
+            diff_key = DifferentialKey(
+                source=global_state.get_file_path() or "",
+                grid_key=selected_grid_name,
+                layout_mode=self._layout_mode.name,
+                mode=self._signal_mode,
+                filter_params=filter_params_key(self._differential_filter_params),
+                crop_range=tuple(crop) if crop is not None else None,
+                lines=tuple(lines),
+            )
+            diff_set = differential_bank.get(diff_key)
+            if diff_set is None:
+                # Computed in the background; _on_differential_ready replots
+                self._pending_diff_key = diff_key
+                self._pending_view_limits = (stored_xlim, stored_ylim)
+                self._diff_loader.request(diff_key, source_data, fs)
+                self._clear_channel_checkboxes()
+                self._show_no_grid_message(f"Computing {self._signal_mode} signals…")
+                return
+            self._pending_diff_key = None
 
-                valid_mp_data_this_line = []
-                for ch_idx in mp_indices_this_line:
-                    if ch_idx is not None and 0 <= ch_idx < n_channels_total_in_file:
-                        if source_data[:, ch_idx].shape[0] != time_vector.shape[0]:
-                            logger.error(
-                                f"Sample mismatch for MP Ch {ch_idx + 1} in line {line_idx + 1}. Data: {source_data[:, ch_idx].shape[0]}, Time: {time_vector.shape[0]}")
-                            # Skip this channel, potentially making the line unusable for SD/DD
-                            continue
-                        valid_mp_data_this_line.append(source_data[:, ch_idx])
-
-                if not valid_mp_data_this_line or len(valid_mp_data_this_line) < (
-                min_ch_for_sd if self._signal_mode == "SD" else min_ch_for_dd):
-                    continue  # Not enough valid MP channels in this line
-
-                mp_mat_this_line = np.array(valid_mp_data_this_line)  # Shape: (n_valid_mp_in_line, T)
-
-                if self._signal_mode == "SD":
-                    if mp_mat_this_line.shape[0] >= min_ch_for_sd:
-                        sd_filtered, _ = to_differential([mp_mat_this_line], fs, self._differential_filter_params)
-                        if sd_filtered and sd_filtered[0].shape[0] > 0:
-                            sd_data_for_line = sd_filtered[0]
-                            for sd_ch_idx in range(sd_data_for_line.shape[0]):
-                                traces_to_plot.append(sd_data_for_line[sd_ch_idx, :])
-                                labels_for_plot.append(f"L{line_idx + 1}:SD{sd_ch_idx + 1}")
-
-                elif self._signal_mode == "DD":
-                    if mp_mat_this_line.shape[0] >= min_ch_for_dd:  # Need 3 MP for at least 1 DD
-                        # First differential (SD)
-                        sd_filtered, _ = to_differential([mp_mat_this_line], fs, self._differential_filter_params)
-                        if sd_filtered and sd_filtered[0].shape[
-                            0] >= min_ch_for_sd:  # Need at least 2 SD channels for DD
-                            sd_mat_for_dd = sd_filtered[0]
-                            # Second differential (DD)
-                            dd_filtered, _ = to_differential([sd_mat_for_dd], fs, self._differential_filter_params)
-                            if dd_filtered and dd_filtered[0].shape[0] > 0:
-                                dd_data_for_line = dd_filtered[0]
-                                for dd_ch_idx in range(dd_data_for_line.shape[0]):
-                                    traces_to_plot.append(dd_data_for_line[dd_ch_idx, :])
-                                    labels_for_plot.append(f"L{line_idx + 1}:DD{dd_ch_idx + 1}")
+            for line_idx, diff_mat in enumerate(diff_set.matrices):
+                if diff_mat is None or diff_mat.shape[0] == 0:
+                    continue
+                for diff_ch_idx in range(diff_mat.shape[0]):
+                    traces_to_plot.append(diff_mat[diff_ch_idx, :])
+                    labels_for_plot.append(f"L{line_idx + 1}:{self._signal_mode}{diff_ch_idx + 1}")
 
             if not traces_to_plot:
                 self._show_no_grid_message(
@@ -360,6 +381,7 @@ class SignalPlotDialog(QDialog):
 
         # --- Plotting ---
         self._clear_channel_checkboxes()
+        self._release_decimated_lines()
         self.ax.clear()
         offset = 0.0
 
@@ -371,12 +393,7 @@ class SignalPlotDialog(QDialog):
             if trace_data.shape[0] != time_vector.shape[0]:
                 logger.warning(
                     f"Plotting trace {i} with mismatched length. Trace: {trace_data.shape[0]}, Time: {time_vector.shape[0]}. Skipping.")
-                # Potentially add a NaN trace of correct length or skip
-                empty_trace = np.full_like(time_vector, np.nan)
-                normalized = np.zeros_like(time_vector)  # Plot flat line
-            else:
-                normalized = (_normalize_trace(trace_data)
-                              if not np.all(np.isnan(trace_data)) else np.zeros_like(time_vector))
+                trace_data = None
 
             linestyle = "-"
             if self._signal_mode == "MP":
@@ -384,11 +401,18 @@ class SignalPlotDialog(QDialog):
                 ch_original_idx = original_mp_indices_for_status[i]
                 linestyle = "-" if global_state.get_channel_status(ch_original_idx) else "--"
 
-            (line,) = self.ax.plot(time_vector,
-                                   normalized + offset,
+            (line,) = self.ax.plot([], [],
                                    color=self._COLORS[i % len(self._COLORS)],
                                    linestyle=linestyle,
                                    linewidth=1.0)
+            lo, hi = pyramid_cache.get(trace_data).extent() if trace_data is not None else (np.nan, np.nan)
+            if trace_data is None or (np.isnan(lo) and np.all(np.isnan(trace_data))):
+                line.set_data(time_vector[[0, -1]], [offset, offset])  # Plot flat line
+            else:
+                # Only the pixel-resolution envelope of the visible range is handed to matplotlib
+                factor = _normalization_factor(max(abs(lo), abs(hi)))
+                self._decimated_lines.append(
+                    DecimatedLine(line, trace_data, x=time_vector, scale=factor, offset=offset))
             self._plotted_lines.append(line)
 
             # Separator lines
@@ -451,6 +475,11 @@ class SignalPlotDialog(QDialog):
             self._setup_channel_checkboxes(original_mp_indices_for_status)
         logger.debug(f"Signal Plot update complete for {self._signal_mode} mode.")
 
+    def _release_decimated_lines(self):
+        for decimated in self._decimated_lines:
+            decimated.disconnect()
+        self._decimated_lines.clear()
+
     def _clear_channel_checkboxes(self):
         for cb in self._channel_checkboxes:
             cb.setParent(None)
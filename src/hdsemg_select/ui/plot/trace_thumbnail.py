@@ -0,0 +1,167 @@
+from typing import Optional
+
+import numpy as np
+from PyQt5.QtCore import Qt, QSize, QRectF, QPointF
+from PyQt5.QtGui import QPainter, QPen, QColor, QFont, QImage, QPixmap
+from PyQt5.QtWidgets import QWidget, QSizePolicy
+
+from hdsemg_select.logic.decimation.envelope import m4_decimate
+from hdsemg_select.logic.decimation.pyramid import pyramid_cache
+from hdsemg_select.ui.plot.polyline import to_qpolygonf
+
+_PADDING = 2  # px around the plot area
+_TRACE_COLOR = QColor("blue")
+_REF_COLOR = QColor("black")
+
+
+def trace_polyline(signal: np.ndarray, rect: QRectF, ylim: tuple, time_data=None, cached: bool = True):
+    """Min/max decimate *signal* to the width of *rect* and map it into *rect* as a QPolygonF."""
+    n_buckets = max(1, int(rect.width()))
+    if cached:
+        # Shared with the detail views; a resize or revisit only re-reads the pyramid
+        idx, values = pyramid_cache.get(signal).envelope(0, len(signal), n_buckets)
+    else:
+        idx, values = m4_decimate(signal, n_buckets)
+    n = len(signal)
+    if time_data is not None and len(time_data) == n and n > 1:
+        t0, t1 = float(time_data[0]), float(time_data[-1])
+        span = (t1 - t0) or 1.0
+        x = rect.left() + (np.asarray(time_data[idx], dtype=float) - t0) / span * rect.width()
+    else:
+        x = rect.left() + idx / max(1, n - 1) * rect.width()
+    y_min, y_max = ylim
+    y_span = (y_max - y_min) or 1.0
+    y = rect.bottom() - (np.asarray(values, dtype=float) - y_min) / y_span * rect.height()
+    return to_qpolygonf(x, y)
+
+
+def paint_trace(painter: QPainter, rect: QRectF, trace_poly, ref_poly=None) -> None:
+    """Draw a trace polyline and an optional dashed reference (with legend) clipped to *rect*."""
+    painter.save()
+    painter.setClipRect(rect)
+    painter.setRenderHint(QPainter.Antialiasing, False)
+    painter.setPen(QPen(_TRACE_COLOR, 1))
+    painter.drawPolyline(trace_poly)
+    if ref_poly is not None:
+        pen = QPen(_REF_COLOR, 1, Qt.DashLine)
+        painter.setPen(pen)
+        painter.drawPolyline(ref_poly)
+        _draw_legend(painter, rect, pen)
+    painter.restore()
+
+
+def render_trace_image(trace: np.ndarray, ylim: tuple, width: int, height: int,
+                       reference: Optional[np.ndarray] = None) -> QImage:
+    """Render a trace thumbnail into a QImage; safe to call from a worker thread."""
+    image = QImage(max(1, width), max(1, height), QImage.Format_RGB32)
+    image.fill(Qt.white)
+    rect = QRectF(image.rect()).adjusted(_PADDING, _PADDING, -_PADDING, -_PADDING)
+    painter = QPainter(image)
+    trace_poly = trace_polyline(trace, rect, ylim)
+    ref_poly = None
+    if reference is not None and len(reference) == len(trace):
+        ref_poly = trace_polyline(reference, rect, ylim)
+    paint_trace(painter, rect, trace_poly, ref_poly)
+    painter.end()
+    return image
+
+
+def _draw_legend(painter: QPainter, rect: QRectF, pen: QPen):
+    font = QFont(painter.font())
+    font.setPointSizeF(max(6.0, font.pointSizeF() * 0.8))
+    painter.setFont(font)
+    text = "Reference"
+    text_width = painter.fontMetrics().horizontalAdvance(text)
+    y = rect.top() + painter.fontMetrics().ascent() + 2
+    x_text = rect.right() - text_width - 4
+    painter.setPen(pen)
+    painter.drawLine(QPointF(x_text - 22, y - 4), QPointF(x_text - 4, y - 4))
+    painter.setPen(QColor("black"))
+    painter.drawText(QPointF(x_text, y), text)
+
+
+class TraceThumbnail(QWidget):
+    """Lightweight sparkline for one channel, painted directly with QPainter.
+
+    Replaces a full matplotlib figure per channel: the trace is min/max
+    decimated to the widget width (via the shared pyramid cache), so painting
+    cost depends on the number of pixels rather than the number of samples.
+    Shares y-limits with the other thumbnails on a page and can overlay a
+    (dashed) reference signal.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.setMinimumSize(80, 50)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+
+        self._time: Optional[np.ndarray] = None
+        self._trace: Optional[np.ndarray] = None
+        self._reference: Optional[np.ndarray] = None
+        self._ylim: tuple = (-1.0, 1.0)
+        self._trace_poly = None  # polylines cached for the current size
+        self._ref_poly = None
+        self._prerendered: Optional[QPixmap] = None
+
+    def sizeHint(self) -> QSize:
+        return QSize(400, 200)
+
+    def set_data(self, time_data, trace, ylim: tuple, reference=None,
+                 prerendered: Optional[QPixmap] = None) -> None:
+        """Set the trace (and optional reference overlay) and repaint.
+
+        *prerendered* is an image of exactly this content (see
+        render_trace_image); it is blitted instead of drawing the trace as
+        long as its size matches the widget.
+        """
+        self._prerendered = prerendered
+        self._time = time_data
+        self._trace = trace
+        self._ylim = tuple(ylim) if ylim is not None else (-1.0, 1.0)
+        self._reference = reference
+        self._trace_poly = self._ref_poly = None
+        self.update()
+
+    def set_reference(self, reference) -> None:
+        """Replace only the reference overlay; the trace polyline is reused."""
+        self._reference = reference
+        self._prerendered = None
+        self._ref_poly = None
+        self.update()
+
+    def resizeEvent(self, event):
+        self._trace_poly = self._ref_poly = None
+        super().resizeEvent(event)
+
+    def _plot_rect(self) -> QRectF:
+        return QRectF(self.rect()).adjusted(_PADDING, _PADDING, -_PADDING, -_PADDING)
+
+    def _ensure_polylines(self, rect: QRectF):
+        if self._trace is None or not len(self._trace):
+            return None, None
+        if self._trace_poly is None:
+            self._trace_poly = trace_polyline(self._trace, rect, self._ylim, self._time)
+        if self._ref_poly is None and self._reference is not None and len(self._reference) == len(self._trace):
+            # The overlay array is shared by all widgets of a page, so its pyramid is built once
+            self._ref_poly = trace_polyline(self._reference, rect, self._ylim, self._time)
+        return self._trace_poly, self._ref_poly
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        if self._prerendered is not None and self._prerendered.size() == self.size():
+            painter.drawPixmap(0, 0, self._prerendered)
+            painter.end()
+            return
+        painter.fillRect(self.rect(), Qt.white)
+        rect = self._plot_rect()
+
+        trace_poly, ref_poly = self._ensure_polylines(rect)
+        if trace_poly is None:
+            painter.setPen(QColor("black"))
+            painter.drawText(self.rect(), Qt.AlignCenter, "No data")
+            painter.end()
+            return
+
+        paint_trace(painter, rect, trace_poly, ref_poly)
+        painter.end()
@@ -389,36 +389,37 @@ class AutomaticAmplitudeSelection:
         channel_status = global_state.get_channel_status()
         summary_lines = []
 
-        for grid_key, indices in grids_to_process.items():
-            grid_selected = 0
-            grid_deselected = 0
-            for i in indices:
-                if i is None:
-                    continue
-                channel_data = scaled_data[:, i]
-                max_amplitude = channel_data.max()
-                min_amplitude = channel_data.min()
-
-                if self.upper_threshold <= max_amplitude and self.lower_threshold >= min_amplitude:
-                    channel_status[i] = True
-                    grid_selected += 1
-                else:
-                    channel_status[i] = False
-                    grid_deselected += 1
-                    labels = global_state.get_channel_labels(i).copy()
-                    if BaseChannelLabel.BAD_CHANNEL.value not in labels:
-                        labels.append(BaseChannelLabel.BAD_CHANNEL.value)
-                        global_state.update_channel_labels(i, labels)
-
-            selected_count += grid_selected
-            deselected_count += grid_deselected
-            if self.apply_to_all_grids:
-                summary_lines.append(
-                    f"{grid_key}: {grid_selected} selected, {grid_deselected} deselected"
-                )
-
-        global_state.set_channel_status(channel_status)
-        self.parent.display_page()
+        # One change set for the whole run; the main window updates only the affected channels
+        with global_state.batch():
+            for grid_key, indices in grids_to_process.items():
+                grid_selected = 0
+                grid_deselected = 0
+                for i in indices:
+                    if i is None:
+                        continue
+                    channel_data = scaled_data[:, i]
+                    max_amplitude = channel_data.max()
+                    min_amplitude = channel_data.min()
+
+                    if self.upper_threshold <= max_amplitude and self.lower_threshold >= min_amplitude:
+                        channel_status[i] = True
+                        grid_selected += 1
+                    else:
+                        channel_status[i] = False
+                        grid_deselected += 1
+                        labels = global_state.get_channel_labels(i).copy()
+                        if BaseChannelLabel.BAD_CHANNEL.value not in labels:
+                            labels.append(BaseChannelLabel.BAD_CHANNEL.value)
+                            global_state.update_channel_labels(i, labels)
+
+                selected_count += grid_selected
+                deselected_count += grid_deselected
+                if self.apply_to_all_grids:
+                    summary_lines.append(
+                        f"{grid_key}: {grid_selected} selected, {grid_deselected} deselected"
+                    )
+
+            global_state.set_channel_status(channel_status)
 
         if self.apply_to_all_grids:
             detail = "\n".join(summary_lines)
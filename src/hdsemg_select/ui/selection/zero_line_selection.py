@@ -97,33 +97,34 @@ class ZeroLineSelection:
         total_selected = total_flagged = 0
         summary_lines = []
 
-        for grid_key, indices in grids_to_process.items():
-            results = self._run_detection(settings, indices)
-            if results is None:
-                logger.warning(f"Zero-line detection failed for grid '{grid_key}', skipping.")
-                continue
-
-            grid_selected = grid_flagged = 0
-            for ch_idx, is_good in results.items():
-                channel_status[ch_idx] = is_good
-                if is_good:
-                    grid_selected += 1
-                else:
-                    grid_flagged += 1
-                    labels = global_state.get_channel_labels(ch_idx).copy()
-                    if BaseChannelLabel.ZERO_LINE.value not in labels:
-                        labels.append(BaseChannelLabel.ZERO_LINE.value)
-                        global_state.update_channel_labels(ch_idx, labels)
-
-            total_selected += grid_selected
-            total_flagged += grid_flagged
-            if self.apply_to_all_grids:
-                summary_lines.append(
-                    f"{grid_key}: {grid_selected} selected, {grid_flagged} flagged"
-                )
-
-        global_state.set_channel_status(channel_status)
-        self.parent.display_page()
+        # One change set for the whole run; the main window updates only the affected channels
+        with global_state.batch():
+            for grid_key, indices in grids_to_process.items():
+                results = self._run_detection(settings, indices)
+                if results is None:
+                    logger.warning(f"Zero-line detection failed for grid '{grid_key}', skipping.")
+                    continue
+
+                grid_selected = grid_flagged = 0
+                for ch_idx, is_good in results.items():
+                    channel_status[ch_idx] = is_good
+                    if is_good:
+                        grid_selected += 1
+                    else:
+                        grid_flagged += 1
+                        labels = global_state.get_channel_labels(ch_idx).copy()
+                        if BaseChannelLabel.ZERO_LINE.value not in labels:
+                            labels.append(BaseChannelLabel.ZERO_LINE.value)
+                            global_state.update_channel_labels(ch_idx, labels)
+
+                total_selected += grid_selected
+                total_flagged += grid_flagged
+                if self.apply_to_all_grids:
+                    summary_lines.append(
+                        f"{grid_key}: {grid_selected} selected, {grid_flagged} flagged"
+                    )
+
+            global_state.set_channel_status(channel_status)
 
         if self.apply_to_all_grids:
             detail = "\n".join(summary_lines)
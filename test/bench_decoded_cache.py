@@ -0,0 +1,42 @@
+"""Cold vs. warm open time of a recording through the decoded-data cache.
+
+Usage: python test/bench_decoded_cache.py <recording> [repeats]
+
+Uses a temporary cache directory, so the user's cache is left alone.
+"""
+import os
+import sys
+import tempfile
+import time
+
+from hdsemg_shared.fileio.file_io import EMGFile
+
+from hdsemg_select.controller.decoded_cache import DecodedFileCache
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main(path: str, repeats: int = 5):
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = DecodedFileCache(os.path.join(tmp, "decoded"))
+        cold = []
+        for _ in range(repeats):
+            emg, ms = _timed(lambda: EMGFile.load(path))
+            cold.append(ms)
+        _, store_ms = _timed(lambda: cache.store(path, emg))
+        warm = [_timed(lambda: cache.load(path))[1] for _ in range(repeats)]
+        touch = [_timed(lambda: float(cache.load(path).data.sum()))[1] for _ in range(repeats)]
+
+    print(f"{os.path.basename(path)}: {emg.data.shape}, {emg.data.nbytes / 1e6:.1f} MB")
+    print(f"  cold open (EMGFile.load): {min(cold):8.1f} ms")
+    print(f"  cache store:              {store_ms:8.1f} ms")
+    print(f"  warm open (memory-mapped):{min(warm):8.1f} ms")
+    print(f"  warm open + full read:    {min(touch):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else 5)
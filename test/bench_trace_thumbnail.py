@@ -0,0 +1,151 @@
+"""Per-page render time and memory of the channel thumbnails: matplotlib vs. TraceThumbnail.
+
+Usage: python test/bench_trace_thumbnail.py [recording] [--per-page N] [--pages N]
+
+"matplotlib" is the thumbnail ChannelWidget drew before (one Figure and
+FigureCanvasQTAgg per channel, axes built once, line data swapped on reuse),
+"thumbnail" is TraceThumbnail. Without a recording, 97 channels of 20 s at
+2048 Hz of noise are used. Each variant runs in its own process so the RSS
+figures do not include the other one. Runs offscreen unless QT_QPA_PLATFORM
+is set.
+"""
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+_VARIANTS = ("matplotlib", "thumbnail")
+
+
+def _rss_mb() -> float:
+    """Current resident set size (Linux), else the peak reported by getrusage."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, IndexError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+
+def _load(path):
+    if path is None:
+        fs = 2048.0
+        data = np.random.default_rng(0).standard_normal((int(20 * fs), 97)) * 50.0
+        return np.arange(data.shape[0]) / fs, data
+    from hdsemg_shared.fileio.file_io import EMGFile
+    emg = EMGFile.load(path)
+    return np.asarray(emg.time).ravel(), np.asarray(emg.data)
+
+
+class _MatplotlibThumbnail:
+    """The per-channel figure ChannelWidget used before TraceThumbnail."""
+
+    def __init__(self):
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+        self.figure = Figure(figsize=(4, 2), dpi=100)
+        self.widget = FigureCanvas(self.figure)
+        self._ax = self.figure.add_subplot(111)
+        (self._line,) = self._ax.plot([], [], color="blue", linewidth=1)
+        self._ax.axis("off")
+        self.figure.tight_layout(pad=0)
+
+    def set_data(self, time_data, trace, ylim):
+        self._line.set_data(time_data, trace)
+        self._ax.relim(visible_only=True)
+        self._ax.autoscale_view(scalex=True, scaley=False)
+        self._ax.set_ylim(ylim)
+        self.widget.draw()
+
+
+class _QtThumbnail:
+    def __init__(self):
+        from hdsemg_select.ui.plot.trace_thumbnail import TraceThumbnail
+        self.widget = TraceThumbnail()
+
+    def set_data(self, time_data, trace, ylim):
+        self.widget.set_data(time_data, trace, ylim)
+
+
+def run_variant(variant: str, path, per_page: int, pages: int) -> dict:
+    from PyQt5.QtWidgets import QApplication, QGridLayout, QWidget
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+
+    time_data, data = _load(path)
+    n_pages = max(1, min(pages, data.shape[1] // per_page))
+    ylim = (float(data.min()), float(data.max()))
+    rss_before = _rss_mb()
+
+    page = QWidget()
+    page.resize(1600, 900)
+    grid = QGridLayout(page)
+    factory = _MatplotlibThumbnail if variant == "matplotlib" else _QtThumbnail
+    start = time.perf_counter()
+    thumbnails = [factory() for _ in range(per_page)]
+    for i, thumb in enumerate(thumbnails):
+        grid.addWidget(thumb.widget, i // 4, i % 4)
+    page.show()
+    app.processEvents()
+
+    def render(page_idx: int):
+        begin = time.perf_counter()
+        for i, thumb in enumerate(thumbnails):
+            thumb.set_data(time_data, data[:, page_idx * per_page + i], ylim)
+        page.repaint()
+        app.processEvents()
+        return (time.perf_counter() - begin) * 1000
+
+    render(0)
+    first_page_ms = (time.perf_counter() - start) * 1000
+    flips = [render(p % n_pages) for p in range(1, 2 * n_pages + 1)]
+    result = {
+        "first_page_ms": first_page_ms,
+        "flip_ms": float(np.median(flips)),
+        "rss_delta_mb": _rss_mb() - rss_before,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+    page.close()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("recording", nargs="?")
+    parser.add_argument("--per-page", type=int, default=8)
+    parser.add_argument("--pages", type=int, default=6)
+    parser.add_argument("--variant", choices=_VARIANTS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.variant:
+        result = run_variant(args.variant, args.recording, args.per_page, args.pages)
+        print(" ".join(f"{k}={v:.3f}" for k, v in result.items()))
+        return
+
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    results = {}
+    for variant in _VARIANTS:
+        cmd = [sys.executable, __file__, "--variant", variant, "--per-page", str(args.per_page),
+               "--pages", str(args.pages)] + ([args.recording] if args.recording else [])
+        out = subprocess.run(cmd, env=env, check=True, capture_output=True, text=True).stdout
+        line = out.strip().splitlines()[-1]
+        results[variant] = {k: float(v) for k, v in (item.split("=") for item in line.split())}
+
+    print(f"{args.recording or 'synthetic 97 ch, 20 s @ 2048 Hz'}, {args.per_page} thumbnails per page")
+    print(f"  {'':22}{'matplotlib':>12}{'thumbnail':>12}")
+    for key, label, unit in (("first_page_ms", "first page (build)", "ms"), ("flip_ms", "page flip (median)", "ms"),
+                             ("rss_delta_mb", "RSS growth", "MB"), ("peak_rss_mb", "peak RSS", "MB")):
+        mpl, qt = results["matplotlib"][key], results["thumbnail"][key]
+        print(f"  {label:22}{mpl:9.1f} {unit}{qt:9.1f} {unit}")
+
+
+if __name__ == "__main__":
+    main()
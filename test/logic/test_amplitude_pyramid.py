@@ -0,0 +1,94 @@
+import os
+import numpy as np
+import unittest
+from PyQt5.QtCore import QEventLoop, QTimer
+from PyQt5.QtWidgets import QApplication
+
+from hdsemg_select.controller.pyramid_loader import AmplitudePyramidLoader
+from hdsemg_select.logic.density.arv import compute_arv_window, compute_rms_window
+from hdsemg_select.logic.density.pyramid import AmplitudePyramid
+
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+class TestComputeRmsWindow(unittest.TestCase):
+    def test_dc_signal(self):
+        data = np.full((100, 3), -2.0)
+        np.testing.assert_allclose(compute_rms_window(data, 50, 20), np.full(3, 2.0))
+
+    def test_empty_window_returns_zeros(self):
+        data = np.ones((10, 2))
+        np.testing.assert_array_equal(compute_rms_window(data, -50, 4), np.zeros(2))
+
+
+class TestAmplitudePyramid(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        self.data = rng.standard_normal((10_007, 5))
+        self.pyramid = AmplitudePyramid(self.data)
+
+    def test_has_multiple_levels(self):
+        assert len(self.pyramid.levels) > 2
+        block_sizes = [b for b, _, _ in self.pyramid.levels]
+        assert block_sizes == sorted(block_sizes)
+
+    def test_arv_matches_raw_computation(self):
+        for center, window in [(0, 1), (5, 7), (500, 512), (5000, 4097), (10_006, 300), (3333, 50_000)]:
+            np.testing.assert_allclose(
+                self.pyramid.arv(center, window),
+                compute_arv_window(self.data, center, window),
+                rtol=1e-10,
+            )
+
+    def test_rms_matches_raw_computation(self):
+        for center, window in [(17, 33), (2048, 1000), (9000, 2500)]:
+            np.testing.assert_allclose(
+                self.pyramid.rms(center, window),
+                compute_rms_window(self.data, center, window),
+                rtol=1e-10,
+            )
+
+    def test_window_sums_arbitrary_ranges(self):
+        for start, end in [(0, 10_007), (1, 15), (16, 32), (123, 9876)]:
+            abs_sum, sq_sum = self.pyramid.window_sums(start, end)
+            seg = self.data[start:end]
+            np.testing.assert_allclose(abs_sum, np.abs(seg).sum(axis=0), rtol=1e-10)
+            np.testing.assert_allclose(sq_sum, np.square(seg).sum(axis=0), rtol=1e-10)
+
+    def test_column_subset_returns_full_length_vector(self):
+        pyramid = AmplitudePyramid(self.data, columns=[1, 3])
+        result = pyramid.arv(4000, 800)
+        expected = compute_arv_window(self.data, 4000, 800)
+        assert result.shape == (5,)
+        np.testing.assert_allclose(result[[1, 3]], expected[[1, 3]], rtol=1e-10)
+        assert result[0] == 0.0 and result[2] == 0.0 and result[4] == 0.0
+
+    def test_short_recording(self):
+        data = np.arange(6, dtype=float).reshape(3, 2)
+        pyramid = AmplitudePyramid(data)
+        np.testing.assert_allclose(pyramid.arv(1, 3), compute_arv_window(data, 1, 3))
+
+
+class TestAmplitudePyramidLoader(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_builds_off_thread(self):
+        data = np.random.default_rng(1).standard_normal((5000, 4))
+        loader = AmplitudePyramidLoader()
+        results = []
+        loop = QEventLoop()
+        loader.ready.connect(lambda token, pyramid: (results.append((token, pyramid)), loop.quit()))
+        QTimer.singleShot(5000, loop.quit)
+        loader.request("key", data, (0, 2))
+        assert loader.is_pending("key")
+        loop.exec_()
+        loader.shutdown()
+
+        token, pyramid = results[0]
+        assert token == "key"
+        expected = compute_arv_window(data, 2500, 301)
+        expected[[1, 3]] = 0.0
+        np.testing.assert_allclose(pyramid.arv(2500, 301), expected)
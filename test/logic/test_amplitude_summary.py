@@ -0,0 +1,101 @@
+import math
+import numpy as np
+import unittest
+
+from hdsemg_select.logic.density.arv import channels_to_grid
+from hdsemg_select.logic.density.pyramid import AmplitudePyramid
+from hdsemg_select.logic.density.summary import GridMapSpec, mean_amplitude, summarize_amplitude_maps
+from hdsemg_select.ui.electrode_layout import electrode_model_code
+
+_FS = 1000.0
+
+
+def _spec(key, emg_indices, shape):
+    rows, cols = shape
+    grid = np.arange(rows * cols, dtype=float).reshape(rows, cols)
+    grid[grid >= len(emg_indices)] = np.nan
+    return GridMapSpec(key, grid, list(emg_indices))
+
+
+class TestSummarizeAmplitudeMaps(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        self.data = rng.standard_normal((10_250, 10))
+        self.specs = [_spec("a", [0, 1, 2, 3, 4, 5], (2, 3)), _spec("b", [6, 7, 8], (2, 2))]
+
+    def test_shapes(self):
+        result = summarize_amplitude_maps(self.data, self.specs, _FS, window_ms=100.0)
+        a = result["a"]
+        assert a.window_samples == 100
+        assert a.maps.shape == (102, 2, 3)
+        assert result["b"].maps.shape == (102, 2, 2)
+        assert a.window_starts[1] == 100
+
+    def test_arv_matches_direct_computation(self):
+        result = summarize_amplitude_maps(self.data, self.specs, _FS, window_ms=100.0, chunk_samples=777)
+        spec = self.specs[0]
+        for k in (0, 17, 101):
+            seg = self.data[k * 100:(k + 1) * 100]
+            expected = channels_to_grid(np.abs(seg).mean(axis=0), spec.display_grid, spec.emg_indices)
+            np.testing.assert_allclose(result["a"].maps[k], expected, rtol=1e-12)
+        expected_mean = channels_to_grid(np.abs(self.data).mean(axis=0), spec.display_grid, spec.emg_indices)
+        np.testing.assert_allclose(result["a"].mean_map, expected_mean, rtol=1e-12)
+
+    def test_rms_mean_map(self):
+        result = summarize_amplitude_maps(self.data, self.specs, _FS, metric="RMS")
+        spec = self.specs[1]
+        expected = channels_to_grid(np.sqrt(np.square(self.data).mean(axis=0)), spec.display_grid, spec.emg_indices)
+        np.testing.assert_allclose(result["b"].mean_map, expected, rtol=1e-12)
+
+    def test_chunk_size_does_not_change_result(self):
+        small = summarize_amplitude_maps(self.data, self.specs, _FS, chunk_samples=1)
+        large = summarize_amplitude_maps(self.data, self.specs, _FS, chunk_samples=10**6)
+        np.testing.assert_allclose(small["a"].maps, large["a"].maps, rtol=1e-12)
+        np.testing.assert_allclose(small["a"].mean_map, large["a"].mean_map, rtol=1e-12)
+
+    def test_empty_cells_are_nan(self):
+        result = summarize_amplitude_maps(self.data, self.specs, _FS)
+        assert math.isnan(result["b"].mean_map[1, 1])
+        assert not math.isnan(result["b"].mean_map[1, 0])
+
+    def test_unknown_metric_raises(self):
+        with self.assertRaises(ValueError):
+            summarize_amplitude_maps(self.data, self.specs, _FS, metric="MAV")
+
+
+class TestMeanAmplitude(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(5)
+        self.data = rng.standard_normal((20_003, 6))
+        self.spec = _spec("a", [1, 2, 4, 5], (2, 2))
+
+    def test_matches_summary_mean_map(self):
+        for metric in ("ARV", "RMS"):
+            summary = summarize_amplitude_maps(self.data, [self.spec], _FS, metric=metric)
+            values = mean_amplitude(self.data, self.spec.emg_indices, metric, chunk_samples=999)
+            np.testing.assert_allclose(
+                channels_to_grid(values, self.spec.display_grid, self.spec.emg_indices),
+                summary["a"].mean_map, rtol=1e-12,
+            )
+            assert values[0] == 0.0 and values[3] == 0.0  # columns not requested
+
+    def test_pyramid_mean_matches(self):
+        pyramid = AmplitudePyramid(self.data, self.spec.emg_indices, base_block=16, factor=4)
+        for metric in ("ARV", "RMS"):
+            np.testing.assert_allclose(
+                pyramid.mean(metric), mean_amplitude(self.data, self.spec.emg_indices, metric), rtol=1e-12
+            )
+
+
+class TestElectrodeModelCode(unittest.TestCase):
+    def test_nested_and_flat_descriptions(self):
+        nested = np.empty((2, 1), dtype=object)
+        nested[0, 0] = np.array(["Novecento+ (147 - 210) HD08MM0513 ch1 [MUSCLE:TA]"])
+        nested[1, 0] = np.array(["Force"])
+        assert electrode_model_code(nested, [0]) == "HD08MM0513"
+        assert electrode_model_code(np.array(["GR10MM0808 ch1", "x"]), [0]) == "GR10MM0808"
+
+    def test_no_code(self):
+        assert electrode_model_code(np.array(["Force"]), [0]) == ""
+        assert electrode_model_code(np.array(["Force"]), []) == ""
+        assert electrode_model_code(None, [0]) == ""
@@ -0,0 +1,67 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from hdsemg_select.config import config_manager
+from hdsemg_select.config.config_enums import Settings
+from hdsemg_select.config.config_manager import config
+
+
+class TestConfigManager(unittest.TestCase):
+    """Runs against a temporary config file; the settings in memory are restored afterwards."""
+
+    def setUp(self):
+        config.flush()
+        self.tmp = tempfile.TemporaryDirectory()
+        self._config_file = config_manager.CONFIG_FILE
+        self._settings = dict(config.settings)
+        config_manager.CONFIG_FILE = os.path.join(self.tmp.name, "config", "config.json")
+
+    def tearDown(self):
+        config.flush()  # into the temporary file
+        config_manager.CONFIG_FILE = self._config_file
+        config.settings = self._settings
+        config._labels = None
+        self.tmp.cleanup()
+
+    def _on_disk(self) -> dict:
+        with open(config_manager.CONFIG_FILE) as f:
+            return json.load(f)
+
+    def test_set_is_written_behind(self):
+        config.set(Settings.DENSITY_PLAYBACK_FPS, 24)
+        config.set(Settings.DENSITY_DEFAULT_SPEED, 0.5)
+        assert config.get(Settings.DENSITY_PLAYBACK_FPS) == 24
+        assert not os.path.exists(config_manager.CONFIG_FILE)
+
+        deadline = time.time() + 5
+        while not os.path.exists(config_manager.CONFIG_FILE) and time.time() < deadline:
+            time.sleep(0.05)
+        on_disk = self._on_disk()
+        assert on_disk[Settings.DENSITY_PLAYBACK_FPS.name] == 24
+        assert on_disk[Settings.DENSITY_DEFAULT_SPEED.name] == 0.5
+        assert os.listdir(os.path.dirname(config_manager.CONFIG_FILE)) == ["config.json"]
+
+    def test_flush_writes_immediately(self):
+        config.set(Settings.DENSITY_PLAYBACK_FPS, 30)
+        config.flush()
+        assert self._on_disk()[Settings.DENSITY_PLAYBACK_FPS.name] == 30
+
+    def test_label_list_cached_until_custom_flags_change(self):
+        config.settings.pop(Settings.CUSTOM_FLAGS.name, None)
+        config._labels = None
+        labels = config.get_available_channel_labels()
+        assert config._labels is not None
+        assert [l["name"] for l in labels] == sorted(l["name"] for l in labels)
+
+        labels.clear()  # callers get a copy
+        assert config.get_available_channel_labels()
+
+        config.set(Settings.CUSTOM_FLAGS, [{"id": 100, "name": "Aaa", "color": "#000000"}])
+        assert config.get_available_channel_labels()[0]["name"] == "Aaa"
+
+
+if __name__ == "__main__":
+    unittest.main()
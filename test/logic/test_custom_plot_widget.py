@@ -0,0 +1,63 @@
+import os
+import numpy as np
+import unittest
+from PyQt5.QtWidgets import QApplication
+
+from hdsemg_select.ui.plot.custom_plot_widget import CustomPlotWidget
+
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+class TestCustomPlotWidget(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.widget = CustomPlotWidget()
+        # plot area: 200 x 100 px starting at (margin_left, margin_top) = (50, 30)
+        self.widget.resize(260, 170)
+
+    def _points(self, polygon):
+        return [(polygon[i].x(), polygon[i].y()) for i in range(polygon.size())]
+
+    def test_maps_known_points(self):
+        x = np.array([0.0, 1.0, 2.0])
+        y = np.array([0.0, 1.0, 2.0])
+        polygons = self.widget._series_polygons(x, y, True, (0.0, 2.0, 0.0, 2.0))
+        assert len(polygons) == 1
+        assert self._points(polygons[0]) == [(50.0, 130.0), (150.0, 80.0), (250.0, 30.0)]
+
+    def test_nan_gaps_split_polylines(self):
+        x = np.arange(8, dtype=float)
+        y = np.array([0.0, 1.0, 2.0, np.nan, 1.0, 1.0, np.inf, 3.0])
+        polygons = self.widget._series_polygons(x, y, True, (0.0, 7.0, 0.0, 3.0))
+        # the single finite sample after inf is too short to draw
+        assert [p.size() for p in polygons] == [3, 2]
+        assert polygons[1][0].x() == 50.0 + 4 * 200.0 / 7
+
+    def test_long_sorted_series_is_decimated(self):
+        x = np.linspace(0.0, 1.0, 100_000)
+        y = np.sin(x * 50)
+        polygons = self.widget._series_polygons(x, y, True, (0.0, 1.0, -1.0, 1.0))
+        assert len(polygons) == 1
+        assert 0 < polygons[0].size() <= 4 * 200
+
+    def test_bounds_cache_resets_on_set_data(self):
+        self.widget.set_data([0.0, 1.0], [0.0, 4.0])
+        assert self.widget._calculate_data_bounds() == (0.0, 1.0, 0.0, 4.0)
+        assert self.widget._calculate_data_bounds() is self.widget._bounds_cache
+
+        self.widget.set_data([0.0, 2.0], [-1.0, 1.0])
+        assert self.widget._bounds_cache is None
+        assert self.widget._calculate_data_bounds() == (0.0, 2.0, -1.0, 1.0)
+
+        self.widget.set_reference_data([0.0, 3.0], [0.0, 5.0])
+        assert self.widget._calculate_data_bounds() == (0.0, 3.0, -1.0, 5.0)
+        self.widget.add_trace([-1.0, 0.0], [0.0, 0.0])
+        assert self.widget._calculate_data_bounds()[0] == -1.0
+
+
+if __name__ == "__main__":
+    unittest.main()
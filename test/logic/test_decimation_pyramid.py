@@ -0,0 +1,67 @@
+import numpy as np
+import unittest
+
+from hdsemg_select.logic.decimation.pyramid import MinMaxPyramid, PyramidCache
+
+
+class TestMinMaxPyramid(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        self.signal = np.cumsum(rng.standard_normal(200_003))
+        self.pyramid = MinMaxPyramid(self.signal, base_block=16, factor=4)
+
+    def test_extent(self):
+        lo, hi = self.pyramid.extent()
+        assert lo == self.signal.min()
+        assert hi == self.signal.max()
+
+    def test_envelope_preserves_range_extrema(self):
+        for start, end, width in [(0, len(self.signal), 800), (12_345, 170_001, 1000), (5, 60_000, 300)]:
+            idx, values = self.pyramid.envelope(start, end, width)
+            assert len(idx) == len(values)
+            assert len(idx) <= 2 * width + 2
+            assert idx[0] == start and idx[-1] == end - 1
+            assert np.all(np.diff(idx) >= 0)
+            segment = self.signal[start:end]
+            # Block alignment may pull in less than one block (< 1 pixel) beyond the range
+            margin = self.signal[max(0, start - 64):min(len(self.signal), end + 64)]
+            assert margin.min() <= values.min() <= segment.min()
+            assert segment.max() <= values.max() <= margin.max()
+
+    def test_pixel_columns_cover_their_samples(self):
+        idx, values = self.pyramid.envelope(0, len(self.signal), 500)
+        # Every raw sample lies within the envelope of its own column
+        pairs_lo, pairs_hi = values[1:-1:2], values[2:-1:2]
+        starts = idx[1:-1:2]
+        for k in range(0, len(starts) - 1, 37):
+            column = self.signal[starts[k]:starts[k + 1]]
+            assert pairs_lo[k] <= column.min()
+            assert pairs_hi[k] >= column.max()
+
+    def test_short_range_uses_raw_samples(self):
+        idx, values = self.pyramid.envelope(1000, 1500, 400)
+        np.testing.assert_array_equal(idx, np.arange(1000, 1500))
+        np.testing.assert_array_equal(values, self.signal[1000:1500])
+
+    def test_empty_range(self):
+        idx, values = self.pyramid.envelope(10, 10, 100)
+        assert len(idx) == 0 and len(values) == 0
+
+
+class TestPyramidCache(unittest.TestCase):
+    def test_column_views_share_a_pyramid(self):
+        data = np.random.default_rng(0).standard_normal((10_000, 4))
+        cache = PyramidCache()
+        first = cache.get(data[:, 2])
+        assert cache.get(data[:, 2]) is first
+        assert cache.get(data[:, 1]) is not first
+        assert len(cache) == 2
+
+    def test_byte_budget_evicts_oldest(self):
+        data = np.random.default_rng(0).standard_normal((100_000, 3))
+        probe = MinMaxPyramid(data[:, 0]).nbytes
+        cache = PyramidCache(max_bytes=2 * probe)
+        for ch in range(3):
+            cache.get(data[:, ch])
+        assert len(cache) == 2
+        assert cache.nbytes <= 2 * probe
@@ -0,0 +1,96 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+from hdsemg_shared.fileio.file_io import EMGFile
+
+from hdsemg_select.controller.decoded_cache import DecodedFileCache
+
+
+class TestDecodedFileCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = DecodedFileCache(os.path.join(self.tmp.name, "decoded"))
+        self.path = self._write_source("rec.mat")
+        rng = np.random.default_rng(0)
+        desc = np.empty((4, 1), dtype=object)
+        for i in range(3):
+            desc[i, 0] = np.array([f"HD10MM0804 ch{i + 1}"])
+        desc[3, 0] = np.array(["Force"])
+        self.emg = EMGFile(np.asfortranarray(rng.standard_normal((500, 4))), np.arange(500) / 2000.0,
+                           desc, 2000.0, "rec.mat", 1234, "mat", "mV")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write_source(self, name, content=b"source"):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "wb") as f:
+            f.write(content)
+        return path
+
+    def test_round_trip(self):
+        assert self.cache.load(self.path) is None
+        assert self.cache.store(self.path, self.emg)
+        cached = self.cache.load(self.path)
+
+        assert isinstance(cached.data, np.memmap)
+        assert np.array_equal(cached.data, self.emg.data)
+        assert np.array_equal(cached.time, self.emg.time)
+        assert cached.description.shape == (4, 1)
+        assert cached.description[3, 0].item() == "Force"
+        assert (cached.sampling_frequency, cached.file_name, cached.file_size, cached.unit) == \
+               (2000.0, "rec.mat", 1234, "mV")
+
+    def test_cached_data_is_copy_on_write(self):
+        self.cache.store(self.path, self.emg)
+        cached = self.cache.load(self.path)
+        cached.data[:] = 0
+        assert np.array_equal(self.cache.load(self.path).data, self.emg.data)
+
+    def test_scaled_data_and_summary(self):
+        self.cache.store(self.path, self.emg)
+        scaled = self.cache.store_scaled(self.path, self.emg.data, 2.0)
+        assert isinstance(scaled, np.memmap) and scaled.flags["F_CONTIGUOUS"]
+        assert np.allclose(scaled, self.emg.data / 2.0)
+        assert self.cache.load_scaled(self.path) is None  # incomplete without the statistics
+
+        self.cache.store_summary(self.path, 2.0, 1.5)
+        cached, upper_quartile, max_amplitude = self.cache.load_scaled(self.path)
+        assert np.array_equal(cached, scaled)
+        assert (upper_quartile, max_amplitude) == (2.0, 1.5)
+
+    def test_scaled_data_needs_an_entry(self):
+        assert self.cache.store_scaled(self.path, self.emg.data, 2.0) is None
+
+    def test_modified_source_misses(self):
+        self.cache.store(self.path, self.emg)
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        assert self.cache.load(self.path) is None
+
+    def test_least_recently_used_is_evicted(self):
+        other, third = self._write_source("b.mat"), self._write_source("c.mat")
+        self.cache.store(self.path, self.emg)
+        entry_size = self.cache.nbytes
+        # room for two entries but not three; the headroom absorbs meta.json size jitter
+        self.cache.max_bytes = 2 * entry_size + 1024
+        assert entry_size > 1024
+        self.cache.store(other, self.emg)
+        self.cache.load(self.path)
+        self.cache.store(third, self.emg)
+
+        assert len(self.cache.entries()) == 2
+        assert self.cache.load(other) is None
+        assert self.cache.load(self.path) is not None
+
+    def test_oversized_recording_is_not_cached(self):
+        self.cache.max_bytes = self.emg.data.nbytes  # no room for the scaled copy
+        assert not self.cache.store(self.path, self.emg)
+        assert self.cache.entries() == []
+
+
+if __name__ == "__main__":
+    unittest.main()
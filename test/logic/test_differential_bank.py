@@ -0,0 +1,136 @@
+import numpy as np
+import unittest
+
+from PyQt5.QtCore import QEventLoop, QTimer
+from PyQt5.QtWidgets import QApplication
+from hdsemg_shared.preprocessing.differential import to_differential
+
+from hdsemg_select.controller.differential_loader import DifferentialLoader
+from hdsemg_select.logic.differential.bank import (
+    DifferentialBank,
+    DifferentialKey,
+    DifferentialSet,
+    compute_differential_set,
+    differential_bank,
+    filter_params_key,
+)
+
+_FS = 2048.0
+_PARAMS = {"n": 4, "low": 20.0, "up": 450.0}
+
+
+def _make_key(lines=((0, 1, 2), (3, 4, 5)), mode="SD", crop=None, grid="8mm_4x8"):
+    return DifferentialKey(
+        source="recording.mat",
+        grid_key=grid,
+        layout_mode="COLUMNS",
+        mode=mode,
+        filter_params=filter_params_key(_PARAMS),
+        crop_range=crop,
+        lines=lines,
+    )
+
+
+def _make_set(n_bytes: int) -> DifferentialSet:
+    return DifferentialSet(lines=((0, 1),), matrices=[np.zeros(n_bytes // 8)])
+
+
+class TestFilterParamsKey(unittest.TestCase):
+    def test_order_independent(self):
+        a = filter_params_key({"n": 4, "low": 20.0, "up": 450.0})
+        b = filter_params_key({"up": 450, "n": 4.0, "low": 20})
+        assert a == b
+
+    def test_different_params_differ(self):
+        assert filter_params_key(_PARAMS) != filter_params_key({**_PARAMS, "low": 10.0})
+
+
+class TestComputeDifferentialSet(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.data = rng.standard_normal((1024, 6))
+
+    def test_sd_matches_to_differential(self):
+        result = compute_differential_set(self.data, ((0, 1, 2),), _FS, _PARAMS, "SD")
+        expected, _ = to_differential([self.data[:, [0, 1, 2]].T], _FS, _PARAMS)
+        np.testing.assert_allclose(result.matrices[0], expected[0])
+
+    def test_dd_applies_twice(self):
+        result = compute_differential_set(self.data, ((0, 1, 2, 3),), _FS, _PARAMS, "DD")
+        sd, _ = to_differential([self.data[:, [0, 1, 2, 3]].T], _FS, _PARAMS)
+        dd, _ = to_differential([sd[0]], _FS, _PARAMS)
+        assert result.matrices[0].shape == (2, 1024)
+        np.testing.assert_allclose(result.matrices[0], dd[0])
+
+    def test_short_lines_are_none(self):
+        result = compute_differential_set(self.data, ((0, 1), (2,), ()), _FS, _PARAMS, "DD")
+        assert result.matrices == [None, None, None]
+        assert result.nbytes == 0
+
+
+class TestDifferentialBank(unittest.TestCase):
+    def test_get_or_compute_caches(self):
+        bank = DifferentialBank()
+        data = np.random.default_rng(1).standard_normal((512, 6))
+        key = _make_key()
+        first = bank.get_or_compute(key, data, _FS)
+        second = bank.get_or_compute(key, data * 0.0, _FS)
+        assert first is second
+        assert key in bank
+
+    def test_crop_range_is_part_of_key(self):
+        assert _make_key(crop=(0, 99)) != _make_key(crop=(0, 199))
+        assert _make_key(crop=(0, 99)) == _make_key(crop=(0, 99))
+
+    def test_evicts_least_recently_used(self):
+        bank = DifferentialBank(max_bytes=2000)
+        k1, k2, k3 = _make_key(grid="a"), _make_key(grid="b"), _make_key(grid="c")
+        bank.put(k1, _make_set(800))
+        bank.put(k2, _make_set(800))
+        bank.get(k1)  # k1 becomes most recently used
+        bank.put(k3, _make_set(800))
+        assert k1 in bank
+        assert k2 not in bank
+        assert k3 in bank
+        assert bank.nbytes == 1600
+
+    def test_oversized_entry_is_kept(self):
+        bank = DifferentialBank(max_bytes=100)
+        key = _make_key()
+        bank.put(key, _make_set(800))
+        assert key in bank
+        assert len(bank) == 1
+
+    def test_clear(self):
+        bank = DifferentialBank()
+        bank.put(_make_key(), _make_set(80))
+        bank.clear()
+        assert len(bank) == 0
+        assert bank.nbytes == 0
+
+
+class TestDifferentialLoader(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def tearDown(self):
+        differential_bank.clear()
+
+    def test_computes_off_thread(self):
+        data = np.random.default_rng(3).standard_normal((1024, 6))
+        key = _make_key(crop=(0, 1024))
+        loader = DifferentialLoader()
+        results = []
+        loop = QEventLoop()
+        loader.ready.connect(lambda k: (results.append(k), loop.quit()))
+        QTimer.singleShot(5000, loop.quit)
+        loader.request(key, data, _FS)
+        assert loader.is_pending(key)
+        loop.exec_()
+
+        assert results == [key]
+        assert not loader.is_pending(key)  # released before ready is emitted
+        assert key in differential_bank
+        loader.shutdown()
+
@@ -0,0 +1,73 @@
+import numpy as np
+import unittest
+
+from hdsemg_select.logic.decimation.envelope import EnvelopeCache, m4_decimate
+
+
+class TestM4Decimate(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.signal = rng.standard_normal(100_003)
+
+    def test_short_range_is_returned_unchanged(self):
+        idx, values = m4_decimate(self.signal, n_buckets=100, start=10, end=300)
+        np.testing.assert_array_equal(idx, np.arange(10, 300))
+        np.testing.assert_array_equal(values, self.signal[10:300])
+
+    def test_output_is_bounded(self):
+        idx, values = m4_decimate(self.signal, n_buckets=500)
+        assert len(idx) <= 4 * 501
+        assert len(idx) == len(values)
+
+    def test_keeps_extrema(self):
+        signal = np.zeros(10_000)
+        signal[1234] = 50.0
+        signal[8765] = -50.0
+        _, values = m4_decimate(signal, n_buckets=100)
+        assert values.max() == 50.0
+        assert values.min() == -50.0
+
+    def test_indices_are_time_ordered_and_within_range(self):
+        idx, values = m4_decimate(self.signal, n_buckets=321, start=5000, end=90_000)
+        assert np.all(np.diff(idx) >= 0)
+        assert idx[0] == 5000
+        assert idx[-1] == 89_999
+        np.testing.assert_array_equal(values, self.signal[idx])
+
+    def test_bucket_extrema_match_raw(self):
+        idx, values = m4_decimate(self.signal, n_buckets=50, start=0, end=50_000)
+        bucket = 1000
+        for b in range(50):
+            raw = self.signal[b * bucket:(b + 1) * bucket]
+            chunk = values[4 * b:4 * b + 4]
+            assert chunk.max() == raw.max()
+            assert chunk.min() == raw.min()
+
+    def test_empty_range(self):
+        idx, values = m4_decimate(self.signal, n_buckets=10, start=50, end=50)
+        assert len(idx) == 0 and len(values) == 0
+
+
+class TestEnvelopeCache(unittest.TestCase):
+    def test_hit_returns_same_arrays(self):
+        cache = EnvelopeCache()
+        signal = np.arange(10_000, dtype=float)
+        first = cache.get("ch1", signal, 100)
+        second = cache.get("ch1", signal, 100)
+        assert first[0] is second[0]
+
+    def test_zoom_range_is_separate_entry(self):
+        cache = EnvelopeCache()
+        signal = np.arange(10_000, dtype=float)
+        full_idx, _ = cache.get("ch1", signal, 100)
+        zoom_idx, _ = cache.get("ch1", signal, 100, 1000, 2000)
+        assert full_idx[0] == 0
+        assert zoom_idx[0] == 1000 and zoom_idx[-1] == 1999
+        assert len(cache) == 2
+
+    def test_lru_bound(self):
+        cache = EnvelopeCache(max_entries=3)
+        signal = np.zeros(100)
+        for ch in range(5):
+            cache.get(ch, signal, 10)
+        assert len(cache) == 3
@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+from hdsemg_shared.fileio.file_io import EMGFile
+
+from hdsemg_select.controller.decoded_cache import decoded_cache
+from hdsemg_select.controller.file_loader import LoadCancelled, load_emg_file
+from hdsemg_select.logic.decimation.pyramid import pyramid_cache
+
+
+class TestLoadEmgFile(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.tmp.name, "rec.mat")
+        cls._cache_dir = decoded_cache.directory
+        decoded_cache.directory = os.path.join(cls.tmp.name, "decoded")
+        fs, n_samples, n_emg = 2048.0, 4096, 32
+        rng = np.random.default_rng(0)
+        data = rng.standard_normal((n_samples, n_emg + 1))
+        data[:, n_emg] *= 50  # reference channel, not part of the amplitude maximum
+        desc = np.empty((n_emg + 1, 1), dtype=object)
+        for i in range(n_emg):
+            desc[i, 0] = f"HD10MM0804 [MUSCLE:TA] ch{i + 1}"
+        desc[n_emg, 0] = "Force"
+        t = (np.arange(n_samples) / fs).reshape(-1, 1)
+        EMGFile(data, t, desc, fs, "rec.mat", 0, ".mat", "mV").save(cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        decoded_cache.directory = cls._cache_dir
+        cls.tmp.cleanup()
+        pyramid_cache.clear()
+
+    def test_stages_and_scaling(self):
+        steps = []
+        loaded = load_emg_file(self.path, progress=lambda percent, text: steps.append(percent))
+        assert steps == sorted(steps) and steps[0] == 0 and steps[-1] == 100
+
+        data = loaded.emg_file.data
+        assert np.isclose(loaded.upper_quartile, np.percentile(np.abs(data), 75))
+        assert np.allclose(loaded.scaled_data, data / loaded.upper_quartile)
+        emg_idx = [i for grid in loaded.emg_file.grids for i in grid.emg_indices if i is not None]
+        assert np.isclose(loaded.max_amplitude, np.abs(loaded.scaled_data[:, emg_idx]).max())
+
+    def test_reopen_maps_cached_data(self):
+        first = load_emg_file(self.path)
+        again = load_emg_file(self.path)
+        assert isinstance(again.emg_file.data, np.memmap)
+        assert isinstance(again.scaled_data, np.memmap)
+        assert np.array_equal(again.scaled_data, first.scaled_data)
+        assert again.upper_quartile == first.upper_quartile
+        assert again.max_amplitude == first.max_amplitude
+
+    def test_cancel_between_stages(self):
+        steps = []
+        with self.assertRaises(LoadCancelled):
+            load_emg_file(self.path, progress=lambda percent, text: steps.append(percent),
+                          is_cancelled=lambda: len(steps) >= 2)
+        assert steps == [0, 45]
+
+
+if __name__ == "__main__":
+    unittest.main()
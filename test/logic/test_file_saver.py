@@ -0,0 +1,101 @@
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import scipy.io as sio
+from PyQt5.QtWidgets import QApplication
+
+from hdsemg_select.controller.file_saver import FileSaver, SaveJob, atomic_write, run_save_job
+
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+class TestFileSaver(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        rng = np.random.default_rng(0)
+        self.data = rng.standard_normal((500, 3))
+        self.time = np.arange(500) / 2048.0
+        self.description = np.empty((3, 1), dtype=object)
+        for i in range(3):
+            self.description[i, 0] = np.array([f"ch{i + 1}"])
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _job(self, name: str) -> SaveJob:
+        base = os.path.join(self.tmp.name, name)
+        return SaveJob(f"{base}.mat", f"{base}.json", self.data, self.time, self.description, 2048.0, "mV",
+                       channels=[0, 2], selection={"filename": name})
+
+    def test_atomic_write_keeps_target_on_failure(self):
+        path = os.path.join(self.tmp.name, "out.json")
+        with open(path, "w") as f:
+            f.write("old")
+
+        def fail(tmp):
+            with open(tmp, "w") as f:
+                f.write("partial")
+            raise OSError("disk full")
+
+        with self.assertRaises(OSError):
+            atomic_write(path, fail)
+        with open(path) as f:
+            assert f.read() == "old"
+        assert os.listdir(self.tmp.name) == ["out.json"]
+
+    @unittest.skipIf(os.name == "nt", "POSIX permissions")
+    def test_atomic_write_permissions(self):
+        path = os.path.join(self.tmp.name, "out.json")
+        umask = os.umask(0o022)
+        os.umask(umask)
+        atomic_write(path, lambda tmp: open(tmp, "w").close())
+        assert os.stat(path).st_mode & 0o777 == 0o666 & ~umask
+
+        # an existing file keeps its permissions
+        os.chmod(path, 0o640)
+        atomic_write(path, lambda tmp: open(tmp, "w").close())
+        assert os.stat(path).st_mode & 0o777 == 0o640
+
+    def test_run_save_job_writes_both_files(self):
+        job = self._job("sel")
+        percents = []
+        success, messages = run_save_job(job, percents.append)
+        assert success
+        assert percents[-1] == 100 and percents == sorted(percents)
+        assert np.array_equal(sio.loadmat(job.mat_path)["Data"], self.data[:, [0, 2]])
+        with open(job.json_path) as f:
+            assert json.load(f) == {"filename": "sel"}
+        assert len(messages) == 2
+
+    def test_run_save_job_reports_failure(self):
+        job = self._job("sel")
+        job.mat_path = os.path.join(self.tmp.name, "missing", "sel.mat")
+        success, messages = run_save_job(job)
+        assert not success
+        assert any("Error saving .mat" in m for m in messages)
+        assert os.path.isfile(job.json_path)
+
+    def test_queue_writes_in_order(self):
+        saver = FileSaver()
+        saved = []
+        saver.saved.connect(lambda job, success, messages: saved.append((job.name, success)))
+        for name in ("a", "b", "c"):
+            saver.save(self._job(name))
+        assert saver.pending() == 3
+        saver.wait()
+        assert saved == [("a", True), ("b", True), ("c", True)]
+        assert saver.pending() == 0
+        assert sorted(os.listdir(self.tmp.name)) == ["a.json", "a.mat", "b.json", "b.mat", "c.json", "c.mat"]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import numpy as np
+import unittest
+
+from hdsemg_select.logic.density.interpolation import GridInterpolator, build_interpolation_matrix
+
+
+class TestBuildInterpolationMatrix(unittest.TestCase):
+    def test_shape_and_row_sums(self):
+        mask = np.ones((3, 4), dtype=bool)
+        m = build_interpolation_matrix(mask, upsample=5)
+        assert m.shape == (15 * 20, 12)
+        np.testing.assert_allclose(np.asarray(m.sum(axis=1)).ravel(), 1.0)
+
+    def test_constant_field_is_preserved(self):
+        mask = np.ones((4, 4), dtype=bool)
+        mask[1, 2] = False
+        m = build_interpolation_matrix(mask, upsample=4)
+        out = m @ np.full(16, 3.0)
+        np.testing.assert_allclose(out, 3.0)
+
+    def test_invalid_cells_are_never_read(self):
+        mask = np.array([[True, False], [True, True]])
+        m = build_interpolation_matrix(mask, upsample=3).tocsc()
+        assert m[:, 1].nnz == 0
+
+    def test_linear_ramp_is_reproduced_between_centres(self):
+        mask = np.ones((1, 3), dtype=bool)
+        m = build_interpolation_matrix(mask, upsample=2)
+        out = (m @ np.array([0.0, 1.0, 2.0])).reshape(2, 6)[0]
+        # pixel centres at x = -0.25, 0.25, 0.75, 1.25, 1.75, 2.25 (clamped at edges)
+        np.testing.assert_allclose(out, [0.0, 0.25, 0.75, 1.25, 1.75, 2.0])
+
+    def test_empty_mask(self):
+        m = build_interpolation_matrix(np.zeros((2, 2), dtype=bool), upsample=2)
+        assert m.nnz == 0
+
+
+class TestGridInterpolator(unittest.TestCase):
+    def test_fills_nan_positions(self):
+        grid = np.array([[1.0, np.nan], [1.0, 1.0]])
+        out = GridInterpolator(upsample=4).interpolate(grid)
+        assert out.shape == (8, 8)
+        assert not np.isnan(out).any()
+        np.testing.assert_allclose(out, 1.0)
+
+    def test_deselected_cells_are_excluded(self):
+        grid = np.array([[1.0, 100.0], [1.0, 1.0]])
+        mask = np.array([[True, False], [True, True]])
+        out = GridInterpolator(upsample=4).interpolate(grid, mask)
+        np.testing.assert_allclose(out, 1.0)
+
+    def test_matrix_reused_for_same_mask(self):
+        interp = GridInterpolator(upsample=2)
+        grid = np.ones((3, 3))
+        interp.interpolate(grid)
+        matrix = interp._matrix
+        interp.interpolate(grid * 2)
+        assert interp._matrix is matrix
+
+    def test_all_invalid_gives_nan(self):
+        out = GridInterpolator(upsample=2).interpolate(np.full((2, 2), np.nan))
+        assert np.isnan(out).all()
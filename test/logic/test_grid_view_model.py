@@ -0,0 +1,45 @@
+import unittest
+
+import numpy as np
+
+from hdsemg_select.logic.decimation.pyramid import pyramid_cache
+from hdsemg_select.ui.plot.grid_view_model import GridViewModel, shared_ylim
+
+
+class TestGridViewModel(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        self.data = rng.standard_normal((5000, 6))
+        self.data[100, 2] = 7.5
+        self.model = GridViewModel()
+
+    def tearDown(self):
+        pyramid_cache.clear()
+
+    def test_ylim_matches_full_scan(self):
+        channels = [0, 2, 4]
+        lo, hi = self.data[:, channels].min(), self.data[:, channels].max()
+        buffer = 0.1 * (abs(hi) + abs(lo))
+        ylim = self.model.ylim(self.data, "grid", channels)
+        assert np.allclose(ylim, (lo - buffer, hi + buffer))
+
+    def test_ylim_cached_per_crop(self):
+        first = self.model.ylim(self.data, "grid", [0, 2])
+        assert self.model.ylim(self.data, "grid", [0, 2]) is first
+        cropped = self.model.ylim(self.data[200:400], "grid", [0, 2])
+        assert cropped != first
+
+    def test_nan_only_falls_back(self):
+        assert shared_ylim([np.full(10, np.nan)]) == (-1.2, 1.2)
+
+    def test_reference_is_reused(self):
+        ref = self.model.reference(self.data, 5, 3.0)
+        assert self.model.reference(self.data, 5, 3.0) is ref
+        assert not ref.flags.writeable
+        self.model.clear()
+        assert self.model.reference(self.data, 5, 3.0) is not ref
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import scipy.io as sio
+from hdsemg_shared.fileio.file_io import EMGFile
+
+from hdsemg_select.controller.mat_writer import write_mat
+
+
+class TestWriteMat(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "out.mat")
+        rng = np.random.default_rng(0)
+        self.data = np.asfortranarray(rng.standard_normal((1000, 5)))
+        self.time = np.arange(1000) / 2048.0
+        self.description = np.empty((5, 1), dtype=object)
+        for i in range(4):
+            self.description[i, 0] = np.array([f"HD10MM0202 [MUSCLE:TA] ch{i + 1}"])
+        self.description[4, 0] = np.array(["Kraft (µV)"])
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_matches_savemat_layout(self):
+        write_mat(self.path, self.data, self.time, self.description, 2048.0, "mV")
+        mat = sio.loadmat(self.path)
+        assert np.array_equal(mat["Data"], self.data)
+        assert np.array_equal(mat["Time"].ravel(), self.time)
+        assert mat["Description"].shape == (5, 1)
+        assert mat["Description"][4, 0].item() == "Kraft (µV)"
+        assert mat["SamplingFrequency"][0][0] == 2048.0
+        assert mat["Unit"].item() == "mV"
+
+    def test_crop_and_channel_subset(self):
+        write_mat(self.path, self.data, self.time, self.description, 2048.0, rows=(100, 599), channels=[3, 0, 4])
+        emg = EMGFile.load(self.path)
+        assert np.array_equal(emg.data, self.data[100:600][:, [3, 0, 4]])
+        assert np.array_equal(emg.time, self.time[100:600])
+        assert [d.item() for d in emg.description[:, 0]] == \
+               ["HD10MM0202 [MUSCLE:TA] ch4", "HD10MM0202 [MUSCLE:TA] ch1", "Kraft (µV)"]
+        assert emg.unit is None
+
+    def test_single_precision_is_kept(self):
+        write_mat(self.path, self.data.astype(np.float32), self.time, self.description, 2048.0)
+        data = sio.loadmat(self.path)["Data"]
+        assert data.dtype == np.float32
+        assert np.array_equal(data, self.data.astype(np.float32))
+
+    def test_progress(self):
+        steps = []
+        write_mat(self.path, self.data, self.time, self.description, 2048.0, channels=[0, 1], progress=steps.append)
+        assert steps == [50, 100]
+
+
+if __name__ == "__main__":
+    unittest.main()
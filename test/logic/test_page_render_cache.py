@@ -0,0 +1,127 @@
+import os
+import numpy as np
+import unittest
+from PyQt5.QtCore import QEventLoop, QTimer
+from PyQt5.QtGui import QImage
+from PyQt5.QtWidgets import QApplication
+
+from hdsemg_select.ui.plot.page_render_cache import PageRenderCache, page_render_key, prefetch_pages
+
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+_SIZE = (40, 30)
+
+
+def _key(channels, crop=None, ref=None, ylim=(-1.0, 1.0), file_path="rec.mat", size=_SIZE):
+    return page_render_key(file_path, crop, channels, ref, ylim, size)
+
+
+class TestPageRenderCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.data = np.random.default_rng(2).standard_normal((2000, 8))
+        self.cache = PageRenderCache()
+
+    def tearDown(self):
+        self.cache.shutdown()
+
+    def _jobs(self, channels, ylim=(-1.0, 1.0), reference=None):
+        return [(ch, self.data[:, ch], ylim, _SIZE, reference) for ch in channels]
+
+    def _render(self, requests):
+        """Prefetch *requests* and wait until all of them are in the cache."""
+        loop = QEventLoop()
+        keys = {key for key, _ in requests}
+        self.cache.page_ready.connect(lambda _: keys <= set(self.cache._pages) and loop.quit())
+        QTimer.singleShot(5000, loop.quit)
+        self.cache.prefetch(requests)
+        if not keys <= set(self.cache._pages):
+            loop.exec_()
+
+    def test_hit_and_miss_on_key_changes(self):
+        key = _key([0, 1], crop=(0, 1000), ref="ch7", ylim=(-3.0, 3.0))
+        self._render([(key, self._jobs([0, 1], (-3.0, 3.0), self.data[:, 7]))])
+        pixmap = self.cache.lookup(key, 1)
+        assert pixmap is not None and (pixmap.width(), pixmap.height()) == _SIZE
+        assert self.cache.lookup(_key([0, 1], crop=(0, 1000), ref="ch7", ylim=(-3.0, 3.0)), 0) is not None
+        assert self.cache.lookup(key, 5) is None  # not on this page
+
+        for changed in (
+            _key([4, 5], crop=(0, 1000), ref="ch7", ylim=(-3.0, 3.0)),       # other grid / page
+            _key([0, 1], crop=(200, 1000), ref="ch7", ylim=(-3.0, 3.0)),     # crop
+            _key([0, 1], crop=(0, 1000), ref=None, ylim=(-3.0, 3.0)),        # overlay hidden
+            _key([0, 1], crop=(0, 1000), ref="ch6", ylim=(-3.0, 3.0)),       # other overlay
+            _key([0, 1], crop=(0, 1000), ref="ch7", ylim=(-2.0, 2.0)),       # ylim
+            _key([0, 1], crop=(0, 1000), ref="ch7", ylim=(-3.0, 3.0), size=(41, 30)),
+        ):
+            assert changed != key
+            assert self.cache.lookup(changed, 0) is None
+
+    def test_wanted_set_is_current_page_and_neighbours(self):
+        assert prefetch_pages(3, 8) == [4, 2, 3]
+        assert prefetch_pages(0, 8) == [1, 0]
+        assert prefetch_pages(7, 8) == [6, 7]
+        assert prefetch_pages(0, 1) == [0]
+
+        pages = {page: _key([2 * page, 2 * page + 1]) for page in range(4)}
+        requests = [(pages[p], self._jobs([2 * p, 2 * p + 1])) for p in prefetch_pages(1, 4)]
+        self._render(requests)
+        assert all(self.cache.is_wanted(pages[p]) for p in (0, 1, 2))
+        assert not self.cache.is_wanted(pages[3])
+        assert all(pages[p] in self.cache for p in (0, 1, 2)) and pages[3] not in self.cache
+
+        # Moving on drops the old pages from the wanted set; cached pages stay until evicted
+        self.cache.prefetch([(pages[p], self._jobs([2 * p, 2 * p + 1])) for p in prefetch_pages(3, 4)])
+        assert not self.cache.is_wanted(pages[0]) and self.cache.is_wanted(pages[3])
+        assert pages[0] in self.cache
+
+    def test_unwanted_page_is_skipped(self):
+        stale, current = _key([0]), _key([1])
+        self.cache._wanted = frozenset({current})
+        rendered = []
+        self.cache._worker.page_rendered.connect(lambda key, images: images and rendered.append(key))
+        self.cache._worker.render((stale, self._jobs([0])))
+        self.cache._worker.render((current, self._jobs([1])))
+        assert rendered == [current]
+
+    def test_skipped_page_is_prefetched_again(self):
+        pages = {page: _key([page]) for page in range(4)}
+        # The worker only gets to page 0 after the user has moved on to page 3
+        self.cache._wanted = frozenset({pages[3]})
+        self.cache._pending.add(pages[0])
+        self.cache._worker.render((pages[0], self._jobs([0])))
+        self.app.processEvents()
+        assert pages[0] not in self.cache._pending and pages[0] not in self.cache
+
+        # Coming back renders it
+        self._render([(pages[0], self._jobs([0]))])
+        assert self.cache.lookup(pages[0], 0) is not None
+
+    def test_lru_eviction_under_byte_budget(self):
+        image = QImage(_SIZE[0], _SIZE[1], QImage.Format_RGB32)
+        page_bytes = 2 * _SIZE[0] * _SIZE[1] * 4
+        self.cache.max_bytes = 2 * page_bytes
+        keys = [_key([2 * p, 2 * p + 1]) for p in range(4)]
+
+        for key in keys[:2]:
+            self.cache._on_page_rendered(key, {0: image, 1: image})
+        assert self.cache.nbytes == 2 * page_bytes
+
+        self.cache.lookup(keys[0], 0)  # page 0 becomes the most recently used
+        self.cache._on_page_rendered(keys[2], {0: image, 1: image})
+        assert keys[1] not in self.cache
+        assert keys[0] in self.cache and keys[2] in self.cache
+        assert self.cache.nbytes == 2 * page_bytes
+
+        # A single page larger than the budget is still kept
+        self.cache.max_bytes = page_bytes // 2
+        self.cache._on_page_rendered(keys[3], {0: image, 1: image})
+        assert len(self.cache) == 1 and keys[3] in self.cache
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,18 @@
+import numpy as np
+import unittest
+
+from hdsemg_select.ui.plot.polyline import to_qpolygonf
+
+
+class TestToQPolygonF(unittest.TestCase):
+    def test_points_match_input(self):
+        x = np.linspace(0.0, 10.0, 257)
+        y = np.sin(x)
+        polygon = to_qpolygonf(x, y)
+        assert polygon.size() == 257
+        for i in (0, 100, 256):
+            assert polygon[i].x() == x[i]
+            assert polygon[i].y() == y[i]
+
+    def test_empty_input(self):
+        assert to_qpolygonf(np.empty(0), np.empty(0)).size() == 0
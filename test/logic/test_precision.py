@@ -0,0 +1,97 @@
+import unittest
+
+import numpy as np
+
+from hdsemg_select.config.config_enums import Settings
+from hdsemg_select.config.config_manager import config
+from hdsemg_select.logic.density.arv import compute_arv_window, compute_rms_window
+from hdsemg_select.logic.density.pyramid import AmplitudePyramid
+from hdsemg_select.logic.differential.bank import compute_differential_set
+from hdsemg_select.logic.precision import FLOAT32, FLOAT64, as_working, working_dtype
+from hdsemg_select.select_logic.data_processing import compute_upper_quartile, scale_data, welchPS
+from hdsemg_select.select_logic.fiber_trajectory import FiberTrajectoryAnalyzer
+
+_FS = 2048.0
+_PARAMS = {"n": 4, "low": 20.0, "up": 450.0}
+
+
+class _PrecisionCase(unittest.TestCase):
+    """Runs each computation in float64 and float32 working precision (config is not written to disk)."""
+
+    def setUp(self):
+        self._saved = config.settings.get(Settings.WORKING_PRECISION.name)
+        rng = np.random.default_rng(1)
+        # µV-scale raw EMG as it comes out of the .mat loader
+        self.raw = np.asfortranarray(rng.standard_normal((8192, 16)) * 50e-6)
+
+    def tearDown(self):
+        if self._saved is None:
+            config.settings.pop(Settings.WORKING_PRECISION.name, None)
+        else:
+            config.settings[Settings.WORKING_PRECISION.name] = self._saved
+
+    def _in(self, precision, fn):
+        config.settings[Settings.WORKING_PRECISION.name] = precision
+        return fn()
+
+    def both(self, fn):
+        return self._in(FLOAT64, fn), self._in(FLOAT32, fn)
+
+    def scaled(self):
+        return scale_data(self.raw, compute_upper_quartile(self.raw))
+
+
+class TestWorkingDtype(_PrecisionCase):
+
+    def test_default_and_float32(self):
+        config.settings.pop(Settings.WORKING_PRECISION.name, None)
+        assert working_dtype() == np.float64
+        assert self._in(FLOAT32, working_dtype) == np.float32
+
+    def test_as_working_does_not_copy_matching_arrays(self):
+        data = np.zeros(4, dtype=np.float32)
+        assert self._in(FLOAT32, lambda: as_working(data)) is data
+
+
+class TestFloat32Agreement(_PrecisionCase):
+
+    def test_scaled_data(self):
+        ref, low = self.both(self.scaled)
+        assert ref.dtype == np.float64 and low.dtype == np.float32
+        assert low.flags["F_CONTIGUOUS"]
+        np.testing.assert_allclose(low, ref, rtol=1e-6, atol=1e-6)
+
+    def test_arv_and_rms(self):
+        ref, low = self.both(self.scaled)
+        for fn in (compute_arv_window, compute_rms_window):
+            np.testing.assert_allclose(fn(low, 4000, 512), fn(ref, 4000, 512), rtol=1e-6)
+
+    def test_amplitude_pyramid(self):
+        ref, low = self.both(self.scaled)
+        expected = AmplitudePyramid(ref).arv(4000, 2048)
+        np.testing.assert_allclose(AmplitudePyramid(low).arv(4000, 2048), expected, rtol=1e-6)
+        np.testing.assert_allclose(AmplitudePyramid(low).rms(4000, 2048), AmplitudePyramid(ref).rms(4000, 2048),
+                                   rtol=1e-6)
+
+    def test_differential_signals(self):
+        ref, low = self.both(lambda: compute_differential_set(self.scaled(), ((0, 1, 2, 3),), _FS, _PARAMS, "DD"))
+        assert low.matrices[0].dtype == np.float32
+        scale = np.abs(ref.matrices[0]).max()
+        np.testing.assert_allclose(low.matrices[0], ref.matrices[0], rtol=0, atol=1e-5 * scale)
+
+    def test_spectrum(self):
+        (f_ref, p_ref), (f_low, p_low) = self.both(lambda: welchPS(self.scaled()[:, 0], _FS))
+        np.testing.assert_allclose(f_low, f_ref)
+        np.testing.assert_allclose(p_low, p_ref, rtol=0, atol=1e-5 * p_ref.max())
+
+    def test_fiber_trajectory(self):
+        from test.logic.test_fiber_trajectory import FakeGrid, _make_propagating_wave, _simple_display_grid
+        signals = _make_propagating_wave(8, 8, 20.0, 4.0, fs=_FS, ied_mm=10.0).astype(np.float64)
+        grid, display_grid = FakeGrid(8, 8, ied_mm=10.0), _simple_display_grid(8, 8)
+        ref, low = self.both(lambda: FiberTrajectoryAnalyzer().analyze(signals, grid, display_grid, fs=_FS))
+        assert abs(low.fiber_angle_deg - ref.fiber_angle_deg) <= 1.0
+        assert np.isclose(low.conduction_velocity_ms, ref.conduction_velocity_ms, rtol=1e-3)
+
+
+if __name__ == "__main__":
+    unittest.main()
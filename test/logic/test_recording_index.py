@@ -0,0 +1,134 @@
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+from hdsemg_shared.fileio.file_io import EMGFile
+from hdsemg_shared.fileio.matlab_file_io import MatFileIO
+from PyQt5.QtCore import QEventLoop, QTimer
+from PyQt5.QtWidgets import QApplication
+
+from hdsemg_select.controller.recording_index import RecordingIndex, RecordingIndexer, read_metadata
+from hdsemg_select.controller.rms_loader import RMSLoader
+
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+class TestRecordingIndex(unittest.TestCase):
+
+    def setUp(self):
+        if EMGFile._grid_cache is None:
+            EMGFile._grid_cache = []  # do not fetch the product catalog
+        self.tmp = tempfile.TemporaryDirectory()
+        self.study = os.path.join(self.tmp.name, "study")
+        self.index = RecordingIndex(os.path.join(self.tmp.name, "index.sqlite"))
+        self.first = self._write_recording(os.path.join("S01", "ramp.mat"), "[MUSCLE:Tibialis]")
+        self.second = self._write_recording(os.path.join("S02", "ramp.mat"), "")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write_recording(self, relative: str, muscle: str) -> str:
+        path = os.path.join(self.study, relative)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        description = np.empty((5, 1), dtype=object)
+        for i in range(4):
+            description[i, 0] = np.array([f"HD10MM0202 {muscle} ch{i + 1}"])
+        description[4, 0] = np.array(["Force"])
+        # stored channels x samples, as some exports do
+        MatFileIO.save(path, np.zeros((5, 3000)), np.arange(3000) / 2000.0, description, 2000.0)
+        return path
+
+    def _touch(self, path: str):
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_read_metadata(self):
+        info = read_metadata(self.first)
+        assert info.error is None
+        assert (info.channel_count, info.sample_count) == (5, 3000)
+        assert info.sampling_frequency == 2000.0 and info.duration_s == 1.5
+        assert info.grid_summary == "10mm_2x2 (Tibialis)"
+        assert info.grids[0]["channels"] == 4
+        assert info.selection_file is None and info.rms_file is None
+
+    def test_scan_is_incremental(self):
+        summary = self.index.scan(self.study)
+        assert (summary.indexed, summary.unchanged, summary.removed) == (2, 0, 0)
+        assert [i.path for i in self.index.search(self.study)] == [self.first, self.second]
+
+        # sidecars are picked up without reading the recording again
+        with open(os.path.splitext(self.first)[0] + ".json", "w") as f:
+            json.dump({}, f)
+        with open(RMSLoader.get_rms_file_path(self.second), "w") as f:
+            json.dump({"grids": {}}, f)
+        summary = self.index.scan(self.study)
+        assert (summary.indexed, summary.unchanged) == (0, 2)
+        assert self.index.get(self.first).selection_file.endswith(os.path.join("S01", "ramp.json"))
+        assert self.index.get(self.second).rms_file is not None
+
+        self._touch(self.second)
+        os.remove(self.first)
+        summary = self.index.scan(self.study)
+        assert (summary.indexed, summary.unchanged, summary.removed) == (1, 0, 1)
+        assert self.index.get(self.first) is None
+
+    def test_search(self):
+        self.index.scan(self.study)
+        assert [i.path for i in self.index.search(self.study, "tibialis")] == [self.first]
+        assert [i.path for i in self.index.search(self.study, "s02 10MM_2x2")] == [self.second]
+        assert self.index.search(self.study, "ramp 8mm") == []
+        assert self.index.search(os.path.join(self.study, "S01"), "s02") == []
+        # the folder name of the study itself is not part of the match
+        assert self.index.search(self.study, "study") == []
+
+    def test_unreadable_file_is_recorded(self):
+        broken = os.path.join(self.study, "broken.mat")
+        with open(broken, "wb") as f:
+            f.write(b"not a mat file")
+        summary = self.index.scan(self.study)
+        assert summary.failed == 1
+        assert self.index.get(broken).error
+        assert self.index.scan(self.study).indexed == 0  # not retried until it changes
+
+    def test_cancelled_scan_removes_nothing(self):
+        self.index.scan(self.study)
+        os.remove(self.second)
+        summary = self.index.scan(self.study, is_cancelled=lambda: True)
+        assert summary.cancelled
+        assert self.index.get(self.second) is not None
+
+    def test_indexer_joins_superseded_scans(self):
+        app = QApplication.instance() or QApplication([])
+        indexer = RecordingIndexer(self.index)
+        results = []
+        loop = QEventLoop()
+        indexer.scanned.connect(lambda summary: (results.append(summary), loop.quit()))
+        QTimer.singleShot(5000, loop.quit)
+
+        indexer.scan(self.study)
+        first = indexer._thread
+        indexer.scan(self.study)  # supersedes the first scan
+        assert [t for t, _ in indexer._superseded] == [first]
+        loop.exec_()
+        assert len(results) == 1 and not indexer.is_running()
+
+        deadline = QTimer()
+        deadline.setSingleShot(True)
+        deadline.start(5000)
+        while indexer._superseded and deadline.isActive():
+            app.processEvents()
+        assert indexer._superseded == []  # joined as soon as it reported
+
+        indexer.scan(self.study)
+        indexer.scan(self.study)
+        threads = [indexer._thread] + [t for t, _ in indexer._superseded]
+        indexer.shutdown()
+        assert indexer._superseded == [] and not indexer.is_running()
+        assert not any(t.isRunning() for t in threads)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from hdsemg_select.controller.rms_loader import RMSLoader, RMSSidecar, normalize_grid_key
+from hdsemg_select.ui.labels.base_labels import BaseChannelLabel
+
+
+class TestRMSLoader(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.data_path = os.path.join(self.tmp.name, "rec.mat")
+        self._write({"8mm_5x13": {"0": {"rms_label": "excellent", "rms_quality": "3.10 µV"},
+                                  "1": {"rms_label": "ok", "rms_quality": "12.00 µV"}},
+                     "10mm_8x8": {"0": {"rms_label": "good", "rms_quality": "5.00 µV"}}})
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, grids: dict):
+        with open(RMSLoader.get_rms_file_path(self.data_path), "w", encoding="utf-8") as f:
+            json.dump({"grids": grids}, f)
+
+    def test_normalize_grid_key(self):
+        assert normalize_grid_key("8mm_5x13") == (8, 5, 13, 1)
+        assert normalize_grid_key(" 8MM_5x13_2 ") == (8, 5, 13, 2)
+        assert normalize_grid_key("HD08MM1305") == (8, 13, 5, 1)
+        assert normalize_grid_key("GR08MM1305") == (8, 13, 5, 1)
+        assert normalize_grid_key("gr04mm1305_2") == (4, 13, 5, 2)
+        assert normalize_grid_key("GR10MM0808") == (10, 8, 8, 1)
+        assert normalize_grid_key("Force") is None
+
+    def test_parse_and_labels(self):
+        sidecar = RMSLoader.load_rms_file(self.data_path)
+        assert isinstance(sidecar, RMSSidecar)
+        assert sidecar["8mm_5x13"][0].get_base_label() == BaseChannelLabel.RMS_EXCELLENT.value
+        assert sidecar["8mm_5x13"][1].rms_quality == "12.00 µV"
+
+    def test_tolerant_matching(self):
+        sidecar = RMSLoader.load_rms_file(self.data_path)
+        assert RMSLoader.find_matching_grid(sidecar, "8MM_5X13") is sidecar["8mm_5x13"]
+        assert RMSLoader.find_matching_grid(sidecar, "HD08MM1305") is sidecar["8mm_5x13"]
+        assert RMSLoader.find_matching_grid(sidecar, "HD10MM0808") is sidecar["10mm_8x8"]
+        assert RMSLoader.find_matching_grid(sidecar, "GR08MM1305") is sidecar["8mm_5x13"]
+        assert RMSLoader.find_matching_grid(sidecar, "GR10MM0808") is sidecar["10mm_8x8"]
+        assert RMSLoader.find_matching_grid(sidecar, "8mm_5x13_2") is None
+        assert RMSLoader.find_matching_grid(sidecar, "4mm_8x8") is None
+        assert RMSLoader.match_grid_key("8mm_5x13", "HD08MM1305")
+        # plain dicts are still accepted
+        assert RMSLoader.find_matching_grid(dict(sidecar), "HD08MM1305") is sidecar["8mm_5x13"]
+
+    def test_same_orientation_wins(self):
+        sidecar = RMSSidecar({"8mm_5x13": {}, "8mm_13x5": {}})
+        assert sidecar.find_key("HD08MM1305") == "8mm_13x5"
+        assert sidecar.find_key("HD08MM0513") == "8mm_5x13"
+        assert sidecar.find_key("GR08MM1305") == "8mm_13x5"
+        assert sidecar.find_key("8 mm 13x5") == "8mm_13x5"
+
+    def test_cached_until_modified(self):
+        first = RMSLoader.load_rms_file(self.data_path)
+        assert RMSLoader.load_rms_file(self.data_path) is first
+
+        self._write({"4mm_8x8": {"0": {"rms_label": "good", "rms_quality": "1.00 µV"}}})
+        rms_path = RMSLoader.get_rms_file_path(self.data_path)
+        stat = os.stat(rms_path)
+        os.utime(rms_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        second = RMSLoader.load_rms_file(self.data_path)
+        assert second is not first
+        assert list(second) == ["4mm_8x8"]
+
+    def test_missing_file(self):
+        assert RMSLoader.load_rms_file(os.path.join(self.tmp.name, "other.mat")) is None
+
+    def test_file_removed_after_check(self):
+        # the sidecar disappears between the isfile check and the stat
+        with mock.patch("os.path.isfile", return_value=True):
+            assert RMSLoader.load_rms_file(os.path.join(self.tmp.name, "other.mat")) is None
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,216 @@
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+from hdsemg_shared.fileio.file_io import EMGFile, Grid
+
+from hdsemg_select.controller.file_management import build_selection_json, save_selection
+from hdsemg_select.controller.file_saver import run_save_job
+from hdsemg_select.controller.selection_io import (
+    FORMAT_COLUMNAR, FORMAT_JSON, FORMAT_NPZ, SavedSelection, apply_selection, build_columnar_selection,
+    find_recording, is_exported_recording, layout_association, read_selection, write_selection
+)
+from hdsemg_select.state.enum.layout_mode_enums import FiberMode, LayoutMode
+from hdsemg_select.state.state import global_state
+
+ECG = {"id": 1, "name": "ECG", "color": "#ff0000"}
+NOISE = {"id": 2, "name": "Noise 50 Hz", "color": "#ffff00"}
+
+
+class TestSelectionIO(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.description = np.empty((5, 1), dtype=object)
+        for i in range(4):
+            self.description[i, 0] = np.array([f"HD10MM0202 ch{i + 1}"])
+        self.description[4, 0] = np.array(["Force"])
+        self.grids = [Grid([0, 1, 2, 3], [4], 2, 2, 10, 4, "10mm_2x2")]
+        self.status = [True, False, True, True, False]
+        self.labels = {1: [ECG, NOISE], 4: [NOISE]}
+        global_state.reset()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+        global_state.reset()
+
+    def _columnar(self):
+        return build_columnar_selection("rec.mat", self.grids, self.status, self.description, self.labels,
+                                        layout_association(global_state), "/data/rec.mat", (2, 7))
+
+    def _assert_selection(self, selection: SavedSelection):
+        assert selection.file_name == "rec.mat"
+        assert selection.channel_status == self.status
+        assert selection.channel_labels == {1: ["ECG", "Noise 50 Hz"], 4: ["Noise 50 Hz"]}
+        assert selection.descriptions[4] == "Force"
+        assert selection.source_file == "/data/rec.mat"
+        assert selection.crop_range == (2, 7)
+
+    def test_columnar_schema(self):
+        selection = self._columnar()
+        assert selection["label_names"] == ["ECG", "Noise 50 Hz"]
+        assert selection["label_offsets"] == [0, 0, 2, 2, 2, 3]
+        assert selection["label_ids"] == [0, 1, 1]
+        assert selection["grids"][0]["channel_indices"] == [0, 1, 2, 3]
+        assert selection["grids"][0]["reference_indices"] == [4]
+
+    def test_roundtrip_columnar_json_and_npz(self):
+        for fmt, name in ((FORMAT_COLUMNAR, "sel.json"), (FORMAT_NPZ, "sel.npz")):
+            path = os.path.join(self.tmp.name, name)
+            write_selection(path, self._columnar(), fmt)
+            self._assert_selection(read_selection(path))
+
+    def test_reads_nested_json(self):
+        path = os.path.join(self.tmp.name, "sel.json")
+        nested = build_selection_json("rec.mat", self.grids, self.status, self.description, self.labels,
+                                      source_file="/data/rec.mat", crop_range=(2, 7))
+        write_selection(path, nested, FORMAT_JSON)
+        self._assert_selection(read_selection(path))
+        # grid entries and the summary describe the channels identically
+        with open(path) as f:
+            content = json.load(f)
+        assert content["grids"][0]["channels"][1] == content["total_channels_summary"][1]
+        assert content["grids"][0]["reference_signals"][0]["name"] == "Force"
+
+    def test_rejects_other_json(self):
+        path = os.path.join(self.tmp.name, "other.json")
+        with open(path, "w") as f:
+            json.dump({"foo": 1}, f)
+        with self.assertRaises(ValueError):
+            read_selection(path)
+
+    def test_apply_to_state(self):
+        emg = EMGFile(np.zeros((10, 5)), np.arange(10).reshape(-1, 1), self.description, 1000.0, "rec.mat", 0, ".mat")
+        global_state.set_emg_file(emg)
+        global_state.set_channel_status([False] * 5)
+        global_state.update_channel_labels(0, [ECG])
+        global_state.set_fiber_layout(FiberMode.PARALLEL, LayoutMode.COLUMNS)
+        path = os.path.join(self.tmp.name, "sel.json")
+        write_selection(path, self._columnar(), FORMAT_COLUMNAR)
+        global_state.set_fiber_layout(FiberMode.PARALLEL, LayoutMode.ROWS)
+
+        changes = []
+        global_state.labels_changed.connect(changes.append)
+        apply_selection(read_selection(path), global_state, [ECG, NOISE])
+        global_state.labels_changed.disconnect(changes.append)
+
+        assert global_state.get_channel_status() == self.status
+        assert global_state.get_channel_labels() == {1: [ECG, NOISE], 4: [NOISE]}
+        assert changes == [frozenset({0, 1, 4})]
+        assert global_state.get_layout_for_fiber(FiberMode.PARALLEL) == LayoutMode.COLUMNS
+        assert global_state.get_crop_range() == (2, 7)
+
+    def test_apply_ignores_crop_outside_data(self):
+        emg = EMGFile(np.zeros((5, 5)), np.arange(5).reshape(-1, 1), self.description, 1000.0, "rec.mat", 0, ".mat")
+        global_state.set_emg_file(emg)
+        global_state.set_channel_status([False] * 5)
+        apply_selection(SavedSelection("rec.mat", self.status, crop_range=(2, 7)), global_state, [])
+        assert global_state.get_crop_range() is None
+        assert global_state.get_channel_status() == self.status
+
+    def test_apply_restores_unknown_label(self):
+        emg = EMGFile(np.zeros((10, 5)), np.arange(10).reshape(-1, 1), self.description, 1000.0, "rec.mat", 0, ".mat")
+        global_state.set_emg_file(emg)
+        global_state.set_channel_status([False] * 5)
+        selection = SavedSelection("rec.mat", self.status, channel_labels={1: ["ECG", "Deleted flag"]})
+        apply_selection(selection, global_state, [ECG, NOISE])
+
+        ecg, unknown = global_state.get_channel_labels()[1]
+        assert ecg == ECG
+        assert unknown["name"] == "Deleted flag" and unknown["color"]
+        assert unknown["id"] not in (ECG["id"], NOISE["id"])
+
+        # the id is stable, so restoring again changes nothing
+        changes = []
+        global_state.labels_changed.connect(changes.append)
+        apply_selection(selection, global_state, [ECG, NOISE])
+        global_state.labels_changed.disconnect(changes.append)
+        assert changes == []
+
+    def test_find_recording(self):
+        selection_path = os.path.join(self.tmp.name, "out", "sel.json")
+        os.makedirs(os.path.dirname(selection_path))
+        recording = os.path.join(self.tmp.name, "rec.mat")
+        open(recording, "w").close()
+        assert find_recording(SavedSelection("rec.mat", [], source_file=recording), selection_path) == recording
+
+        # moved study folder: fall back to the original name next to the selection
+        moved = os.path.join(self.tmp.name, "out", "rec.mat")
+        open(moved, "w").close()
+        selection = SavedSelection("rec.mat", [], source_file="/gone/rec.mat")
+        assert find_recording(selection, selection_path) == moved
+        assert find_recording(SavedSelection("other.mat", []), selection_path) is None
+
+        assert is_exported_recording(os.path.join(self.tmp.name, "out", "sel.mat"), selection_path)
+        assert not is_exported_recording(recording, selection_path)
+
+    def test_roundtrip_selected_only_save(self):
+        if EMGFile._grid_cache is None:
+            EMGFile._grid_cache = []  # do not fetch the product catalog
+        data = np.arange(50, dtype=float).reshape(10, 5)
+        emg = EMGFile(data, np.arange(10).reshape(-1, 1) / 1000.0, self.description, 1000.0, "rec.mat", 0, ".mat")
+        global_state.set_emg_file(emg)
+        global_state.set_file_path(os.path.join(self.tmp.name, "rec.mat"))
+
+        class _Saver:
+            def save(self, job):
+                self.job = job
+
+        saver = _Saver()
+        output = os.path.join(self.tmp.name, "out", "sel.mat")
+        assert save_selection(None, output, emg, self.status, self.labels, selected_only=True, saver=saver)
+        success, _ = run_save_job(saver.job)
+        assert success
+
+        selection = read_selection(os.path.join(self.tmp.name, "out", "sel.json"))
+        assert selection.exported_channels == [0, 2, 3]
+        exported = EMGFile.load(output)
+        assert exported.data.shape == (10, 3)
+        assert np.array_equal(exported.data, data[:, [0, 2, 3]])
+
+        # Resuming on the exported .mat maps its channels back to the saved ones
+        global_state.reset()
+        global_state.set_emg_file(exported)
+        global_state.set_channel_status([False] * 3)
+        global_state.update_channel_labels(1, [ECG])
+        apply_selection(selection, global_state, [ECG, NOISE], restore_crop=False)
+        assert global_state.get_channel_status() == [True, True, True]
+        assert global_state.get_channel_labels() == {}
+
+        # ... and on the original recording as before
+        global_state.reset()
+        global_state.set_emg_file(emg)
+        global_state.set_channel_status([False] * 5)
+        apply_selection(selection, global_state, [ECG, NOISE], restore_crop=False)
+        assert global_state.get_channel_status() == self.status
+        assert global_state.get_channel_labels() == {1: [ECG, NOISE], 4: [NOISE]}
+
+    def test_columnar_records_exported_channels(self):
+        selection = build_columnar_selection("rec.mat", self.grids, self.status, self.description, self.labels,
+                                             layout_association(global_state), exported_channels=[1, 4])
+        path = os.path.join(self.tmp.name, "sel.npz")
+        write_selection(path, selection, FORMAT_NPZ)
+        saved = read_selection(path)
+        assert saved.exported_channels == [1, 4]
+        assert saved.channel_map(2) == [1, 4] and saved.channel_map(5) == list(range(5))
+
+        emg = EMGFile(np.zeros((10, 2)), np.arange(10).reshape(-1, 1), self.description[[1, 4]], 1000.0,
+                      "sel.mat", 0, ".mat")
+        global_state.set_emg_file(emg)
+        global_state.set_channel_status([True, True])
+        apply_selection(saved, global_state, [ECG, NOISE])
+        assert global_state.get_channel_status() == [False, False]
+        assert global_state.get_channel_labels() == {0: [ECG, NOISE], 1: [NOISE]}
+        with self.assertRaises(ValueError):
+            saved.channel_map(3)
+
+    def test_apply_rejects_channel_mismatch(self):
+        global_state.set_channel_status([False] * 3)
+        with self.assertRaises(ValueError):
+            apply_selection(SavedSelection("rec.mat", self.status), global_state, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
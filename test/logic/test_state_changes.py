@@ -0,0 +1,107 @@
+import unittest
+
+import numpy as np
+from hdsemg_shared.fileio.file_io import EMGFile
+
+from hdsemg_select.state.state import global_state
+
+
+class TestChannelStatusChanges(unittest.TestCase):
+
+    def setUp(self):
+        global_state.reset()
+        global_state.set_channel_status([False] * 6)
+        self.events = []
+        global_state.channel_status_changed.connect(self.events.append)
+
+    def tearDown(self):
+        global_state.channel_status_changed.disconnect(self.events.append)
+        global_state.reset()
+
+    def test_in_place_mutation_is_diffed(self):
+        status = global_state.get_channel_status()
+        status[1] = True
+        status[4] = True
+        global_state.set_channel_status(status)
+        assert self.events == [frozenset({1, 4})]
+
+    def test_unchanged_status_emits_nothing(self):
+        global_state.set_channel_status([False] * 6)
+        global_state.set_channel_selected(2, False)
+        assert self.events == []
+
+    def test_single_channel(self):
+        global_state.set_channel_selected(3, True)
+        global_state.set_channel_selected(3, True)
+        assert self.events == [frozenset({3})]
+        assert global_state.get_channel_status(3) is True
+
+    def test_out_of_bounds_is_ignored(self):
+        global_state.set_channel_selected(10, True)
+        assert self.events == []
+
+    def test_length_change_marks_new_channels(self):
+        global_state.set_channel_status([False] * 8)
+        assert self.events == [frozenset({6, 7})]
+
+
+class TestStateBatch(unittest.TestCase):
+
+    def setUp(self):
+        global_state.reset()
+        global_state.set_emg_file(EMGFile(np.zeros((10, 6)), np.arange(10), [], 2000, "test.mat", 0, "mat"))
+        global_state.set_channel_status([False] * 6)
+        self.status_events, self.label_events, self.per_channel = [], [], []
+        global_state.channel_status_changed.connect(self.status_events.append)
+        global_state.labels_changed.connect(self.label_events.append)
+        global_state.channel_labels_changed.connect(self._on_channel_labels)
+
+    def tearDown(self):
+        global_state.channel_status_changed.disconnect(self.status_events.append)
+        global_state.labels_changed.disconnect(self.label_events.append)
+        global_state.channel_labels_changed.disconnect(self._on_channel_labels)
+        global_state.reset()
+
+    def _on_channel_labels(self, idx, labels):
+        self.per_channel.append(idx)
+
+    def test_batch_emits_once(self):
+        bad = {"id": "bad", "name": "Bad"}
+        with global_state.batch():
+            for idx in (0, 2, 5):
+                global_state.update_channel_labels(idx, [bad])
+                global_state.set_channel_selected(idx, True)
+            assert self.status_events == [] and self.label_events == []
+        assert self.status_events == [frozenset({0, 2, 5})]
+        assert self.label_events == [frozenset({0, 2, 5})]
+        assert self.per_channel == []
+        assert global_state.get_channel_labels(2) == [bad]
+
+    def test_nested_batches_flush_at_outermost(self):
+        with global_state.batch():
+            with global_state.batch():
+                global_state.set_channel_selected(1, True)
+            assert self.status_events == []
+            global_state.set_channel_selected(3, True)
+        assert self.status_events == [frozenset({1, 3})]
+
+    def test_empty_batch_emits_nothing(self):
+        with global_state.batch():
+            global_state.set_channel_selected(1, False)
+        assert self.status_events == [] and self.label_events == []
+
+    def test_batch_flushes_on_error(self):
+        with self.assertRaises(RuntimeError):
+            with global_state.batch():
+                global_state.set_channel_selected(4, True)
+                raise RuntimeError("boom")
+        assert self.status_events == [frozenset({4})]
+
+    def test_unbatched_label_update(self):
+        global_state.update_channel_labels(3, [{"id": "x", "name": "X"}])
+        assert self.per_channel == [3]
+        assert self.label_events == [frozenset({3})]
+
+
+if __name__ == "__main__":
+    unittest.main()
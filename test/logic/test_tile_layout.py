@@ -0,0 +1,55 @@
+import unittest
+from types import SimpleNamespace
+
+from hdsemg_select.controller.grid_setup_handler import GridSetupHandler
+from hdsemg_select.state.enum.layout_mode_enums import LayoutMode
+from hdsemg_select.ui.electrode_layout import get_display_grid
+from hdsemg_select.ui.plot.channel_scroll_view import TileLayout, grid_tile_sections
+
+
+class TestTileLayout(unittest.TestCase):
+    def setUp(self):
+        # Two sections (64 and 30 channels), 4 columns of 250 px, 100 px tiles, 20 px headers
+        self.layout = TileLayout([64, 30], width=1000, min_tile_width=250, tile_height=100, header_height=20)
+
+    def test_rows_and_height(self):
+        assert self.layout.columns == 4
+        assert len(self.layout.rows) == 1 + 16 + 1 + 8
+        assert self.layout.total_height == 2 * 20 + 24 * 100
+
+    def test_rows_in_viewport(self):
+        rows = self.layout.rows_in(0, 250)
+        assert list(rows) == [0, 1, 2, 3]
+        # Second header starts after the 16 tile rows of the first section
+        second_header = 20 + 16 * 100
+        rows = self.layout.rows_in(second_header, second_header + 1)
+        assert self.layout.rows[rows.start] == (1, -1)
+
+    def test_last_row_is_partial(self):
+        items = self.layout.row_items(len(self.layout.rows) - 1)
+        assert [item for _, item, _ in items] == [28, 29]
+
+    def test_hit_test(self):
+        section, item, rect = self.layout.hit_test(260, 20 + 100 + 5)
+        assert (section, item) == (0, 5)
+        assert rect.left() == 250 and rect.top() == 120
+        assert self.layout.hit_test(10, 5) is None  # header row
+        assert self.layout.hit_test(600, self.layout.total_height - 10) is None  # empty slot
+
+
+class TestGridTileSections(unittest.TestCase):
+    def test_labels_match_electrode_numbers(self):
+        # Data columns in reverse so electrode numbers and column indices differ
+        emg_indices = list(range(100, 36, -1))
+        grids = [SimpleNamespace(grid_key="8mm_13x5", emg_indices=emg_indices),
+                 SimpleNamespace(grid_key="empty", emg_indices=[])]
+        sections = grid_tile_sections(grids)
+        assert [s.title for s in sections] == ["Grid: 8mm_13x5"]
+        assert sections[0].channels == emg_indices
+
+        handler = GridSetupHandler()
+        handler.rows, handler.cols = 13, 5
+        handler._apply_with_layout(emg_indices, get_display_grid("GR08MM1305", 13, 5), LayoutMode.ROWS)
+        assert sections[0].labels == [str(handler.get_electrode_number(ch)) for ch in emg_indices]
+        handler._apply_fallback(emg_indices, LayoutMode.COLUMNS)
+        assert sections[0].labels == [str(handler.get_electrode_number(ch)) for ch in emg_indices]